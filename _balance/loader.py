@@ -5,6 +5,7 @@ from typing import Any, Dict, Mapping
 import json
 
 from jeuxRPG._class.res.character import table_stat_subclass as tables
+from jeuxRPG._class.res.class_table import patch_class_table
 from jeuxRPG._class.skills.skill import Skill
 from jeuxRPG._class.skills.skillEffect import SkillEffect
 
@@ -33,14 +34,6 @@ def _read_json(maybe_path: str | Path | Mapping[str, Any]) -> Dict[str, Any]:
         raise TypeError("Expected file path or mapping for overrides")
 
 
-def _deep_update_dict(target: Dict[str, Any], patch: Dict[str, Any]) -> None:
-    for k, v in patch.items():
-        if isinstance(v, dict) and isinstance(target.get(k), dict):
-            _deep_update_dict(target[k], v)
-        else:
-            target[k] = v
-
-
 def apply_class_overrides(overrides: str | Path | Mapping[str, Any]) -> Dict[str, Any]:
     data = _read_json(overrides)
     applied: Dict[str, Any] = {}
@@ -49,7 +42,7 @@ def apply_class_overrides(overrides: str | Path | Mapping[str, Any]) -> Dict[str
         if not isinstance(table, dict):
             continue
         if isinstance(patch, dict):
-            _deep_update_dict(table, patch)
+            patch_class_table(table, patch)
             applied[class_name] = True
     return applied
 
@@ -0,0 +1,218 @@
+"""Offline self-play trainer for the tabular mob policy.
+
+Tower-like fights (a small hero party against tower mobs) are simulated with
+the mobs playing an epsilon-greedy version of the current table. Every
+(state, action class) visited by a mob is credited with the final outcome of
+its fight from the mob side (Monte-Carlo control). After each generation the
+table keeps, per state, the action class with the best mean outcome; states
+visited less than `min_visits` times keep the greedy turn.
+
+Episodes run in parallel worker processes and only return count arrays, so
+the per-episode cost is pure combat logic.
+
+Usage:
+    python -m jeuxRPG._balance.selfplay --episodes 2000 --generations 4 --workers 4 \\
+        --out .data/balance/mob_policy.npy
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class._event.confrontation.encounter.mcts import evaluate
+from jeuxRPG._class._event.confrontation.encounter.policy import FightAction, FightPolicy
+from jeuxRPG._class._event.confrontation.encounter.table_policy import (
+    ACTION_CLASSES,
+    TABLE_SHAPE,
+    TablePolicy,
+    encode_state,
+    resolve_action,
+)
+from jeuxRPG._class.character import Character
+from jeuxRPG.game_engine import GameEngine
+from jeuxRPG.game_engine.tower import TowerRun
+
+
+HERO_CLASSES = ("Knight", "Priest", "Mage", "Archer", "Necromancien")
+COUNTS_SHAPE = TABLE_SHAPE + (len(ACTION_CLASSES),)
+
+
+class _ExploringPolicy(FightPolicy):
+    """Epsilon-greedy table policy remembering the (state, action) it visits."""
+
+    def __init__(self, table: np.ndarray, epsilon: float, rng: random.Random) -> None:
+        self.table = table
+        self.epsilon = epsilon
+        self.rng = rng
+        self.visits: List[Tuple[Character, Tuple[int, ...]]] = []
+
+    def choose(self, fight: Fight, actor: Character) -> FightAction | None:
+        state = encode_state(fight, actor)
+        if self.rng.random() < self.epsilon:
+            action_class = self.rng.randrange(len(ACTION_CLASSES))
+        else:
+            action_class = int(self.table[state])
+        self.visits.append((actor, state + (action_class,)))
+        return resolve_action(fight, actor, action_class)
+
+
+def _make_episode(rng: random.Random, floors: Tuple[int, int]) -> Tuple[List[Character], List[Character]]:
+    """Build a hero party and tower mobs of a random floor."""
+    floor = rng.randint(*floors)
+    tower = TowerRun(GameEngine())
+    heroes = []
+    for i in range(rng.randint(1, 3)):
+        cls = rng.choice(HERO_CLASSES)
+        hero = Character.create(cls, user_id=f"selfplay_h{i}", name=f"{cls} {i}")
+        xp = tower._xp_for_level(max(1, floor + rng.randint(-2, 2)))
+        if xp > 0:
+            hero.gain_exp(xp)
+        heroes.append(hero)
+    mobs = [tower._make_mob(floor, i) for i in range(rng.randint(1, 3))]
+    return heroes, mobs
+
+
+def play_episodes(
+    table: np.ndarray,
+    seeds: Sequence[int],
+    epsilon: float = 0.2,
+    floors: Tuple[int, int] = (1, 20),
+    max_rounds: int = 60,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Play one self-play fight per seed.
+
+    Returns:
+        (outcome sums, visit counts), both of shape TABLE_SHAPE + (actions,)
+    """
+    sums = np.zeros(COUNTS_SHAPE, dtype=np.float64)
+    counts = np.zeros(COUNTS_SHAPE, dtype=np.int64)
+    for seed in seeds:
+        rng = random.Random(seed)
+        random.seed(seed)
+        heroes, mobs = _make_episode(rng, floors)
+        fight = Fight(heroes, mobs, name=f"selfplay-{seed}", seed=seed)
+        policy = _ExploringPolicy(table, epsilon, rng)
+        fight.set_policy(mobs, policy)
+
+        rounds = 0
+        while not fight.is_over() and rounds < max_rounds:
+            fight.start_round()
+            rounds += 1
+
+        for actor, index in policy.visits:
+            sums[index] += evaluate(fight, actor)
+            counts[index] += 1
+    return sums, counts
+
+
+def _play_batch(args: Tuple[np.ndarray, List[int], float, Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray]:
+    table, seeds, epsilon, floors = args
+    return play_episodes(table, seeds, epsilon, floors)
+
+
+def table_from_counts(sums: np.ndarray, counts: np.ndarray, min_visits: int = 5) -> np.ndarray:
+    """Pick the best mean action class of every state (greedy below `min_visits`)."""
+    means = np.where(counts >= min_visits, sums / np.maximum(counts, 1), -1.0)
+    table = np.argmax(means, axis=-1).astype(np.int8)
+    table[means.max(axis=-1) < 0] = 0
+    return table
+
+
+def train_policy(
+    episodes: int = 2000,
+    generations: int = 4,
+    workers: int = 0,
+    epsilon: float = 0.2,
+    floors: Tuple[int, int] = (1, 20),
+    seed: int = 0,
+    min_visits: int = 5,
+) -> TablePolicy:
+    """
+    Learn a mob policy table by self-play.
+
+    Args:
+        episodes: Fights per generation
+        generations: Number of policy improvement steps
+        workers: Worker processes (0 plays in the current process)
+        epsilon: Exploration rate of the mobs
+        floors: Range of tower floors the fights are drawn from
+        seed: Base seed, making the training reproducible
+        min_visits: Visits required before a state leaves the greedy turn
+
+    Returns:
+        Trained TablePolicy
+    """
+    table = np.zeros(TABLE_SHAPE, dtype=np.int8)
+    sums = np.zeros(COUNTS_SHAPE, dtype=np.float64)
+    counts = np.zeros(COUNTS_SHAPE, dtype=np.int64)
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    try:
+        for generation in range(generations):
+            base = seed + generation * episodes
+            seeds = list(range(base, base + episodes))
+            if executor is None:
+                results = [play_episodes(table, seeds, epsilon, floors)]
+            else:
+                chunk = max(1, len(seeds) // (workers * 4))
+                batches = [(table, seeds[i:i + chunk], epsilon, floors) for i in range(0, len(seeds), chunk)]
+                results = list(executor.map(_play_batch, batches))
+            for batch_sums, batch_counts in results:
+                sums += batch_sums
+                counts += batch_counts
+            table = table_from_counts(sums, counts, min_visits)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return TablePolicy(table)
+
+
+def compare_policies(policy: FightPolicy | None, episodes: int = 200, seed: int = 10 ** 6) -> Dict[str, Any]:
+    """Mob win rate and mean outcome over fresh fights (None plays greedy)."""
+    wins = 0
+    total = 0.0
+    for i in range(episodes):
+        rng = random.Random(seed + i)
+        random.seed(seed + i)
+        heroes, mobs = _make_episode(rng, (1, 20))
+        fight = Fight(heroes, mobs, seed=seed + i)
+        fight.set_policy(mobs, policy)
+        rounds = 0
+        while not fight.is_over() and rounds < 60:
+            fight.start_round()
+            rounds += 1
+        outcome = evaluate(fight, mobs[0])
+        total += outcome
+        wins += outcome == 1.0
+    return {"episodes": episodes, "mob_win_rate": wins / episodes, "mob_mean_outcome": total / episodes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the tabular mob policy by self-play")
+    parser.add_argument("--episodes", type=int, default=2000)
+    parser.add_argument("--generations", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--epsilon", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=".data/balance/mob_policy.npy")
+    parser.add_argument("--compare", type=int, default=0,
+                        help="Evaluate the trained table against the greedy turn on N fights")
+    args = parser.parse_args()
+
+    policy = train_policy(args.episodes, args.generations, args.workers, args.epsilon, seed=args.seed)
+    path = policy.save(args.out)
+    print(f"Policy table written to {path}")
+    if args.compare:
+        print("greedy:", compare_policies(None, args.compare))
+        print("table: ", compare_policies(policy, args.compare))
+
+
+if __name__ == "__main__":
+    main()
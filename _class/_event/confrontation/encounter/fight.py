@@ -1,32 +1,80 @@
 
-from random import choice, shuffle
-from typing import List, Optional, Union
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+from jeuxRPG._class._event.confrontation.encounter.policy import FightAction, FightPolicy, TurnDecision, legal_actions
 from jeuxRPG._class.character import Character
 from jeuxRPG._class.res.classType import SkillType
 from jeuxRPG._class.res.team.alliance import Alliance
 from jeuxRPG._class.res.team.team import Team
+from jeuxRPG._class.sub_character.invocations.invocation import Invocation
 from jeuxRPG.i18n import t
 
+if TYPE_CHECKING:
+    from jeuxRPG._class._event.confrontation.encounter.replay import FightRecorder
+
+
+def _wake_waiter(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
 
 class Fight:
     """
     Manages a battle between alliances of attackers and defenders.
     All participants are grouped into Alliance instances that don't modify
     their original team affiliations.
+
+    Turn order and targets are drawn from `self.rng`: the global `random`
+    module by default, or a private `random.Random(seed)` when a seed is
+    given so the fight can be reproduced.
+
+    Fighters with an AI policy (see `set_policy`, or a character `ai_policy`
+    attribute) let it pick their action; the others play the built-in greedy
+    turn.
+
+    Fights with human players are driven turn by turn from asyncio instead
+    of `start_round` (see `set_manual`):
+
+        while (decision := await fight.next_turn()) is not None:
+            ...  # show decision.actions to the player
+            # later, from the handler receiving the player's choice:
+            fight.submit_action(action)
+
+    `next_turn` plays every AI turn inline and stops at the next manual
+    turn; while the player thinks, the fight is only a pending future, with
+    no thread and no polling.
     """
     
     def __init__(
         self,
         attackers: Union[List[Union[Character, Team]], Character, Team],
         defenders: Union[List[Union[Character, Team]], Character, Team],
-        name: str = ""
+        name: str = "",
+        seed: Optional[int] = None
     ) -> None:
         """Initialize a fight with participants grouped into Alliances."""
+        self.name = name
+        self.seed = seed
+        self.rng: Any = random.Random(seed) if seed is not None else random
+        self.recorder: Optional['FightRecorder'] = None
+        self.policies: Dict[Character, FightPolicy] = {}
+        self.use_policies: bool = True
+        self.manual: Set[Character] = set()
+        # Interactive turn cursor (see next_turn)
+        self._turns_left: Optional[int] = None
+        self._decision: Optional[TurnDecision] = None
+        self._decision_done: Optional[asyncio.Future] = None
         self.attackers = Alliance(f"{name} Attackers", self._normalize_participants(attackers))
         self.defenders = Alliance(f"{name} Defenders", self._normalize_participants(defenders))
         self.attackers.add_enemy(self.defenders, mutual=True)
         self._winner: Optional[Alliance] = None
+        # HP removed / restored by the actions of each side
+        self.damage_dealt: Dict[str, int] = {"attackers": 0, "defenders": 0}
+        self.healing_done: Dict[str, int] = {"attackers": 0, "defenders": 0}
         self._validate_participants()
         self.round : int = 0
         self.can_play : List[Character]
@@ -85,6 +133,8 @@ class Fight:
     def _new_round(self) -> None:
         self.can_play = self._get_alive_participant()
         self.round += 1
+        if self.recorder is not None:
+            self.recorder.record("N")
 
     def _get_alive_participant(self) -> list[Character]:
         return [c for c in self.get_all_individuals() if c.is_alive()]
@@ -93,7 +143,7 @@ class Fight:
         can_play = self.can_play
         can_play = [player for player in can_play if player.is_alive()]
         if can_play == [] : return None
-        return choice(can_play)
+        return self.rng.choice(can_play)
 
     def get_all_individuals(self) -> List[Character]:
         """Get all unique characters involved in the fight."""
@@ -131,88 +181,139 @@ class Fight:
         ]
         
         # 2. Mélange aléatoire
-        import random
-        random.shuffle(all_fighters)
+        self.rng.shuffle(all_fighters)
         
         return all_fighters
 
-    def start_round(self, rest: bool = True) -> None:
-        """Start the fight between alliances."""
+    def start_round(self, rest: bool = True, deadline: Optional[float] = None) -> bool:
+        """
+        Start the fight between alliances.
+
+        Args:
+            rest: Rest the fighters at the end of the round
+            deadline: `time.perf_counter()` value after which no turn starts;
+                the round is then left unfinished (for throwaway branches)
+
+        Returns:
+            False when the deadline cut the round
+        """
         can_play = self.can_play
         if not can_play:
-            return
+            return True
 
         for _ in range(len(can_play)):
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
             who_play = self.who_next()
             if not who_play:
                 break
+            self._play_turn(who_play)
 
-            if not who_play.is_alive():
-                self.can_play.remove(who_play)
-                self.log_message.append(f"{who_play.name} est mort et ne peut pas jouer.")
-                continue
+        self.end_round(rest)
+        return True
+
+    def _play_turn(self, who_play: Character) -> None:
+        """Play the turn of `who_play` drawn by `who_next` (policy or greedy turn)."""
+        if not who_play.is_alive():
+            self._turn_dead(who_play)
+            return
+
+        # Skip turn if stunned, but still tick status so stun can expire
+        if who_play.is_stun():
+            self._turn_stunned(who_play)
+            return
+
+        policy = self.get_policy(who_play)
+        if policy is not None:
+            action = policy.choose(self, who_play)
+            if action is not None and self.apply_action(who_play, action):
+                return
 
-            # Skip turn if stunned, but still tick status so stun can expire
-            if who_play.is_stun():
-                try:
-                    updates = who_play._update_status()
-                    if isinstance(updates, list):
-                        extra_msgs = [m for m, _ in updates if m]
-                        if extra_msgs:
-                            self.log_message.append(" ".join(extra_msgs))
-                except Exception:
-                    pass
-                self.log_message.append(f"{who_play.name} est étourdi et saute son tour.")
-                if who_play in self.can_play:
-                    self.can_play.remove(who_play)
+        allies, opponents = self.sides_of(who_play)
+        self.rng.shuffle(opponents)
+        for enemy in opponents:
+            if not enemy.is_alive():
                 continue
+            if self._turn_attack(who_play, enemy):
+                return
 
-            if who_play in self.attackers:
-                opponents = self.defenders.get_fighters()
-                allies = self.attackers.get_fighters()
-            else:
-                opponents = self.attackers.get_fighters()
-                allies = self.defenders.get_fighters()
-
-            shuffle(opponents)
-            for enemy in opponents:
-                if not enemy.is_alive():
-                    continue
-                success, message = who_play.attack(enemy)
-                if success:
-                    self.log_message.append(message)
-                    self.can_play.remove(who_play)
-                    break
-                else:
-                    self.log_message.append(f"{who_play.name} a raté son attaque sur {enemy.name}")
-            else:
-                action_done = False
-                shuffle(allies)
-                for ally in allies:
-                    for skill_name, skill in who_play.skills.items():
-                        if skill.skill_type == SkillType.RESURRECT and not ally.is_alive():
-                            if self.play(who_play, ally, skill_name):
-                                self.log_message.append(f"{who_play.name} ressuscite {ally.name}")
-                                if who_play in self.can_play:
-                                    self.can_play.remove(who_play)
-                                action_done = True
-                                break
-                        elif skill.skill_type in (SkillType.HEAL, SkillType.BUFF) and ally.is_alive():
-                            if self.play(who_play, ally, skill_name):
-                                self.log_message.append(f"{who_play.name} utilise {skill_name} sur {ally.name}")
-                                if who_play in self.can_play:
-                                    self.can_play.remove(who_play)
-                                action_done = True
-                                break
-                    if action_done:
-                        break
-
-                if not action_done:
-                    self.log_message.append(f"{who_play.name} ne peut rien faire ce tour-ci.")
-                    if who_play in self.can_play:
-                        self.can_play.remove(who_play)
+        self.rng.shuffle(allies)
+        for ally in allies:
+            for skill_name, skill in who_play.skills.items():
+                if skill.skill_type == SkillType.RESURRECT and not ally.is_alive():
+                    if self.play(who_play, ally, skill_name):
+                        self.log_message.append(f"{who_play.name} ressuscite {ally.name}")
+                        if who_play in self.can_play:
+                            self.can_play.remove(who_play)
+                        return
+                elif skill.skill_type in (SkillType.HEAL, SkillType.BUFF) and ally.is_alive():
+                    if self.play(who_play, ally, skill_name):
+                        self.log_message.append(f"{who_play.name} utilise {skill_name} sur {ally.name}")
+                        if who_play in self.can_play:
+                            self.can_play.remove(who_play)
+                        return
 
-        self.end_round(rest)
+        self._turn_idle(who_play)
+
+    # Turn primitives ##########################################################
+    # Every state change made by a round goes through one of these methods, so
+    # a recorder can capture the action stream and a replay can re-apply it.
+
+    def _turn_dead(self, who_play: Character) -> None:
+        """A dead fighter drawn from `can_play` loses its turn."""
+        if self.recorder is not None:
+            self.recorder.record("D", who_play)
+        self.can_play.remove(who_play)
+        self.log_message.append(f"{who_play.name} est mort et ne peut pas jouer.")
+
+    def _turn_stunned(self, who_play: Character) -> None:
+        """A stunned fighter skips its turn while its status still ticks."""
+        if self.recorder is not None:
+            self.recorder.record("S", who_play)
+        try:
+            updates = who_play._update_status()
+            if isinstance(updates, list):
+                extra_msgs = [m for m, _ in updates if m]
+                if extra_msgs:
+                    self.log_message.append(" ".join(extra_msgs))
+        except Exception:
+            pass
+        self.log_message.append(f"{who_play.name} est étourdi et saute son tour.")
+        if who_play in self.can_play:
+            self.can_play.remove(who_play)
+
+    def _credit(self, who_play: Character, target: Character, hp_before: int) -> None:
+        """Add the HP change of `target` to the damage or healing total of `who_play`'s side."""
+        delta = hp_before - target.hp.current_value
+        if not delta:
+            return
+        side = "attackers" if who_play in self.attackers.fighters else "defenders"
+        if delta > 0:
+            self.damage_dealt[side] += delta
+        else:
+            self.healing_done[side] -= delta
+
+    def _turn_attack(self, who_play: Character, enemy: Character, skill_name: Optional[str] = None) -> bool:
+        """Attack `enemy` (with `skill_name` if given), ending the turn of `who_play` on success."""
+        hp_before = enemy.hp.current_value
+        success, message, used = who_play.perform_attack(enemy, skill_name)
+        self._credit(who_play, enemy, hp_before)
+        if self.recorder is not None:
+            self.recorder.record("A", who_play, enemy, used, success=success)
+        if success:
+            self.log_message.append(message)
+            self.can_play.remove(who_play)
+        else:
+            self.log_message.append(f"{who_play.name} a raté son attaque sur {enemy.name}")
+        return success
+
+    def _turn_idle(self, who_play: Character) -> None:
+        """`who_play` found nothing to do this round."""
+        if self.recorder is not None:
+            self.recorder.record("I", who_play)
+        self.log_message.append(f"{who_play.name} ne peut rien faire ce tour-ci.")
+        if who_play in self.can_play:
+            self.can_play.remove(who_play)
 
     def end_round(self, rest : bool) ->None:
         if not rest: return self._new_round()
@@ -220,6 +321,8 @@ class Fight:
         self._new_round()
     
     def rest(self):
+        if self.recorder is not None:
+            self.recorder.record("Z")
         for fighter in self.get_all_individuals():
             if fighter.is_alive():
                 fighter.rest()
@@ -233,7 +336,12 @@ class Fight:
             # Keep explicit signal for tests expecting a stun prevention behavior
             raise RuntimeWarning(f"{who_play.name} is stun, can't play")
 
+        hp_before = target.hp.current_value if target is not None else 0
         success, message = who_play.use_skill(skill_name, target)
+        if target is not None:
+            self._credit(who_play, target, hp_before)
+        if self.recorder is not None:
+            self.recorder.record("P", who_play, target, skill_name, success=success)
         self.log_message.append(message)
         if message == '':
             # Debug hook left from older flow; keep safe but non-blocking
@@ -241,6 +349,268 @@ class Fight:
         self.can_play.remove(who_play)
         return success
     
+    # AI policies ##############################################################
+
+    def set_policy(
+        self,
+        participants: Union[Character, Team, Iterable[Character], None],
+        policy: Optional[FightPolicy]
+    ) -> None:
+        """
+        Attach an AI policy to fighters (None restores the greedy turn).
+
+        Args:
+            participants: Character, Team (or Alliance) or list of characters
+            policy: Policy deciding their actions
+        """
+        if isinstance(participants, Character):
+            members = [participants]
+        elif isinstance(participants, Team):
+            members = participants.get_fighters()
+        else:
+            members = list(participants or [])
+
+        for member in members:
+            if policy is None:
+                self.policies.pop(member, None)
+            else:
+                self.policies[member] = policy
+
+    def get_policy(self, character: Character) -> Optional[FightPolicy]:
+        """Get the policy playing `character`, None for the greedy turn."""
+        if not self.use_policies:
+            return None
+        return self.policies.get(character) or getattr(character, "ai_policy", None)
+
+    def sides_of(self, character: Character) -> Tuple[List[Character], List[Character]]:
+        """Get (allies, opponents) of `character` as new lists."""
+        if character in self.attackers:
+            return self.attackers.get_fighters(), self.defenders.get_fighters()
+        return self.defenders.get_fighters(), self.attackers.get_fighters()
+
+    def apply_action(self, who_play: Character, action: FightAction) -> bool:
+        """
+        Play an action chosen by a policy.
+
+        Damage skills go through `attack` like the greedy turn (a miss keeps
+        the turn); other skills go through `play`, which ends the turn.
+
+        Returns:
+            True when the turn of `who_play` is over
+        """
+        skill = who_play.skills.get(action.skill_name)
+        if skill is None or who_play not in self.can_play:
+            return False
+        if skill.skill_type == SkillType.DAMAGE:
+            return self._turn_attack(who_play, action.target, action.skill_name)
+        self.play(who_play, action.target, action.skill_name)
+        return True
+
+    # Interactive turns ########################################################
+
+    def set_manual(self, participants: Union[Character, Team, Iterable[Character]], manual: bool = True) -> None:
+        """
+        Mark fighters as played by a human through `next_turn`/`submit_action`.
+
+        `start_round` still plays their greedy turn, so a manual fight can
+        be finished automatically (e.g. when the player leaves).
+        """
+        if isinstance(participants, Character):
+            members = [participants]
+        elif isinstance(participants, Team):
+            members = participants.get_fighters()
+        else:
+            members = list(participants)
+        if manual:
+            self.manual.update(members)
+        else:
+            self.manual.difference_update(members)
+
+    @property
+    def pending_decision(self) -> Optional[TurnDecision]:
+        """Manual turn waiting for `submit_action`, if any."""
+        return self._decision
+
+    def _advance(self, rest: bool = True) -> Optional[TurnDecision]:
+        """
+        Play turns like `start_round` until a manual fighter must decide.
+
+        Like `start_round`, a round is always played to its end: once the
+        fight is decided, the remaining manual turns of the round are played
+        automatically.
+
+        Returns:
+            The decision point, or None when the fight is over
+        """
+        while True:
+            if self._turns_left is None:
+                if self.is_over():
+                    return None
+                self._turns_left = len(self.can_play)
+            if self._turns_left == 0:
+                self._turns_left = None
+                self.end_round(rest)
+                continue
+            self._turns_left -= 1
+            who_play = self.who_next()
+            if not who_play:
+                self._turns_left = 0
+                continue
+            if who_play in self.manual and who_play.is_alive() and not who_play.is_stun() and not self.is_over():
+                return TurnDecision(who_play, self.round, legal_actions(self, who_play))
+            self._play_turn(who_play)
+
+    async def next_turn(self, rest: bool = True) -> Optional[TurnDecision]:
+        """
+        Wait for the next manual turn of the fight.
+
+        If a decision is still pending, waits until `submit_action` answers
+        it; then plays the following AI turns inline (rounds end with a rest
+        when `rest` is True) and returns the next manual turn. One coroutine
+        should drive a given fight.
+
+        Returns:
+            TurnDecision for the player, or None once the fight is over
+        """
+        if self._decision is not None:
+            if self._decision_done is None:
+                self._decision_done = asyncio.get_running_loop().create_future()
+            await self._decision_done
+        if self._decision is None:
+            self._decision = self._advance(rest)
+        return self._decision
+
+    def submit_action(
+        self,
+        action: Union[FightAction, str, None],
+        target: Optional[Character] = None,
+    ) -> bool:
+        """
+        Answer the pending manual turn.
+
+        Args:
+            action: FightAction from `decision.actions`, a skill name (with
+                `target`), or None to pass the turn
+            target: Target of the skill when `action` is a skill name
+
+        Returns:
+            True when the action succeeded (a failed or passed turn is over too)
+
+        Raises:
+            RuntimeError: No turn is waiting for a decision
+            ValueError: The action is not legal for this turn
+        """
+        decision = self._decision
+        if decision is None:
+            raise RuntimeError("No turn is waiting for a decision")
+        if isinstance(action, str):
+            action = FightAction(action, target)
+        actor = decision.actor
+
+        success = False
+        if action is None:
+            self._turn_idle(actor)
+        else:
+            if action not in decision.actions:
+                target_name = getattr(action.target, "name", None)
+                raise ValueError(f"{actor.name} cannot use {action.skill_name} on {target_name}")
+            success = self.apply_action(actor, action)
+            if actor in self.can_play:
+                # a missed attack ends a manual turn too
+                self._turn_idle(actor)
+
+        self._decision = None
+        waiter, self._decision_done = self._decision_done, None
+        if waiter is not None and not waiter.done():
+            waiter.get_loop().call_soon_threadsafe(_wake_waiter, waiter)
+        return success
+
+    # Value-state snapshots ###################################################
+
+    def _state_characters(self) -> List[Character]:
+        """Fighters plus their current invocations."""
+        characters = self.get_all_individuals()
+        for fighter in tuple(characters):
+            characters.extend(fighter.invocations.invocations)
+        return characters
+
+    def _own_invocations(self) -> List[Invocation]:
+        """Entries of the global `Invocation.all_invocation` whose master fights here."""
+        masters = {id(c) for c in self.get_all_individuals()}
+        return [i for i in Invocation.all_invocation if id(getattr(i, "master", None)) in masters]
+
+    def snapshot(self) -> Tuple:
+        """
+        Capture the mutable state of the fight as plain tuples.
+
+        Covers the round counter, who can still play, the winner, the
+        damage/healing totals and every fighter (and invocation) combat state. Taking and restoring it costs
+        microseconds, which makes look-ahead search affordable. Only the
+        registered invocations of this fight's fighters are captured: the
+        registry is shared with the other fights running meanwhile. The RNG is
+        not part of the snapshot: use `branch` to explore turns without
+        consuming the fight RNG.
+
+        Returns:
+            Opaque tuple to give back to `restore`
+        """
+        return (
+            self.round,
+            tuple(self.can_play),
+            len(self.log_message),
+            self._winner,
+            tuple(self.damage_dealt.values()),
+            tuple(self.healing_done.values()),
+            tuple(self._own_invocations()),
+            tuple((c, c.snapshot_state()) for c in self._state_characters()),
+        )
+
+    def restore(self, state: Tuple) -> None:
+        """
+        Restore a state captured by `snapshot` on this fight.
+
+        Args:
+            state: Tuple returned by `snapshot`
+        """
+        self.round, can_play, log_size, self._winner, damage, healing, invocations, characters = state
+        self.can_play = list(can_play)
+        self.damage_dealt = dict(zip(("attackers", "defenders"), damage))
+        self.healing_done = dict(zip(("attackers", "defenders"), healing))
+        del self.log_message[log_size:]
+        # only the difference on this fight's own invocations: other fights keep theirs
+        kept = {id(i) for i in invocations}
+        registry = Invocation.all_invocation
+        dropped = {id(i) for i in self._own_invocations()} - kept
+        registry[:] = [i for i in registry if id(i) not in dropped]
+        present = {id(i) for i in registry}
+        registry.extend(i for i in invocations if id(i) not in present)
+        for character, character_state in characters:
+            character.restore_state(character_state)
+
+    @contextmanager
+    def branch(self, rng: Optional[random.Random] = None) -> Iterator['Fight']:
+        """
+        Play hypothetical turns and rewind the fight afterwards.
+
+        The recorder is detached and the fight RNG is swapped for `rng` (a
+        generator seeded with the current round by default) while branching,
+        so explored turns never leak into a replay or change the real fight.
+
+        Usage:
+            with fight.branch():
+                fight.start_round()
+                score = evaluate(fight)
+        """
+        state = self.snapshot()
+        recorder, self.recorder = self.recorder, None
+        fight_rng, self.rng = self.rng, rng or random.Random(self.round)
+        try:
+            yield self
+        finally:
+            self.restore(state)
+            self.recorder = recorder
+            self.rng = fight_rng
+
     def get_winner(self) -> Optional[Alliance]:
         """Get the winning alliance."""
         return self._winner
@@ -0,0 +1,254 @@
+"""
+Monte-Carlo tree search combat policy.
+
+At each decision the legal actions of the fighter are the children of the
+root. Iterations pick a child with UCB1, play it inside `Fight.branch` and
+roll the fight out for a few rounds with the greedy turn, then score the
+result from the fighter's side. Later turns are stochastic (turn order and
+targets are drawn at random), so the search stays open-loop at the root.
+
+The budget is strict: an iteration only starts when the average iteration
+cost still fits before the deadline, and rollouts are cut at the deadline,
+checked after the branch is taken and before every simulated turn.
+With an executor, extra root searches run in workers on a serialized copy of
+the fight and their statistics are merged in; results arriving after the
+deadline are dropped.
+"""
+
+import math
+import random
+import time
+from concurrent.futures import Executor, Future, wait
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from jeuxRPG._class._event.confrontation.encounter.policy import FightAction, FightPolicy, legal_actions
+from jeuxRPG._class.character import Character
+
+if TYPE_CHECKING:
+    from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+
+
+def evaluate(fight: 'Fight', character: Character) -> float:
+    """
+    Score the fight from the side of `character`.
+
+    Returns:
+        1.0 for a win, 0.0 for a loss, 0.5 for a draw; otherwise 0.5 shifted
+        by the average remaining HP ratio of the allies minus the opponents
+    """
+    allies, opponents = fight.sides_of(character)
+    if fight.is_over():
+        winner = fight.get_winner()
+        if winner is None:
+            return 0.5
+        return 1.0 if character in winner else 0.0
+    return 0.5 + (_hp_ratio(allies) - _hp_ratio(opponents)) / 2
+
+
+def _hp_ratio(fighters: Sequence[Character]) -> float:
+    if not fighters:
+        return 0.0
+    total = 0.0
+    for fighter in fighters:
+        if fighter.hp.value > 0:
+            total += max(0, fighter.hp.current_value) / fighter.hp.value
+    return total / len(fighters)
+
+
+class MCTSPolicy(FightPolicy):
+    """
+    Search-based policy with a per-decision time and iteration budget.
+
+    Attributes:
+        time_budget: Maximum wall time of a decision, in seconds
+        max_iterations: Maximum number of rollouts of a decision
+        rollout_rounds: Rounds simulated after the explored action
+        exploration: UCB1 exploration constant
+        executor: Optional executor running extra root searches (a
+            ProcessPoolExecutor gives real parallelism)
+        workers: Number of worker searches submitted per decision
+        last_stats: (action, visits, mean score) of the last decision
+    """
+
+    def __init__(
+        self,
+        time_budget: float = 0.02,
+        max_iterations: int = 200,
+        rollout_rounds: int = 3,
+        exploration: float = 1.4,
+        seed: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        workers: int = 0
+    ) -> None:
+        if time_budget <= 0:
+            raise ValueError("time_budget must be positive")
+        if max_iterations < 1 or rollout_rounds < 1:
+            raise ValueError("max_iterations and rollout_rounds must be at least 1")
+        self.time_budget = time_budget
+        self.max_iterations = max_iterations
+        self.rollout_rounds = rollout_rounds
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self.executor = executor
+        self.workers = workers if executor is not None else 0
+        self.last_stats: List[Tuple[FightAction, int, float]] = []
+
+    def choose(self, fight: 'Fight', actor: Character) -> Optional[FightAction]:
+        deadline = time.perf_counter() + self.time_budget
+        actions = legal_actions(fight, actor)
+        self.last_stats = []
+        if len(actions) <= 1:
+            return actions[0] if actions else None
+
+        futures = self._submit_workers(fight, actor, actions) if self.workers else []
+        visits = [0] * len(actions)
+        totals = [0.0] * len(actions)
+        run_search(fight, actor, actions, visits, totals, deadline, self.max_iterations,
+                   self.rollout_rounds, self.exploration, self.rng)
+
+        if futures:
+            done, not_done = wait(futures, timeout=max(0.0, deadline - time.perf_counter()))
+            for future in not_done:
+                future.cancel()
+            for future in done:
+                if future.cancelled() or future.exception() is not None:
+                    continue
+                for i, (count, total) in enumerate(future.result()):
+                    visits[i] += count
+                    totals[i] += total
+
+        self.last_stats = [
+            (action, count, total / count if count else 0.0)
+            for action, count, total in zip(actions, visits, totals)
+        ]
+        best = max(range(len(actions)), key=lambda i: (visits[i], totals[i]))
+        if visits[best] == 0:
+            return None
+        return actions[best]
+
+    def _submit_workers(
+        self,
+        fight: 'Fight',
+        actor: Character,
+        actions: List[FightAction]
+    ) -> List[Future]:
+        """Serialize the fight once and start the worker root searches."""
+        from jeuxRPG._class._event.confrontation.encounter.replay import capture_fight
+
+        fighters = fight.get_all_individuals()
+        index = {id(c): i for i, c in enumerate(fighters)}
+        payload = {
+            "fight": capture_fight(fight),
+            "actor": index[id(actor)],
+            "actions": [(a.skill_name, index[id(a.target)]) for a in actions],
+            "deadline": time.time() + self.time_budget,
+            "max_iterations": self.max_iterations,
+            "rollout_rounds": self.rollout_rounds,
+            "exploration": self.exploration,
+        }
+        return [
+            self.executor.submit(search_worker, {**payload, "seed": self.rng.getrandbits(32)})
+            for _ in range(self.workers)
+        ]
+
+
+def run_search(
+    fight: 'Fight',
+    actor: Character,
+    actions: List[FightAction],
+    visits: List[int],
+    totals: List[float],
+    deadline: float,
+    max_iterations: int,
+    rollout_rounds: int,
+    exploration: float,
+    rng: random.Random
+) -> int:
+    """
+    Run UCB1 iterations at the root until the deadline or the iteration cap.
+
+    `visits` and `totals` are updated in place (one slot per action).
+
+    Returns:
+        Number of completed iterations
+    """
+    iterations = 0
+    started = time.perf_counter()
+    while iterations < max_iterations:
+        now = time.perf_counter()
+        if iterations and now + (now - started) / iterations > deadline:
+            break
+        if now >= deadline:
+            break
+
+        choice = _select(visits, totals, iterations, exploration)
+        score = _rollout(fight, actor, actions[choice], rollout_rounds, deadline, rng)
+        if score is None:
+            break
+        visits[choice] += 1
+        totals[choice] += score
+        iterations += 1
+    return iterations
+
+
+def _select(visits: List[int], totals: List[float], iterations: int, exploration: float) -> int:
+    """Pick the action to explore with UCB1 (unvisited actions first)."""
+    for i, count in enumerate(visits):
+        if count == 0:
+            return i
+    log_n = math.log(iterations)
+    return max(
+        range(len(visits)),
+        key=lambda i: totals[i] / visits[i] + exploration * math.sqrt(log_n / visits[i]),
+    )
+
+
+def _rollout(
+    fight: 'Fight',
+    actor: Character,
+    action: FightAction,
+    rounds: int,
+    deadline: float,
+    rng: random.Random
+) -> Optional[float]:
+    """Play `action` then `rounds` greedy rounds in a branch; None past the deadline."""
+    use_policies = fight.use_policies
+    with fight.branch(random.Random(rng.getrandbits(32))):
+        fight.use_policies = False
+        try:
+            if time.perf_counter() >= deadline:
+                return None
+            fight.apply_action(actor, action)
+            for _ in range(rounds):
+                if fight.is_over():
+                    break
+                if not fight.start_round(deadline=deadline):
+                    return None
+            return evaluate(fight, actor)
+        finally:
+            fight.use_policies = use_policies
+
+
+def search_worker(payload: Dict[str, Any]) -> List[Tuple[int, float]]:
+    """
+    Root search on a serialized fight, run by executor workers.
+
+    Args:
+        payload: Fight state, actor and action indices, budget and seed
+
+    Returns:
+        (visits, total score) per action, in payload order
+    """
+    from jeuxRPG._class._event.confrontation.encounter.replay import restore_fight
+
+    deadline = time.perf_counter() + (payload["deadline"] - time.time())
+    fight, fighters = restore_fight(payload["fight"])
+    actor = fighters[payload["actor"]]
+    actions = [
+        FightAction(skill_name, fighters[target]) for skill_name, target in payload["actions"]
+    ]
+    visits = [0] * len(actions)
+    totals = [0.0] * len(actions)
+    run_search(fight, actor, actions, visits, totals, deadline, payload["max_iterations"],
+               payload["rollout_rounds"], payload["exploration"], random.Random(payload["seed"]))
+    return list(zip(visits, totals))
@@ -0,0 +1,90 @@
+"""
+Pluggable combat AI policies.
+
+A policy picks the action of a fighter when its turn comes in
+`Fight.start_round`. Policies are attached with `Fight.set_policy` (or through
+the `ai_policy` attribute of a character, as done by `TowerRun` for bosses).
+Returning None from `choose` keeps the built-in greedy behaviour for that turn.
+
+Fighters played by a human are marked with `Fight.set_manual`: their turns
+come out of `Fight.next_turn` as TurnDecision instead of going to a policy.
+"""
+
+from typing import TYPE_CHECKING, List, NamedTuple, Optional
+
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.res.classType import SkillType
+
+if TYPE_CHECKING:
+    from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+
+
+class FightAction(NamedTuple):
+    """A skill used by the acting fighter on a target."""
+    skill_name: str
+    target: Character
+
+
+class TurnDecision(NamedTuple):
+    """A turn waiting for the decision of a player (see `Fight.next_turn`)."""
+    actor: Character
+    round: int
+    actions: List[FightAction]
+
+
+class FightPolicy:
+    """
+    Base class of the combat policies.
+
+    Subclasses override `choose`. The base policy always defers to the
+    built-in greedy turn of `Fight`.
+    """
+
+    def choose(self, fight: 'Fight', actor: Character) -> Optional[FightAction]:
+        """
+        Pick the action of `actor` for its current turn.
+
+        Args:
+            fight: Fight being played
+            actor: Fighter whose turn it is (alive and not stunned)
+
+        Returns:
+            Action to play, or None to let the fight play its greedy turn
+        """
+        return None
+
+
+def legal_actions(fight: 'Fight', actor: Character) -> List[FightAction]:
+    """
+    List the actions `actor` can currently play.
+
+    A skill is legal when it is ready and affordable; its targets depend on
+    its type: living opponents for damage and debuffs, living allies for
+    heals and buffs, fallen allies for resurrections, the actor itself for
+    the other skills.
+
+    Args:
+        fight: Fight being played
+        actor: Fighter whose turn it is
+
+    Returns:
+        List of FightAction, in skill order
+    """
+    allies, opponents = fight.sides_of(actor)
+    actions: List[FightAction] = []
+    for skill_name, skill in actor.skills.items():
+        if not skill.is_ready() or not actor.has_required_energie(skill):
+            continue
+        skill_type = skill.skill_type
+        if skill_type in (SkillType.DAMAGE, SkillType.DEBUFF):
+            targets = [c for c in opponents if c.is_alive()]
+        elif skill_type == SkillType.HEAL:
+            targets = [c for c in allies if c.is_alive() and (c is actor or skill.can_target_others)]
+        elif skill_type == SkillType.BUFF:
+            targets = [c for c in allies if c.is_alive()]
+        elif skill_type == SkillType.RESURRECT:
+            targets = [c for c in allies if not c.is_alive()]
+        else:
+            targets = [actor]
+        actions.extend(FightAction(skill_name, target) for target in targets)
+    return actions
@@ -0,0 +1,620 @@
+"""
+Deterministic fight recording and replay.
+
+A `FightRecorder` attached to a `Fight` captures:
+
+- the initial state of every fighter (class, level, stats, energies,
+  cooldowns and every active alteration: buffs, debuffs, stuns, DoTs,
+  invulnerabilities and damage reductions) and its side,
+- the RNG seed of the fight (when the fight was created with one),
+- the compact action stream produced by the fight turn primitives
+  (actor index, skill, target index and outcome; attacks only carry a
+  skill when an AI policy picked it),
+- the final state of every fighter.
+
+Records are written as JSONL: a header line, one compact line per action and
+a final line. `FightReplay` rebuilds the fighters from the header, re-applies
+the action stream headlessly (no AI decision, no RNG draw) and checks every
+action outcome and the final states against the record.
+"""
+
+import io
+import json
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.mob.mob import Mob  # registers the "Mob" class for restore_character
+from jeuxRPG._class.res.character.alteration import alteration as alteration_file
+from jeuxRPG._class.res.character.stats import basic_stat
+from jeuxRPG._class.skills.skill import Skill
+from jeuxRPG._class.stats.status import AlterationStatus
+from jeuxRPG._class.sub_character.invocations.invocation import Invocation
+
+
+REPLAY_VERSION = 1
+
+# Attributes set on some instances (tower mobs, bosses) that change combat results
+_EXTRA_ATTRIBUTES = ("is_boss", "is_tough", "boss_rank")
+
+# Timed alteration lists of a status, by recorded kind (stuns apart: rebuilt with add_stun)
+_TIMED_KINDS = {
+    "dot": lambda a: a.incoming,
+    "invulnerability": lambda a: a.invulnerability,
+    "reduction%": lambda a: a.reduction.percent,
+    "reduction+": lambda a: a.reduction.plus,
+    "reduction-": lambda a: a.reduction.minus,
+}
+
+# (alterations, stat modifiers by stat name, Death_in, invocations) of a character
+LiveState = Tuple[Optional[AlterationStatus], Dict[str, Any], int, List[Invocation]]
+
+
+# State capture ###############################################################
+
+def capture_character(character: Character, index: Optional[Dict[int, int]] = None) -> Dict[str, Any]:
+    """
+    Capture the combat-relevant state of a character as plain JSON data.
+
+    Alterations are [kind, name, stat, value, duration, caster], the caster
+    being a fighter index from `index` (None: the character itself); the
+    timed kinds of `_TIMED_KINDS` add their alteration class and type.
+
+    Args:
+        character: Character to capture
+        index: Fighter index by `id()`, to record the casters
+
+    Returns:
+        JSON-serializable state dictionary
+    """
+    index = index or {}
+    stats = {
+        name: [stat.value, stat.current_value]
+        for name, stat in character.status["stats"].items()
+        if name != "energie"
+    }
+    alterations = []
+    for name, stat in stats_items(character):
+        for buff in stat.buffs:
+            alterations.append(["buff", buff.name, name, buff.value, buff.duration, index.get(id(buff.caster))])
+        for debuff in stat.debuffs:
+            alterations.append(
+                ["debuff", debuff.name, name, debuff.value, debuff.duration, index.get(id(debuff.caster))]
+            )
+    for stun in character.get_stuns():
+        if not stun.is_over():
+            alterations.append(["stun", stun.name, None, 0, stun.duration, index.get(id(stun.caster))])
+    status = character.status.get_alteration()
+    if status is not None:
+        for kind, items in _TIMED_KINDS.items():
+            for alteration in items(status):
+                alterations.append([
+                    kind, alteration.name, _encode_reference(alteration.stat_target), alteration.value,
+                    alteration.duration, index.get(id(alteration.caster)), type(alteration).__name__,
+                    alteration.type.name if alteration.type is not None else None,
+                ])
+
+    state = {
+        "class": type(character).__name__,
+        "user_id": character.user_id,
+        "name": character.name,
+        "level": character.level,
+        "exp": character.exp,
+        "stats": stats,
+        "energies": [
+            [type(e).__name__, e.value, e.current_value, e.regen_rate] for e in character.energie
+        ],
+        "skills": {name: skill.current_cooldown for name, skill in character.skills.items()},
+        "alterations": alterations,
+    }
+    extra = {attr: getattr(character, attr) for attr in _EXTRA_ATTRIBUTES if attr in vars(character)}
+    if "get_xp_reward" in vars(character):
+        extra["xp_reward"] = character.get_xp_reward()
+    if extra:
+        state["extra"] = extra
+    return state
+
+
+def _encode_reference(target: Any) -> Optional[str]:
+    """Stat class or AlterationType held by `Alteration.stat_target`, as a name."""
+    if target is None:
+        return None
+    if isinstance(target, alteration_file.AlterationType):
+        return f"AlterationType.{target.name}"
+    return target.__name__
+
+
+def _decode_reference(name: Optional[str]) -> Any:
+    if name is None:
+        return None
+    if name.startswith("AlterationType."):
+        return alteration_file.AlterationType[name.partition(".")[2]]
+    return getattr(basic_stat, name)
+
+
+def stats_items(character: Character):
+    """Iterate over (name, stat) pairs of every stat, energies included."""
+    for name, stat in character.status["stats"].items():
+        if name == "energie":
+            yield from stat.items()
+        else:
+            yield name, stat
+
+
+def restore_character(state: Dict[str, Any]) -> Character:
+    """
+    Rebuild a new character from a state captured by `capture_character`.
+
+    Args:
+        state: State dictionary
+
+    Returns:
+        New Character instance
+    """
+    character = Character.create(state["class"], user_id=state["user_id"], name=state["name"])
+    apply_character_state(character, state)
+    return character
+
+
+def apply_character_state(
+    character: Character,
+    state: Dict[str, Any],
+    live: Optional[LiveState] = None,
+    fighters: Optional[Sequence[Character]] = None
+) -> None:
+    """
+    Overwrite the combat state of an existing character.
+
+    The character is levelled stepwise up to the recorded level so the class
+    progression state matches, then every recorded value is applied on top.
+
+    Args:
+        character: Character of the class the state was captured from
+        state: State dictionary returned by `capture_character`
+        live: Live state of the character (see `load_live_states`); when
+            given, it replaces the alterations of `state` with the very
+            alteration objects and also brings the invocations back
+        fighters: Fighters the recorded caster indices point to
+    """
+    while character.level < state["level"]:
+        level = character.level
+        character.gain_exp(max(1, character._required_exp_for_next_level() - character.exp))
+        if character.level == level:
+            break
+    character.level = state["level"]
+    character.exp = state["exp"]
+
+    for name, (value, current) in state["stats"].items():
+        stat = character.get_stat(name)
+        stat.clear_effects()
+        stat.value = value
+        stat._current_value = current
+
+    for type_name, value, current, regen_rate in state["energies"]:
+        energie_type = getattr(basic_stat, type_name)
+        try:
+            energie = character.get_energie(energie_type)
+        except TypeError:
+            energie = energie_type(value)
+            character.add_energie(energie)
+        energie.clear_effects()
+        energie.value = value
+        energie.current_value = current
+        energie._regen_rate = regen_rate
+
+    skills = {}
+    for name, cooldown in state["skills"].items():
+        skill = character.skills.get(name) or Skill.get_skill_by_name(name).bind(character._rest_clock)
+        skill.current_cooldown = cooldown
+        skills[name] = skill
+    character.skills = skills
+
+    if live is not None:
+        _apply_live_state(character, live)
+    else:
+        _apply_recorded_alterations(character, state["alterations"], fighters)
+
+    extra = state.get("extra", {})
+    for attr in _EXTRA_ATTRIBUTES:
+        if attr in extra:
+            setattr(character, attr, extra[attr])
+    if "xp_reward" in extra:
+        character.get_xp_reward = lambda reward=extra["xp_reward"]: reward
+
+
+def _apply_recorded_alterations(
+    character: Character,
+    alterations: List[List[Any]],
+    fighters: Optional[Sequence[Character]] = None
+) -> None:
+    """Rebuild the alterations recorded by `capture_character`."""
+    character.clear_stuns()
+    status = character.status["alteration"]
+    status["buff"].clear()
+    status["debuff"].clear()
+    for items in _TIMED_KINDS.values():
+        items(status).clear()
+    for kind, name, stat_name, value, duration, *rest in alterations:
+        caster = character
+        if rest and rest[0] is not None and fighters is not None:
+            caster = fighters[rest[0]]
+        if kind == "stun":
+            character.add_stun(caster, name, duration)
+            continue
+        if kind in _TIMED_KINDS:
+            class_name, type_name = rest[1], rest[2]
+            alteration_class = getattr(alteration_file, class_name)
+            # same fields as recorded, whatever the constructor of the subclass
+            alteration = alteration_class.__new__(alteration_class)
+            alteration_file.Alteration.__init__(
+                alteration, name, caster, value, duration, character, _decode_reference(stat_name),
+                alteration_file.AlterationType[type_name] if type_name is not None else None,
+            )
+            _TIMED_KINDS[kind](status).append(alteration)
+            continue
+        stat = character.get_stat(stat_name)
+        alteration_class = alteration_file.Buff if kind == "buff" else alteration_file.DeBuff
+        alteration = alteration_class(name, caster, value, duration, character, type(stat))
+        current = stat.current_value
+        if kind == "buff":
+            stat.buffs = [*stat.buffs, alteration]
+        else:
+            stat.debuffs = [*stat.debuffs, alteration]
+        stat._current_value = current
+        character.status["alteration"][kind].append(alteration)
+
+
+# Live state ##################################################################
+# Alterations and invocations are objects pointing at fighters (casters,
+# targets, masters): they cannot be plain JSON data. To cross a process
+# boundary they are pickled together, every fighter being replaced by its
+# index, and loaded back against the fighters of the other side.
+
+class _FighterPickler(pickle.Pickler):
+    def __init__(self, file: io.BytesIO, fighters: Sequence[Character]) -> None:
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._index = {id(c): i for i, c in enumerate(fighters)}
+
+    def persistent_id(self, obj: Any) -> Optional[int]:
+        if isinstance(obj, Character):
+            return self._index.get(id(obj))
+        return None
+
+
+class _FighterUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BytesIO, fighters: Sequence[Character]) -> None:
+        super().__init__(file)
+        self._fighters = fighters
+
+    def persistent_load(self, index: int) -> Character:
+        return self._fighters[index]
+
+
+def capture_live_states(fighters: Sequence[Character]) -> bytes:
+    """
+    Capture the alterations (stat modifiers, stuns, DoTs, invulnerabilities,
+    reductions), `Death_in` and invocations of `fighters` in one pickle.
+
+    Args:
+        fighters: Fighters, in the order `load_live_states` will get them
+
+    Returns:
+        Pickled live states
+    """
+    states = [
+        (
+            c.status.get_alteration(),
+            {name: stat._mods for name, stat in stats_items(c)},
+            c.status.death_in,
+            list(c.invocations.invocations),
+        )
+        for c in fighters
+    ]
+    buffer = io.BytesIO()
+    _FighterPickler(buffer, fighters).dump(states)
+    return buffer.getvalue()
+
+
+def load_live_states(data: bytes, fighters: Sequence[Character]) -> List[LiveState]:
+    """
+    Load states captured by `capture_live_states`, fighter references
+    pointing to `fighters` (the same fighters, or their rebuilt copies).
+    """
+    return _FighterUnpickler(io.BytesIO(data), fighters).load()
+
+
+def _apply_live_state(character: Character, live: LiveState) -> None:
+    alteration, mods, death_in, invocations = live
+    character.status._alteration = alteration
+    for name, stat in stats_items(character):
+        stat._mods = mods.get(name)
+    character.status.death_in = death_in
+
+    # Invocations come back as copies: the registry follows the pocket
+    pocket = character.invocations.invocations
+    kept = {id(invocation) for invocation in invocations}
+    registered = {id(invocation) for invocation in Invocation.all_invocation}
+    for invocation in pocket:
+        if id(invocation) not in kept and id(invocation) in registered:
+            Invocation.all_invocation.remove(invocation)
+    for invocation in invocations:
+        if id(invocation) not in registered:
+            Invocation.all_invocation.append(invocation)
+    pocket[:] = invocations
+
+
+def capture_fight(fight: Fight, live: bool = False) -> Dict[str, Any]:
+    """
+    Capture a fight (fighters, sides, round and turn order) as plain JSON data.
+
+    Fighters are indexed in `fight.get_all_individuals()` order.
+
+    Args:
+        fight: Fight to capture
+        live: Add the pickled live states of the fighters under "live"
+            (exact, but no longer JSON: for process boundaries, not records)
+
+    Returns:
+        JSON-serializable state dictionary
+    """
+    fighters = fight.get_all_individuals()
+    index = {id(c): i for i, c in enumerate(fighters)}
+    state = {
+        "name": fight.name,
+        "seed": fight.seed,
+        "round": fight.round,
+        "can_play": [index[id(c)] for c in fight.can_play],
+        "sides": ["A" if c in fight.attackers.fighters else "D" for c in fighters],
+        "fighters": [capture_character(c, index) for c in fighters],
+    }
+    if live:
+        state["live"] = capture_live_states(fighters)
+    return state
+
+
+def restore_fight(state: Dict[str, Any]) -> tuple[Fight, List[Character]]:
+    """
+    Rebuild a new fight from a state captured by `capture_fight`.
+
+    Args:
+        state: State dictionary
+
+    Returns:
+        Tuple of (fight, fighters in captured order)
+    """
+    data = state["fighters"]
+    fighters = [Character.create(d["class"], user_id=d["user_id"], name=d["name"]) for d in data]
+    lives = load_live_states(state["live"], fighters) if "live" in state else [None] * len(fighters)
+    for character, character_state, live in zip(fighters, data, lives):
+        apply_character_state(character, character_state, live, fighters)
+    sides = state["sides"]
+    attackers = [c for c, side in zip(fighters, sides) if side == "A"]
+    defenders = [c for c, side in zip(fighters, sides) if side == "D"]
+    fight = Fight(attackers, defenders, name=state.get("name", ""), seed=state.get("seed"))
+    fight.round = state["round"]
+    fight.can_play = [fighters[i] for i in state["can_play"]]
+    return fight, fighters
+
+
+# Recording ###################################################################
+
+class FightRecorder:
+    """
+    Record a fight so it can be replayed and verified later.
+
+    Usage:
+        fight = Fight(hero, mob, seed=1234)
+        recorder = FightRecorder(fight)
+        while not fight.is_over():
+            fight.start_round()
+        recorder.finish()
+        recorder.save("replays/fight.jsonl")
+    """
+
+    def __init__(self, fight: Fight) -> None:
+        """
+        Attach the recorder to `fight` and capture its initial state.
+
+        Raises:
+            ValueError: If the fight is already recorded
+        """
+        if fight.recorder is not None:
+            raise ValueError("Fight is already being recorded")
+        self.fight = fight
+        self.fighters: List[Character] = fight.get_all_individuals()
+        self._index: Dict[int, int] = {id(c): i for i, c in enumerate(self.fighters)}
+        self.header: Dict[str, Any] = {
+            "type": "header",
+            "version": REPLAY_VERSION,
+            **capture_fight(fight),
+        }
+        self.actions: List[List[Any]] = []
+        self.final: Optional[Dict[str, Any]] = None
+        fight.recorder = self
+
+    def index_of(self, character: Optional[Character]) -> Optional[int]:
+        """Get the replay index of a fighter (None for outsiders)."""
+        if character is None:
+            return None
+        return self._index.get(id(character))
+
+    def record(
+        self,
+        op: str,
+        actor: Optional[Character] = None,
+        target: Optional[Character] = None,
+        skill_name: Optional[str] = None,
+        success: Optional[bool] = None
+    ) -> None:
+        """Append one action to the stream (called by the Fight turn primitives)."""
+        action: List[Any] = [op]
+        if actor is not None:
+            action.append(self.index_of(actor))
+        if op == "A":
+            action.extend([self.index_of(target), int(bool(success))])
+            if skill_name is not None:
+                action.append(skill_name)
+        elif op == "P":
+            action.extend([self.index_of(target), skill_name, int(bool(success))])
+        self.actions.append(action)
+
+    def finish(self) -> Dict[str, Any]:
+        """Capture the final states and detach from the fight."""
+        winner = None
+        if self.fight.is_over():
+            won = self.fight.get_winner()
+            winner = "A" if won is self.fight.attackers else "D" if won is self.fight.defenders else None
+        self.final = {
+            "type": "final",
+            "round": self.fight.round,
+            "winner": winner,
+            "fighters": [capture_character(c, self._index) for c in self.fighters],
+        }
+        if self.fight.recorder is self:
+            self.fight.recorder = None
+        return self.final
+
+    def lines(self) -> List[Any]:
+        """Get the record as a list of JSON-serializable lines."""
+        lines: List[Any] = [self.header, *self.actions]
+        if self.final is not None:
+            lines.append(self.final)
+        return lines
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the record as JSONL to `path`."""
+        if self.final is None:
+            self.finish()
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        with p.open("w", encoding="utf-8") as f:
+            for line in self.lines():
+                f.write(json.dumps(line, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+        return p
+
+
+# Replay ######################################################################
+
+@dataclass
+class ReplayResult:
+    """Outcome of a replay verification."""
+    fight: Fight
+    fighters: List[Character]
+    actions: int = 0
+    mismatches: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+class FightReplay:
+    """Re-execute a recorded fight headlessly and verify its outcome."""
+
+    def __init__(
+        self,
+        header: Dict[str, Any],
+        actions: Sequence[List[Any]],
+        final: Optional[Dict[str, Any]] = None
+    ) -> None:
+        if header.get("version") != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version: {header.get('version')}")
+        self.header = header
+        self.actions = list(actions)
+        self.final = final
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[Any]) -> 'FightReplay':
+        """Build a replay from decoded record lines."""
+        if not lines or not isinstance(lines[0], dict) or lines[0].get("type") != "header":
+            raise ValueError("Replay must start with a header line")
+        final = lines[-1] if isinstance(lines[-1], dict) and lines[-1].get("type") == "final" else None
+        actions = lines[1:-1] if final is not None else lines[1:]
+        return cls(lines[0], actions, final)
+
+    @classmethod
+    def from_recorder(cls, recorder: FightRecorder) -> 'FightReplay':
+        """Build a replay directly from an in-memory recorder."""
+        return cls.from_lines(json.loads(json.dumps(recorder.lines())))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'FightReplay':
+        """Load a JSONL record written by `FightRecorder.save`."""
+        with Path(path).open("r", encoding="utf-8") as f:
+            return cls.from_lines([json.loads(line) for line in f if line.strip()])
+
+    def build_fight(self) -> tuple[Fight, List[Character]]:
+        """Rebuild the fighters and the fight in their recorded initial state."""
+        return restore_fight(self.header)
+
+    def run(self, verify: bool = True) -> ReplayResult:
+        """
+        Re-apply the recorded action stream.
+
+        Args:
+            verify: Compare action outcomes and final states with the record
+
+        Returns:
+            ReplayResult with the replayed fight and any mismatch found
+        """
+        fight, fighters = self.build_fight()
+        result = ReplayResult(fight, fighters)
+
+        def fighter(index: Optional[int]) -> Optional[Character]:
+            return None if index is None else fighters[index]
+
+        for step, action in enumerate(self.actions):
+            op = action[0]
+            if op == "N":
+                fight._new_round()
+            elif op == "Z":
+                fight.rest()
+            elif op == "D":
+                fight._turn_dead(fighter(action[1]))
+            elif op == "S":
+                fight._turn_stunned(fighter(action[1]))
+            elif op == "I":
+                fight._turn_idle(fighter(action[1]))
+            elif op == "A":
+                skill_name = action[4] if len(action) > 4 else None
+                success = fight._turn_attack(fighter(action[1]), fighter(action[2]), skill_name)
+                if verify and int(success) != action[3]:
+                    result.mismatches.append(f"step {step}: attack outcome {success} != recorded {bool(action[3])}")
+            elif op == "P":
+                success = fight.play(fighter(action[1]), fighter(action[2]), action[3])
+                if verify and int(success) != action[4]:
+                    result.mismatches.append(f"step {step}: play outcome {success} != recorded {bool(action[4])}")
+            else:
+                raise ValueError(f"Unknown replay action: {op}")
+            result.actions += 1
+
+        if verify and self.final is not None:
+            result.mismatches.extend(self._compare_final(fight, fighters))
+        return result
+
+    def _compare_final(self, fight: Fight, fighters: List[Character]) -> List[str]:
+        mismatches = []
+        if fight.round != self.final["round"]:
+            mismatches.append(f"round {fight.round} != recorded {self.final['round']}")
+        winner = None
+        if fight.is_over():
+            won = fight.get_winner()
+            winner = "A" if won is fight.attackers else "D" if won is fight.defenders else None
+        if winner != self.final["winner"]:
+            mismatches.append(f"winner {winner} != recorded {self.final['winner']}")
+        index = {id(c): i for i, c in enumerate(fighters)}
+        for i, (character, expected) in enumerate(zip(fighters, self.final["fighters"])):
+            actual = json.loads(json.dumps(capture_character(character, index)))
+            for key in expected:
+                if actual.get(key) != expected[key]:
+                    mismatches.append(f"fighter {i} ({character.name}) {key}: {actual.get(key)} != recorded {expected[key]}")
+        return mismatches
+
+
+def replay_file(path: Union[str, Path]) -> ReplayResult:
+    """Load and verify a recorded fight."""
+    return FightReplay.load(path).run()
@@ -0,0 +1,162 @@
+"""
+Tabular combat policy.
+
+The fight situation of a fighter is reduced to a few discretized features
+(own HP, own energy, damage skills ready, stunned opponents, allies or
+opponents in danger). A table indexed by these features gives the preferred
+action class (which skill family, which target), so a decision costs one
+array lookup and no search. Tables are learned offline by self-play (see
+`jeuxRPG._balance.selfplay`) and stored as NumPy `.npy` files.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+import numpy as np
+
+from jeuxRPG._class._event.confrontation.encounter.policy import FightAction, FightPolicy
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.res.classType import SkillType
+
+if TYPE_CHECKING:
+    from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+
+
+# Action classes
+GREEDY = 0            # let the fight play its greedy turn
+STRONG_WEAKEST = 1    # last ready damage skill on the opponent with the least HP
+STRONG_TOUGHEST = 2   # last ready damage skill on the opponent with the most HP
+LIGHT_WEAKEST = 3     # first ready damage skill on the opponent with the least HP
+SUPPORT_WEAKEST = 4   # ready heal/buff skill on the ally with the lowest HP ratio
+
+ACTION_CLASSES = ("greedy", "strong_weakest", "strong_toughest", "light_weakest", "support_weakest")
+
+HP_BUCKETS = 4
+ENERGY_BUCKETS = 3
+ALLY_DANGER_RATIO = 0.35
+OPPONENT_LOW_RATIO = 0.25
+
+# own HP, own energy, 2+ damage skills ready, opponent stunned, ally in danger, opponent low
+TABLE_SHAPE: Tuple[int, ...] = (HP_BUCKETS, ENERGY_BUCKETS, 2, 2, 2, 2)
+
+
+def _bucket(ratio: float, buckets: int) -> int:
+    return min(buckets - 1, max(0, int(ratio * buckets)))
+
+
+def _hp_ratio(character: Character) -> float:
+    hp = character.hp
+    return max(0, hp.current_value) / hp.value if hp.value > 0 else 0.0
+
+
+def _ready_skills(actor: Character, skill_types: Tuple[SkillType, ...]) -> List[str]:
+    return [
+        name for name, skill in actor.skills.items()
+        if skill.skill_type in skill_types and skill.is_ready() and actor.has_required_energie(skill)
+    ]
+
+
+def encode_state(fight: 'Fight', actor: Character) -> Tuple[int, ...]:
+    """
+    Discretize the situation of `actor` into a `TABLE_SHAPE` index.
+
+    Args:
+        fight: Fight being played
+        actor: Fighter whose turn it is
+
+    Returns:
+        Tuple of feature buckets
+    """
+    allies, opponents = fight.sides_of(actor)
+    living_allies = [c for c in allies if c.is_alive()]
+    living_opponents = [c for c in opponents if c.is_alive()]
+
+    energie = actor.energie[0] if actor.energie else None
+    energie_ratio = energie.current_value / energie.value if energie is not None and energie.value > 0 else 1.0
+
+    return (
+        _bucket(_hp_ratio(actor), HP_BUCKETS),
+        _bucket(energie_ratio, ENERGY_BUCKETS),
+        int(len(_ready_skills(actor, (SkillType.DAMAGE,))) >= 2),
+        int(any(c.is_stun() for c in living_opponents)),
+        int(any(_hp_ratio(c) < ALLY_DANGER_RATIO for c in living_allies)),
+        int(any(_hp_ratio(c) < OPPONENT_LOW_RATIO for c in living_opponents)),
+    )
+
+
+def resolve_action(fight: 'Fight', actor: Character, action_class: int) -> Optional[FightAction]:
+    """
+    Turn an action class into a concrete action for `actor`.
+
+    Returns:
+        FightAction, or None when the class does not apply (greedy turn)
+    """
+    if action_class == GREEDY:
+        return None
+
+    allies, opponents = fight.sides_of(actor)
+    if action_class == SUPPORT_WEAKEST:
+        support = _ready_skills(actor, (SkillType.HEAL, SkillType.BUFF))
+        if not support:
+            return None
+        skill_name = support[0]
+        skill = actor.skills[skill_name]
+        targets = [
+            c for c in allies
+            if c.is_alive() and (c is actor or skill.skill_type != SkillType.HEAL or skill.can_target_others)
+        ]
+        if not targets:
+            return None
+        return FightAction(skill_name, min(targets, key=_hp_ratio))
+
+    damage = _ready_skills(actor, (SkillType.DAMAGE,))
+    targets = [c for c in opponents if c.is_alive()]
+    if not damage or not targets:
+        return None
+    skill_name = damage[0] if action_class == LIGHT_WEAKEST else damage[-1]
+    if action_class == STRONG_TOUGHEST:
+        target = max(targets, key=lambda c: c.hp.current_value)
+    else:
+        target = min(targets, key=lambda c: c.hp.current_value)
+    return FightAction(skill_name, target)
+
+
+class TablePolicy(FightPolicy):
+    """
+    Policy reading the preferred action class from a learned table.
+
+    Attributes:
+        table: Integer array of shape `TABLE_SHAPE` holding action classes
+    """
+
+    def __init__(self, table: np.ndarray) -> None:
+        table = np.asarray(table, dtype=np.int8)
+        if table.shape != TABLE_SHAPE:
+            raise ValueError(f"Policy table must have shape {TABLE_SHAPE}, got {table.shape}")
+        if table.min() < 0 or table.max() >= len(ACTION_CLASSES):
+            raise ValueError("Policy table contains unknown action classes")
+        self.table = table
+
+    @classmethod
+    def greedy(cls) -> 'TablePolicy':
+        """Table that always defers to the greedy turn."""
+        return cls(np.zeros(TABLE_SHAPE, dtype=np.int8))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'TablePolicy':
+        """Load a table saved with `save` (or by the self-play trainer)."""
+        return cls(np.load(Path(path), allow_pickle=False))
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the table as a `.npy` file."""
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        np.save(p, self.table, allow_pickle=False)
+        return p if p.suffix == ".npy" else p.with_name(p.name + ".npy")
+
+    def action_class(self, fight: 'Fight', actor: Character) -> int:
+        """Get the preferred action class of `actor` in its current situation."""
+        return int(self.table[encode_state(fight, actor)])
+
+    def choose(self, fight: 'Fight', actor: Character) -> Optional[FightAction]:
+        return resolve_action(fight, actor, self.action_class(fight, actor))
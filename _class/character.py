@@ -11,13 +11,11 @@ The Character class uses mixins to separate responsibilities:
 - SkillMixin: Skill usage and management
 - ProgressionMixin: Experience and leveling
 - CombatMixin: Attack and heal actions
+- StateMixin: Combat state snapshot and restore
 """
 
 
 from abc import ABC, ABCMeta
-from copy import deepcopy
-import json
-import os
 from typing import Dict, List, Optional, Type, Union
 
 from jeuxRPG._class.mixins import (
@@ -28,22 +26,19 @@ from jeuxRPG._class.mixins import (
     ProgressionMixin,
     CombatMixin,
     NavigationMixin,
+    StateMixin,
 )
-from jeuxRPG._class.res.character.alteration import alteration as alteration_file
 from jeuxRPG._class.res.character.invocation.invocation_pocket import InvocationPocket
 from jeuxRPG._class.res.character.stats.basic_stat import (
     HP, AttributeStat, Endurance, Energie, Force, Intelligence, Sagesse, VitalStat
 )
 from jeuxRPG._class.res.character.stats.stat import DefaultStat
+from jeuxRPG._class.res.class_table import ClassTableView
 from jeuxRPG._class.res.classType import ClassType
 from jeuxRPG._class.res.dictType import ClassSkills, ClassTable
-from jeuxRPG._class.skills.skill import Skill
-from jeuxRPG._class.stats.status_dict_type import Status_Dict_type
-
-json_path = os.path.join(os.path.dirname(alteration_file.__file__), "alteration.json")
-
-with open(json_path, "r", encoding="utf-8") as f:
-    status_dict: Status_Dict_type = json.load(f)
+from jeuxRPG._class.skills.skill import CharacterSkill, Skill, bind_skills
+from jeuxRPG._class.stats.rest_clock import RestClock
+from jeuxRPG._class.stats.status import CharacterStatus
 
 
 class CharacterMeta(ABCMeta):
@@ -81,6 +76,7 @@ class Character(
     ProgressionMixin,
     CombatMixin,
     NavigationMixin,
+    StateMixin,
     ABC,
     metaclass=CharacterMeta
 ):
@@ -94,6 +90,7 @@ class Character(
     - SkillMixin: Skill usage and management
     - ProgressionMixin: Experience and leveling
     - CombatMixin: Combat actions
+    - StateMixin: Combat state snapshot and restore
     
     Attributes:
         is_playable: Whether this class can be selected by players (False for mobs)
@@ -205,32 +202,39 @@ class Character(
         self.name = name
         self.char_class = char_class or self.__class__.__name__
         
+        # Shared class table, character-specific changes go to its override layer
+        self.class_table = ClassTableView(class_table)
+
         # Initialize base stats
-        base_stats = class_table["base_stats"]
+        base_stats = self.class_table["base_stats"]
         self.hp = HP(base_stats["hp"])
         self.force = Force(base_stats["force"])
         self.endurance = Endurance(base_stats["endurance"])
         self.intelligence = Intelligence(base_stats["intelligence"])
         self.sagesse = Sagesse(base_stats["sagesse"])
-        self.class_table = deepcopy(class_table)
         
-        # Initialize energy systems
+        self.status = CharacterStatus()
+
+        # Rests taken: energies and skill cooldowns catch up on it when read
+        self._rest_clock = RestClock()
+
+        # Initialize energy systems (indexed by class and name, see EnergyMixin)
+        self._energie_index: Dict[Type[Energie], Energie] = {}
         self.energie: List[Energie] = []
         for num in base_stats["energie"].keys():
             energie_info = base_stats["energie"][num]
             self.add_energie(energie_info["type"](energie_info["value"], energie_info["regen_rate"]))
         
-        self._class_type: ClassType = class_table["class_type"]
+        self._class_type: ClassType = self.class_table["class_type"]
         try:
             if self.class_type == ClassType.INVOCATION:
-                class_skills: ClassSkills = class_table["class_skills_dict"][self.level].copy()
+                class_skills: ClassSkills = self.class_table["class_skills_dict"][self.level].copy()
             else:
-                class_skills: Dict[str, Skill] = class_table["class_skills_dict"]["level 1"].copy()
+                class_skills: Dict[str, Skill] = self.class_table["class_skills_dict"]["level 1"].copy()
         except:
             class_skills = {}
         
-        self.skills = deepcopy(skills) if skills else deepcopy(class_skills)
-        self.status = deepcopy(status_dict)  # Deep copy to avoid shared state between instances
+        self.skills: Dict[str, CharacterSkill] = bind_skills(skills or class_skills, self._rest_clock)
         
         # Initialize status effects and stats references
         self._init_status_stats()
@@ -247,8 +251,8 @@ class Character(
             pass
     
     def _init_status_stats(self) -> None:
-        """Initialize the status dictionary with references to character stats."""
-        self.status["stats"] = {
+        """Initialize the status stats index with references to character stats."""
+        self.status.stats = {
             self.hp.name: self.hp,
             self.force.name: self.force,
             self.endurance.name: self.endurance,
@@ -336,15 +340,19 @@ class Character(
         Raises:
             TypeError: If stat doesn't exist
         """
-        stat_dict: Dict[str, Union[DefaultStat, AttributeStat, VitalStat]] = self.status["stats"]
+        stat_dict: Dict[str, Union[DefaultStat, AttributeStat, VitalStat]] = self.status.stats
         
         # Check main stats
         if stat_name in stat_dict:
             return stat_dict[stat_name]
         
-        # Check energy stats
-        if stat_name in stat_dict["energie"]:
-            return stat_dict["energie"][stat_name]
+        # Check energy stats (a stale entry after Energie.change_type rebuilds the index)
+        energie = stat_dict["energie"].get(stat_name)
+        if energie is None or energie.name != stat_name:
+            self._index_energies()
+            energie = stat_dict["energie"].get(stat_name)
+        if energie is not None:
+            return energie
             
         raise TypeError(f"{stat_name} not found in character stats")
 
@@ -12,6 +12,7 @@ from .skill_mixin import SkillMixin
 from .progression_mixin import ProgressionMixin
 from .combat_mixin import CombatMixin
 from .navigation_mixin import NavigationMixin
+from .state_mixin import StateMixin
 
 __all__ = [
     "HealthMixin",
@@ -21,4 +22,5 @@ __all__ = [
     "ProgressionMixin",
     "CombatMixin",
     "NavigationMixin",
+    "StateMixin",
 ]
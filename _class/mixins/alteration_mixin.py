@@ -4,7 +4,7 @@ Alteration management mixin for Character class.
 Handles buffs, debuffs, stuns, status effects, and damage over time.
 """
 
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
 
 from jeuxRPG._class.res.character.alteration import alteration as alteration_file
 from jeuxRPG._class.res.character.stats.stat import DefaultStat
@@ -78,7 +78,7 @@ class AlterationMixin:
             
         try:
             stun = alteration_file.Stun(stun_name, origin, duration, self)
-            self.status["alteration"]["stun"].append(stun)
+            self.status.alteration.stun.append(stun)
             plural = "s" if duration > 1 else ""
             return True, f"💫 {self.name} was stunned by {origin.name} for {duration} round{plural}!", stun
         except Exception as e:
@@ -94,7 +94,7 @@ class AlterationMixin:
         Returns:
             True if removed, False if not found
         """
-        stun_list = self.status["alteration"].get("stun", [])
+        stun_list = self.status.stuns
         if stun in stun_list:
             stun_list.remove(stun)
             return True
@@ -107,9 +107,10 @@ class AlterationMixin:
         Returns:
             Number of stuns removed
         """
-        stun_list = self.status["alteration"].get("stun", [])
+        stun_list = self.status.stuns
         count = len(stun_list)
-        stun_list.clear()
+        if count:
+            stun_list.clear()
         return count
     
     def get_stuns(self: 'Character') -> List[alteration_file.Stun]:
@@ -119,7 +120,7 @@ class AlterationMixin:
         Returns:
             List of active Stun objects
         """
-        return self.status["alteration"].get("stun", []).copy()
+        return list(self.status.stuns)
     
     def get_stun_duration(self: 'Character') -> int:
         """
@@ -158,7 +159,7 @@ class AlterationMixin:
             stat = self.get_stat(stat_target.__name__)
             debuff = alteration_file.DeBuff(debuff_name, origin, value, duration, self, stat_target)
             stat.add_debuff(debuff)
-            self.status["alteration"]["debuff"].append(debuff)
+            self.status.alteration.debuff.append(debuff)
             return True, f"{self.name} was debuffed with {debuff_name}, the stat {stat_target.__name__} gets -{value} for {duration} rounds", debuff
         except Exception as e:
             return False, f"Error in debuff_stat: {e}", None
@@ -188,7 +189,7 @@ class AlterationMixin:
             stat = self.get_stat(stat_target.__name__)
             buff = alteration_file.Buff(buff_name, origin, value, duration, self, stat_target)
             stat.add_buff(buff)
-            self.status["alteration"]["buff"].append(buff)
+            self.status.alteration.buff.append(buff)
             return True, f"{self.name} was buffed with {buff_name}, the stat {stat_target.__name__} gets +{value} for {duration} rounds", buff
         except Exception as e:
             return False, f"Error in buff_stat: {e}", None
@@ -200,10 +201,8 @@ class AlterationMixin:
         Returns:
             True if character has at least one active stun effect
         """
-        stuns = self.status["alteration"].get("stun", [])
-        # Filter out expired stuns
-        active_stuns = [s for s in stuns if not s.is_over()]
-        return len(active_stuns) > 0
+        # Ended stuns leave the list with the round they end on
+        return len(self.status.stuns) > 0
     
     def is_stunned(self: 'Character') -> bool:
         """Alias for is_stun() for better readability."""
@@ -211,16 +210,16 @@ class AlterationMixin:
     
     def will_be_hit(self: 'Character') -> bool:
         """Check if character has incoming damage effects."""
-        return bool(self.status["alteration"]["Damage"].get("Incoming", []))
+        return bool(self.status.dots)
     
     def is_invulnerable(self: 'Character') -> bool:
         """Check if character is invulnerable."""
-        return bool(self.status["alteration"].get("invulnerability", []))
+        return bool(self.status.invulnerabilities)
     
     def have_reduction(self: 'Character') -> bool:
         """Check if character has any damage reduction effects."""
-        r = self.status["alteration"]["Damage"].get("Reduction", {"-": [], "+": [], "%": []})
-        return any(r["-"]) or any(r["+"]) or any(r["%"])
+        r = self.status.reduction
+        return any(r.minus) or any(r.plus) or any(r.percent)
     
     def check_state(self: 'Character') -> List[Tuple[str, bool]]:
         """
@@ -244,40 +243,25 @@ class AlterationMixin:
         Returns:
             List of (message, alteration) for expired effects
         """
-        stats_dict: Dict[str, DefaultStat] = self.status["stats"]
+        stats_dict: Dict[str, DefaultStat] = self.status.stats
         for stat in stats_dict.values():
             if isinstance(stat, DefaultStat):
                 stat.end_round()
         
-        # Update and remove expired alterations
-        alterations_dict = self.status["alteration"]
-        alteration_remove: List[Tuple[str, alteration_file.Alteration]] = []
-        
-        for alterations_type in ["stun", "invulnerability"]:
-            alterations_type: Literal["stun", "invulnerability"]
-            alterations = alterations_dict[alterations_type]
-            for a in alterations:
-                a.decrease()
-                if a.is_over():
-                    alterations.remove(a)
-                    alteration_remove.append((f"{self.name} is not longuer affected by {a.name}", a))
+        # Only the DoTs (every round) and the alterations ending this round are touched
+        alterations = self.status.get_alteration()
+        if alterations is None:
+            return [("", None)]
 
-        dot_list = alterations_dict["Damage"]["Incoming"]
-        dot_list: List[alteration_file.Dot]
-        for dot in dot_list:
+        # DoTs hit before the round ends; a snapshot as lose_hp may change the list
+        for dot in tuple(alterations.incoming):
             if not isinstance(dot, alteration_file.Dot):
                 raise TypeError("a dot is not a Dot")
             self.lose_hp(dot.get_caster(), dot.value)
-            dot.decrease()
-        
-        reduction = alterations_dict["Damage"]["Reduction"]
-        for type_key in reduction:
-            for res in reduction[type_key]:
-                res.decrease()
-                if res.is_over():
-                    reduction[type_key].remove(res)
-                    alteration_remove.append((f"{self.name} is not longuer affected by {res.name}", res))
-        
+
+        alteration_remove: List[Tuple[str, alteration_file.Alteration]] = [
+            (f"{self.name} is not longuer affected by {a.name}", a) for a in alterations.advance()
+        ]
         alteration_remove = [("", None)] if alteration_remove == [] else alteration_remove
         
         return alteration_remove
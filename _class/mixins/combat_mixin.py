@@ -38,9 +38,32 @@ class CombatMixin:
         Returns:
             Tuple of (success, message)
         """
+        success, message, _ = self.perform_attack(target, skill_name)
+        return success, message
+
+    def perform_attack(
+        self: 'Character',
+        target: 'Character',
+        skill_name: Optional[str] = None
+    ) -> Tuple[bool, str, Optional[str]]:
+        """
+        Same as `attack`, also telling which skill was used.
+
+        Without `skill_name` the skill is picked here (most powerful damage
+        skill that works): the fight records the name returned so a replay
+        uses that skill instead of picking again.
+
+        Args:
+            target: Character to attack
+            skill_name: Optional specific skill to use
+
+        Returns:
+            Tuple of (success, message, name of the skill used or None)
+        """
         success = False
         message = t("combat.no_attack_skill")
-        
+        used = skill_name
+
         if skill_name:
             success, message = self.use_skill(skill_name, target)
         else:
@@ -49,6 +72,7 @@ class CombatMixin:
                     continue
                 success, message = self.use_skill(skill.name, target)
                 if success:
+                    used = skill.name
                     break
         
         updates = self._update_status()
@@ -56,7 +80,7 @@ class CombatMixin:
             extra_msgs = [m for m, _ in updates if m]
             if extra_msgs:
                 message = f"{message}  {' '.join(extra_msgs)}"
-        return success, message
+        return success, message, used
 
     def heal(
         self: 'Character', 
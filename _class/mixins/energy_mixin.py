@@ -4,13 +4,13 @@ Energy management mixin for Character class.
 Handles energy systems, consumption, regeneration, and management.
 """
 
-from typing import TYPE_CHECKING, List, Type
+from typing import TYPE_CHECKING, Type
 
 from jeuxRPG.i18n import t
+from jeuxRPG._class.res.character.stats.basic_stat import Energie
 
 if TYPE_CHECKING:
     from jeuxRPG._class.character import Character
-    from jeuxRPG._class.res.character.stats.basic_stat import Energie
 
 
 class EnergyMixin:
@@ -21,7 +21,28 @@ class EnergyMixin:
     - Energy consumption
     - Energy regeneration
     - Energy type management (add, change, get)
+
+    Energies are indexed by class (every `Energie` subclass of their type,
+    first one in `self.energie` order wins, like the former linear scan) and
+    by name in `status.stats["energie"]`. `add_energie`, `change_energie` and
+    `restore_state` rebuild the index; a stat converted in place with
+    `change_type` is caught at lookup time and triggers a rebuild.
+
+    Indexed energies are attached to the character's `RestClock`, so a rest
+    no longer walks them (see `Energie._sync_current`).
     """
+
+    def _index_energies(self: 'Character') -> None:
+        """Rebuild the class and name indexes of `self.energie`."""
+        by_type = {}
+        for energie in self.energie:
+            energie.attach_clock(self._rest_clock)
+            for cls in type(energie).__mro__:
+                if not issubclass(cls, Energie):
+                    break
+                by_type.setdefault(cls, energie)
+        self._energie_index = by_type
+        self.status.stats["energie"] = {energie.name: energie for energie in self.energie}
     
     def has_required_energie(self: 'Character', skill) -> bool:
         """
@@ -92,6 +113,7 @@ class EnergyMixin:
         if any(isinstance(e, type(energie)) for e in self.energie):
             raise ValueError(f"{energie.name} is already in the energy's list of {self.name}")
         self.energie.append(energie)
+        self._index_energies()
 
     def change_energie(self: 'Character', old_energie: Type['Energie'], new_energie: 'Energie') -> None:
         """
@@ -106,7 +128,9 @@ class EnergyMixin:
         """
         for i, energie in enumerate(self.energie):
             if isinstance(energie, old_energie):
+                energie.attach_clock(None)
                 self.energie[i] = new_energie
+                self._index_energies()
                 return
         raise TypeError(f"{old_energie.__name__} is not in the energy's list of {self.name}")
 
@@ -123,7 +147,12 @@ class EnergyMixin:
         Raises:
             TypeError: If energy type doesn't exist
         """
-        for energie in self.energie:
-            if isinstance(energie, energie_type):
-                return energie
+        energie = self._energie_index.get(energie_type)
+        if energie is not None and isinstance(energie, energie_type):
+            return energie
+        # Miss or stat converted by change_type: the index is rebuilt once
+        self._index_energies()
+        energie = self._energie_index.get(energie_type)
+        if energie is not None:
+            return energie
         raise TypeError(f"{energie_type.__name__} is not in the energy's list of {self.name}")
@@ -7,6 +7,7 @@ Handles HP, damage, healing, death, and resurrection.
 from typing import TYPE_CHECKING, Dict, List
 
 from jeuxRPG.i18n import t
+from jeuxRPG._class.skills.damage_pipeline import apply_endurance
 
 if TYPE_CHECKING:
     from jeuxRPG._class.character import Character
@@ -30,7 +31,7 @@ class HealthMixin:
     
     def _get_reduction(self: 'Character') -> Dict[str, List[int]]:
         """Get damage reduction stats from status effects."""
-        return self.status["alteration"]["Damage"]["Reduction"]
+        return self.status.reduction
     
     def _compute_damage(self: 'Character', amount: float) -> float:
         """
@@ -69,15 +70,6 @@ class HealthMixin:
         Raises:
             ValueError: If amount is not positive
         """
-        def clamp_reduction() -> int:
-            import math
-            endurance = self.get_stat("Endurance").current_value
-            L = 0.9
-            k = 0.02
-            x0 = 150
-            
-            return int((L / (1 + math.exp(-k * (endurance - x0)))) * 100)
-        
         if amount <= 0:
             raise ValueError("HP loss must be positive")
         
@@ -88,9 +80,7 @@ class HealthMixin:
             amount = int(self._compute_damage(amount))
         
         # Apply endurance-based damage reduction
-        reduction = clamp_reduction()
-        
-        amount = int(amount * (1 - (reduction/100)))
+        amount = apply_endurance(amount, self.get_stat("Endurance").current_value)
         
         self.hp.current_value = max(0, self.hp.current_value - amount)
 
@@ -125,7 +115,7 @@ class HealthMixin:
     
     def _check_death(self: 'Character') -> bool:
         """Check if character should die from status effects."""
-        return self.status.get("Death_in", 0) == 0
+        return self.status.death_in == 0
     
     def resurrect(self: 'Character', reviver: 'Character') -> str:
         """
@@ -4,14 +4,11 @@ Progression management mixin for Character class.
 Handles experience, leveling up, and stat upgrades.
 """
 
-from collections import defaultdict
-from copy import deepcopy
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from jeuxRPG.i18n import t
-from jeuxRPG._class.res.character.stats.basic_stat import (
-    HP, Endurance, Force, Intelligence, Sagesse
-)
+from jeuxRPG._class.res.level_table import LevelTable, exp_to_reach, level_for_exp, level_table
+from jeuxRPG._class.skills.skill import bind_skills
 
 if TYPE_CHECKING:
     from jeuxRPG._class.character import Character
@@ -80,67 +77,81 @@ class ProgressionMixin:
         """Calculate XP needed for next level."""
         return self.level * 100
 
+    def level_table(self: 'Character') -> LevelTable:
+        """Cumulative progression table of the character's class."""
+        return level_table(self.class_table["upgrade_stats"], self.class_skills_dict)
+
     def level_up(self: 'Character') -> str:
         """
-        Récursivement augmente le niveau du personnage si assez d'XP.
-        Cumule les bonus dans self.tmp.
-        Retourne un message final unique.
+        Passe d'un coup tous les niveaux que l'XP permet.
+        Retourne un message final unique (bonus cumulés).
         """
-        if not hasattr(self, "tmp"):
-            self.tmp = {
-                "start_level": self.level,
-                "stats": defaultdict(int),
-                "energies": defaultdict(int),
-                "new_energies": []
-            }
-
         if not self.can_level_up():
-            if self.level == self.tmp["start_level"]:
-                needed_xp = self._required_exp_for_next_level() - self.exp
-                return t("progression.need_more_xp", name=self.name, amount=needed_xp)
+            needed_xp = self._required_exp_for_next_level() - self.exp
+            return t("progression.need_more_xp", name=self.name, amount=needed_xp)
 
-            # Construction du message final unique
-            final_msg = [t("progression.level_up", name=self.name, from_level=self.tmp['start_level'], to_level=self.level)]
+        start_level = self.level
+        reached = exp_to_reach(start_level) + self.exp
+        target = level_for_exp(reached)
+        self.exp = reached - exp_to_reach(target)
+        stats, energies, new_energies = self._advance_levels(target)
 
-            for stat, value in self.tmp["stats"].items():
-                final_msg.append(t("progression.stat_up", stat_name=stat, value=value))
-            for energy, value in self.tmp["energies"].items():
-                final_msg.append(t("progression.energy_up", energy_name=energy, value=value))
-            for energy_type in self.tmp["new_energies"]:
-                final_msg.append(t("progression.new_energy", energy_type=energy_type))
+        # Construction du message final unique
+        final_msg = [t("progression.level_up", name=self.name, from_level=start_level, to_level=self.level)]
 
-            del self.tmp
-            return "\n".join(final_msg)
+        for stat_type, value in stats.items():
+            final_msg.append(t("progression.stat_up", stat_name=stat_type.__name__, value=value))
+        for energy_type, value in energies.items():
+            final_msg.append(t("progression.energy_up", energy_name=energy_type.__name__, value=value))
+        for energy_type in new_energies:
+            final_msg.append(t("progression.new_energy", energy_type=energy_type.__name__))
 
-        self.exp -= self._required_exp_for_next_level()
-        self.level += 1
-        
-        for level_skills_dict in self.class_skills_dict.keys():
-            if level_skills_dict == "level " + str(self.level):
-                self.skills.update(deepcopy(self.class_skills_dict[level_skills_dict]))
-        
-        upgrades: Dict[int, Dict] = self.class_table["upgrade_stats"]
-        for threshold in sorted(upgrades.keys()):
-            if self.level < threshold:
-                continue
-            upgrade_data = upgrades[threshold]
-
-            for stat_type, value in upgrade_data.items():
-                if stat_type in (HP, Force, Endurance, Intelligence, Sagesse):
-                    stat = self.get_stat(stat_type.__name__)
-                    stat.upgrade_base_value(value)
-                    self.tmp["stats"][stat_type.__name__] += value
-
-            if "Energie" in upgrade_data:
-                for energy_type, value in upgrade_data["Energie"].items():
-                    energy = self.get_energie(energy_type)
-                    energy.upgrade_base_value(value)
-                    self.tmp["energies"][energy_type.__name__] += value
-
-            if "new" in upgrade_data and "Energie" in upgrade_data["new"]:
-                for energy_type, base_value in upgrade_data["new"]["Energie"].items():
+        return "\n".join(final_msg)
+
+    def set_level(self: 'Character', level: int) -> None:
+        """
+        Amène le personnage au niveau `level` en une fois, exactement comme
+        une montée niveau par niveau (l'XP en cours est conservée).
+        Ne fait rien si le personnage a déjà ce niveau.
+
+        Raises:
+            ValueError: If level is not a positive integer
+        """
+        if not isinstance(level, int) or level < 1:
+            raise ValueError("Level must be a positive integer")
+        if level > self.level:
+            self._advance_levels(level)
+
+    def _advance_levels(self: 'Character', target: int) -> Tuple[Dict[type, int], Dict[type, int], List[type]]:
+        """
+        Applique les niveaux self.level < L <= target en une étape.
+
+        Même état final que niveau par niveau : sorts de chaque niveau dans
+        l'ordre, énergies "new" des paliers atteints (une fois chacune), puis
+        la somme des bonus de stats et d'énergies de chaque niveau.
+
+        Returns:
+            (stat gains, energy gains, new energy types)
+        """
+        table = self.level_table()
+        start, self.level = self.level, target
+
+        for new_skills in table.skills_between(start, target):
+            self.skills.update(bind_skills(new_skills, self._rest_clock))
+
+        # La table est partagée : les "new" déjà accordés sont notés sur le personnage
+        new_energies = []
+        for threshold, energies in table.new_energies_until(target):
+            if self.class_table.claim_upgrade(threshold):
+                for energy_type, base_value in energies.items():
                     self.add_energie(energy_type(base_value))
-                    self.tmp["new_energies"].append(energy_type.__name__)
-                upgrade_data.pop("new")
+                    new_energies.append(energy_type)
+
+        stats = table.stat_gains(start, target)
+        for stat_type, value in stats.items():
+            self.get_stat(stat_type.__name__).upgrade_base_value(value)
+        energies = table.energy_gains(start, target)
+        for energy_type, value in energies.items():
+            self.get_energie(energy_type).upgrade_base_value(value)
 
-        return self.level_up()
+        return stats, energies, new_energies
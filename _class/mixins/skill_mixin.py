@@ -103,12 +103,11 @@ class SkillMixin:
         return self.skills.copy()
     
     def rest(self: 'Character') -> str:
-        """Restore energy and reduce skill cooldowns."""
-        # Regenerate energy
-        for energie in self.energie:
-            energie.regenerate()
-        
-        # Reduce skill cooldowns
-        for skill in self.skills.values():
-            skill.update_cooldown()
+        """
+        Restore energy and reduce skill cooldowns.
+
+        O(1): only the rest clock ticks; energies regenerate and cooldowns
+        count down from it when they are next read.
+        """
+        self._rest_clock.tick()
         return ""
@@ -0,0 +1,108 @@
+"""
+Value-state mixin for Character class.
+
+Captures and restores the mutable combat state of a character as plain
+tuples, so fights can be rewound cheaply (AI look-ahead, what-if analysis).
+"""
+
+from typing import TYPE_CHECKING, Tuple
+
+if TYPE_CHECKING:
+    from jeuxRPG._class.character import Character
+
+
+class StateMixin:
+    """
+    Mixin providing cheap snapshot/restore of the combat state.
+
+    The state only holds values and references to the objects already owned by
+    the character (stats, alterations, skills); nothing is copied deeply and
+    nothing outside of combat (i18n, navigation, team graph) is touched.
+    """
+
+    def _timed_alterations(self: 'Character') -> Tuple[list, ...]:
+        """Alteration lists whose entries expire or get removed individually."""
+        alterations = self.status.get_alteration()
+        if alterations is None:
+            return ((),) * 6
+        return alterations.timed_lists()
+
+    def snapshot_state(self: 'Character') -> Tuple:
+        """
+        Capture the mutable combat state of the character.
+
+        Returns:
+            Opaque tuple to give back to `restore_state`
+        """
+        stats = (self.hp, self.force, self.endurance, self.intelligence, self.sagesse, *self.energie)
+        timed = self._timed_alterations()
+        durations = [
+            (alteration, alteration.duration)
+            for stat in stats if stat.buffs or stat.debuffs
+            for alteration in (*stat.buffs, *stat.debuffs)
+        ]
+        timed_items = tuple([tuple(items) for items in timed])
+        for items in timed_items:
+            for alteration in items:
+                durations.append((alteration, alteration.duration))
+
+        alterations = self.status.get_alteration()
+        return (
+            self.level,
+            self.exp,
+            tuple(self.energie),
+            tuple([stat.snapshot() for stat in stats]),
+            tuple(self.skills.items()),
+            tuple([skill.current_cooldown for skill in self.skills.values()]),
+            len(alterations.buff) if alterations else 0,
+            len(alterations.debuff) if alterations else 0,
+            timed_items,
+            durations,
+            tuple(self.invocations.invocations),
+            self.class_table.claimed_upgrades,
+        )
+
+    def restore_state(self: 'Character', state: Tuple) -> None:
+        """
+        Restore a state captured by `snapshot_state`.
+
+        Args:
+            state: Tuple returned by `snapshot_state` on this character
+        """
+        (
+            self.level,
+            self.exp,
+            energie,
+            stat_states,
+            skills,
+            cooldowns,
+            nb_buff,
+            nb_debuff,
+            timed_items,
+            durations,
+            invocations,
+            claimed_upgrades,
+        ) = state
+
+        self.energie[:] = energie
+        self._index_energies()
+        stats = (self.hp, self.force, self.endurance, self.intelligence, self.sagesse, *energie)
+        for stat, stat_state in zip(stats, stat_states):
+            stat.restore(stat_state)
+
+        if len(self.skills) != len(skills):
+            self.skills = dict(skills)
+        for (_, skill), cooldown in zip(skills, cooldowns):
+            skill.current_cooldown = cooldown
+
+        alterations = self.status.get_alteration()
+        if alterations is not None:
+            del alterations.buff[nb_buff:]
+            del alterations.debuff[nb_debuff:]
+            for items, saved in zip(self._timed_alterations(), timed_items):
+                items[:] = saved
+        for alteration, duration in durations:
+            alteration.duration = duration
+
+        self.invocations.invocations[:] = invocations
+        self.class_table.claimed_upgrades = claimed_upgrades
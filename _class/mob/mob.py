@@ -40,7 +40,7 @@ class Mob(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=mob_table.copy(),
+            class_table=mob_table,
         )
         self.is_boss = is_boss
         if xp_drop > 0:
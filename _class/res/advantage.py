@@ -7,6 +7,7 @@ class Advantage():
     def __init__(self):
         self.weakness : list[DamageType] = []
         self.resilience : list[DamageType] = []
+        self.revision : int = 0
     
     def __contains__(self, type : DamageType) -> bool:
         return not self.is_neutre_to(type)
@@ -38,23 +39,28 @@ class Advantage():
     def add_weakness(self, type : DamageType) -> bool:
         if not self.is_neutre_to(type): raise TypeError(f"the type is not neutre for {self}")
         self.weakness.append(type)
+        self.revision += 1
     
     def add_resilience(self, type : DamageType) -> bool:
         if not self.is_neutre_to(type): raise TypeError(f"the type is not neutre for {self}")
         self.resilience.append(type)
+        self.revision += 1
     
     def del_weakness(self, type : DamageType) -> None:
         if not self.is_weak_to(type): raise TypeError(f"the type {type.name} is not in {self.weakness}")
         self.weakness.remove(type)
+        self.revision += 1
     
     def del_resilience(self, type : DamageType) -> None:
         if not self.is_resilient_to(type): raise TypeError(f"the type {type.name} is not in {self.resilience}")
         self.resilience.remove(type)
+        self.revision += 1
     
     def change_all_advantage(self) -> None:
         tmp = self.weakness
         self.weakness = self.resilience
         self.resilience = tmp
+        self.revision += 1
     
     def add_for_all(self, type : DamageType) -> None:
         if not self.is_resilient_to(type):
@@ -27,10 +27,29 @@ class Alteration():
         self.name = name
         self.caster = caster
         self.value = value
-        self.duration = time
+        # Attached to a stat, the remaining duration is read from the stat's
+        # round counter (see DefaultStat) instead of being stored here
+        self._holder = None
+        self._expires = 0
+        self._applied = 0
+        self._duration = time
         self.target = target
         self.stat_target = stat_target
         self.type = alterationType
+
+    @property
+    def duration(self) -> int:
+        holder = self._holder
+        if holder is None:
+            return self._duration
+        return self._expires - holder.round
+
+    @duration.setter
+    def duration(self, value: int) -> None:
+        if self._holder is None:
+            self._duration = value
+        else:
+            self._holder.reschedule(self, value)
     
     def get_value(self) -> int:
         return self.value
@@ -1,5 +1,8 @@
+from typing import Optional
+
 from jeuxRPG.i18n import t
 from jeuxRPG._class.res.character.stats.stat import DefaultStat
+from jeuxRPG._class.stats.rest_clock import RestClock
 
 
 class Energie(DefaultStat):
@@ -9,7 +12,14 @@ class Energie(DefaultStat):
         name (str): Nom du type d'énergie
         max_value (int): Valeur maximale de l'énergie
         regen_rate (float): Taux de régénération par tour
+
+    Une énergie rattachée au `RestClock` de son personnage ne régénère pas
+    à chaque repos : elle garde (valeur courante, repos vus) et rejoue les
+    régénérations manquées dans `_sync_current`, avant toute lecture ou
+    écriture de la valeur courante.
     """
+
+    __slots__ = ("_regen_rate", "_clock", "_rested")
     
     def __init__(self, value: int, regen_rate: float = 0.3):
         """Initialise une énergie avec son nom, sa valeur et son taux de régénération.
@@ -19,8 +29,42 @@ class Energie(DefaultStat):
             value: Valeur maximale initiale
             regen_rate: Taux de régénération (fraction de max_value par tour)
         """
+        self._clock: Optional[RestClock] = None
+        self._rested = 0
         super().__init__(value)
         self._regen_rate = regen_rate 
+
+    @DefaultStat.current_value.getter
+    def current_value(self) -> int:
+        clock = self._clock
+        if clock is not None and clock.rests != self._rested:
+            self._sync_current()
+        return self._current_value
+
+    def _sync_current(self) -> None:
+        """Rejoue les `regenerate` des repos pris depuis le dernier accès."""
+        clock = self._clock
+        if clock is None:
+            return
+        pending = clock.rests - self._rested
+        self._rested = clock.rests
+        if pending <= 0:
+            return
+        regen_amount = int(self.value * self._regen_rate)
+        current = self._current_value
+        if regen_amount >= 0:
+            self._current_value = min(self.value, current + pending * regen_amount)
+        else:
+            self._current_value = min(self.value, current + regen_amount) + (pending - 1) * regen_amount
+
+    def attach_clock(self, clock: Optional[RestClock]) -> None:
+        """Rattache l'énergie au compteur de repos d'un personnage (None : détachée)."""
+        if clock is self._clock:
+            return
+        self._sync_current()
+        self._clock = clock
+        if clock is not None:
+            self._rested = clock.rests
         
     @property
     def regen_rate(self) -> float:
@@ -28,12 +72,14 @@ class Energie(DefaultStat):
         
     @regen_rate.setter
     def regen_rate(self, value: float) -> None:
+        self._sync_current()  # les repos passés régénèrent à l'ancien taux
         self._regen_rate = max(0.0, min(0.1, value))
         
     def regenerate(self) -> None:
         """Régénère l'énergie selon le taux de régénération."""
+        self._sync_current()
         regen_amount = int(self.value * self.regen_rate)
-        self._current_value = min(self.value, self.current_value + regen_amount)
+        self._current_value = min(self.value, self._current_value + regen_amount)
     
     def change_type(self,new_type):
         if not issubclass(new_type, Energie) : raise TypeError("Can only convert to Energie subclasses")
@@ -48,6 +94,8 @@ class Energie(DefaultStat):
 
 class VitalStat(DefaultStat):
     """Classe de base pour les statistiques vitales comme les HP."""
+
+    __slots__ = ()
     
     def __init__(self, value: int):
         super().__init__(value)
@@ -68,6 +116,8 @@ class VitalStat(DefaultStat):
 
 class AttributeStat(DefaultStat):
     """Classe de base pour les attributs de caractère (Force, Intelligence, etc.)."""
+
+    __slots__ = ()
     
     def __init__(self, value: int):
         super().__init__(value)
@@ -89,6 +139,8 @@ class AttributeStat(DefaultStat):
 
 class HP(VitalStat):
     """Points de vie (Hit Points)."""
+
+    __slots__ = ()
     
     def __init__(self, value: int):
         super().__init__(value)
@@ -105,24 +157,32 @@ class HP(VitalStat):
 
 class Mana(Energie):
     """Énergie magique utilisée pour les sorts."""
+
+    __slots__ = ()
     
     def __init__(self, value: int, regen_rate: float = 0.15):
         super().__init__(value, regen_rate)
 
 class Aura(Energie):
     """Énergie spirituelle utilisée pour les capacités spéciales."""
+
+    __slots__ = ()
     
     def __init__(self, value: int, regen_rate: float = 0.1):
         super().__init__(value, regen_rate)
 
 class Ki(Energie):
     """Énergie interne utilisée pour les techniques martiales."""
+
+    __slots__ = ()
     
     def __init__(self, value: int, regen_rate: float = 0.2):
         super().__init__(value, regen_rate)
 
 class Foie(Energie):
     """Énergie de courage utilisée pour les capacités défensives."""
+
+    __slots__ = ()
     
     def __init__(self, value: int, regen_rate: float = 0.05):
         super().__init__(value, regen_rate)
@@ -131,24 +191,32 @@ class Foie(Energie):
 
 class Force(AttributeStat):
     """Force physique brute."""
+
+    __slots__ = ()
     
     def __init__(self, value: int):
         super().__init__(value)
 
 class Endurance(AttributeStat):
     """Résistance physique et capacité à endurer."""
+
+    __slots__ = ()
     
     def __init__(self, value: int):
         super().__init__(value)
 
 class Intelligence(AttributeStat):
     """Capacité cognitive et magique."""
+
+    __slots__ = ()
     
     def __init__(self, value: int):
         super().__init__(value)
 
 class Sagesse(AttributeStat):
     """Jugement, perspicacité et intuition."""
+
+    __slots__ = ()
     
     def __init__(self, value: int):
         super().__init__(value)
\ No newline at end of file
@@ -1,7 +1,85 @@
-from typing import List
+import heapq
+import itertools
+from typing import List, Optional, Sequence, Tuple
 
 from jeuxRPG.i18n import t
-from jeuxRPG._class.res.character.alteration.alteration import Buff, DeBuff
+from jeuxRPG._class.res.character.alteration.alteration import Alteration, Buff, DeBuff
+
+
+# Shared empty view returned while a stat has no alteration
+_NO_ALTERATIONS: tuple = ()
+# Tie-breaker of the expiry heaps (alterations are not ordered)
+_SEQUENCE = itertools.count()
+
+
+class _Modifiers:
+    """
+    Alterations of one stat, allocated with the first of them.
+
+    `buff_total`/`debuff_total` are the running sums of the active values,
+    so the modified value is O(1) to compute. `expiry` is a min-heap of
+    (end round, seq, alteration) on the stat's own round counter `round`:
+    a bound alteration reads its remaining duration from it instead of
+    being decremented every round. Heap entries of alterations removed or
+    rescheduled since are stale and skipped when they surface.
+    """
+
+    __slots__ = ("buffs", "debuffs", "buff_total", "debuff_total", "expiry", "round")
+
+    def __init__(self) -> None:
+        self.buffs: List[Buff] = []
+        self.debuffs: List[DeBuff] = []
+        self.buff_total = 0
+        self.debuff_total = 0
+        self.expiry: List[Tuple[int, int, Alteration]] = []
+        self.round = 0
+
+    def bind(self, alteration: Alteration, is_debuff: bool) -> None:
+        # `_applied` keeps the value counted in the totals, negative for a debuff
+        duration = alteration.duration
+        value = alteration.get_value()
+        if is_debuff:
+            self.debuffs.append(alteration)
+            self.debuff_total += value
+            alteration._applied = -value
+        else:
+            self.buffs.append(alteration)
+            self.buff_total += value
+            alteration._applied = value
+        alteration._holder = self
+        alteration._expires = self.round + duration
+        heapq.heappush(self.expiry, (alteration._expires, next(_SEQUENCE), alteration))
+
+    def unbind(self, alteration: Alteration) -> None:
+        alteration._duration = alteration.duration
+        alteration._holder = None
+        if alteration._applied < 0:
+            self.debuff_total += alteration._applied
+        else:
+            self.buff_total -= alteration._applied
+
+    def reschedule(self, alteration: Alteration, duration: int) -> None:
+        """New remaining duration of a bound alteration (e.g. `decrease()`)."""
+        expires = self.round + duration
+        if alteration._expires != expires:
+            alteration._expires = expires
+            heapq.heappush(self.expiry, (expires, next(_SEQUENCE), alteration))
+
+    def expire(self) -> bool:
+        """Advance one round; True when an alteration ended."""
+        self.round += 1
+        expiry = self.expiry
+        expired = False
+        while expiry and expiry[0][0] <= self.round:
+            expires, _, alteration = heapq.heappop(expiry)
+            if alteration._holder is not self or alteration._expires != expires:
+                continue
+            self.unbind(alteration)
+            expired = True
+        if expired:
+            self.buffs = [buff for buff in self.buffs if buff._holder is self]
+            self.debuffs = [debuff for debuff in self.debuffs if debuff._holder is self]
+        return expired
 
 
 class DefaultStat:
@@ -13,7 +91,19 @@ class DefaultStat:
         buffs (List[Skill]): Active buffs affecting this stat
         debuffs (List[Skill]): Active debuffs affecting this stat
         name (str): Name of the statistic (defaults to class name)
+
+    Stats use `__slots__` (every character holds at least six of them) and
+    the buff/debuff bookkeeping (`_Modifiers`) is only allocated with the
+    first alteration: until then `buffs`/`debuffs` are an empty tuple.
+    Subclasses must declare `__slots__` too (`()` when they add no field),
+    otherwise `change_type` between them fails on the instance layout.
+
+    Adding, removing or expiring an alteration costs O(1) (plus the list
+    removal) thanks to running totals, and `end_round` only pops the
+    alterations whose end round is reached from a min-heap.
     """
+
+    __slots__ = ("value", "_current_value", "_mods", "_name")
     
     def __init__(self, value: int) -> None:
         """Initialize the statistic with a base value.
@@ -30,9 +120,8 @@ class DefaultStat:
             
         self.value = value
         self._current_value = value
-        self.buffs: List[Buff] = []
-        self.debuffs: List[DeBuff] = []
-        self.name = self.__class__.__name__
+        self._mods: Optional[_Modifiers] = None
+        self._name = self.__class__.__name__
     
     # Magic methods ###########################################################
     
@@ -75,6 +164,7 @@ class DefaultStat:
         """Add to current value with += operator."""
         if not isinstance(other, int):
             raise TypeError("Can only add integers to stats")
+        self._sync_current()
         self._current_value += other
         self._clamp_current_value()
         return self
@@ -93,6 +183,7 @@ class DefaultStat:
         """Subtract from current value with -= operator."""
         if not isinstance(other, int):
             raise TypeError("Can only subtract integers from stats")
+        self._sync_current()
         self._current_value = max(0, self._current_value - other)
         return self
     
@@ -134,6 +225,7 @@ class DefaultStat:
         """Set the current value (clamped to reasonable bounds)."""
         if not isinstance(value, int):
             raise ValueError("Stat value must be an integer")
+        self._sync_current()
         self._current_value = max(0, min(value, self.value * 10))
         self._clamp_current_value()
     
@@ -145,13 +237,33 @@ class DefaultStat:
     def name(self, value):
         self._name = value
 
+    @property
+    def buffs(self) -> Sequence[Buff]:
+        """Active buffs (read-only empty tuple until the first one)."""
+        return self._mods.buffs if self._mods is not None else _NO_ALTERATIONS
+
+    @buffs.setter
+    def buffs(self, value: Sequence[Buff]) -> None:
+        """Replace the buffs, keeping their durations; the current value is left as is."""
+        self._set_alterations(value, self.debuffs)
+
+    @property
+    def debuffs(self) -> Sequence[DeBuff]:
+        """Active debuffs (read-only empty tuple until the first one)."""
+        return self._mods.debuffs if self._mods is not None else _NO_ALTERATIONS
+
+    @debuffs.setter
+    def debuffs(self, value: Sequence[DeBuff]) -> None:
+        """Replace the debuffs, keeping their durations; the current value is left as is."""
+        self._set_alterations(self.buffs, value)
+
     # Public methods ##########################################################
     
     def change_type(self, new_type: type) -> None:
         if not issubclass(new_type, DefaultStat):
             raise TypeError(f"Can only convert to {DefaultStat} subclasses")
         self.__class__ = new_type
-        self.name = self.__class__.__name__
+        self._name = new_type.__name__
     
     def add_buff(self, buff: Buff) -> None:
         """Add a buff and recalculate current value.
@@ -164,7 +276,9 @@ class DefaultStat:
         """
         if not isinstance(buff, Buff):
             raise TypeError("Buffs must be Buff instances")
-        self.buffs.append(buff)
+        if self._mods is None:
+            self._mods = _Modifiers()
+        self._mods.bind(buff, False)
         self._recalculate()
     
     def remove_buff(self, buff: object) -> bool:
@@ -181,8 +295,10 @@ class DefaultStat:
         """
         if not isinstance(buff, object):
             raise TypeError("Buffs must be object instances")
-        if buff in self.buffs:
-            self.buffs.remove(buff)
+        mods = self._mods
+        if mods is not None and buff in mods.buffs:
+            mods.buffs.remove(buff)
+            mods.unbind(buff)
             self._recalculate()
             return True
         return False
@@ -198,10 +314,13 @@ class DefaultStat:
         """
         if not isinstance(debuff, object):
             raise TypeError("Debuffs must be object instances")
-        self.debuffs.append(debuff)
+        if self._mods is None:
+            self._mods = _Modifiers()
+        self._mods.bind(debuff, True)
         self._recalculate()
     
     def set_max(self) -> None:
+        self._sync_current()
         self._current_value = self.value
         self._recalculate()
     
@@ -219,16 +338,25 @@ class DefaultStat:
         """
         if not isinstance(debuff, object):
             raise TypeError("Debuffs must be object instances")
-        if debuff in self.debuffs:
-            self.debuffs.remove(debuff)
+        mods = self._mods
+        if mods is not None and debuff in mods.debuffs:
+            mods.debuffs.remove(debuff)
+            mods.unbind(debuff)
             self._recalculate()
             return True
         return False
     
     def clear_effects(self) -> None:
         """Remove all buffs and debuffs."""
-        self.buffs.clear()
-        self.debuffs.clear()
+        mods = self._mods
+        if mods is not None:
+            for buff in mods.buffs:
+                mods.unbind(buff)
+            for debuff in mods.debuffs:
+                mods.unbind(debuff)
+            mods.buffs.clear()
+            mods.debuffs.clear()
+            mods.expiry.clear()
         self._recalculate()
     
     def update_base_value(self, new_value: int) -> None:
@@ -250,31 +378,101 @@ class DefaultStat:
         self.value += value
         self._recalculate()
     
+    def snapshot(self) -> tuple:
+        """Capture the mutable state of the statistic as a plain tuple."""
+        self._sync_current()
+        mods = self._mods
+        if mods is None:
+            return (self.value, self._current_value, None)
+        bound = tuple([(a, a._expires, a._applied) for a in (*mods.buffs, *mods.debuffs)])
+        return (self.value, self._current_value, (len(mods.buffs), bound, tuple(mods.expiry), mods.round))
+
+    def restore(self, state: tuple) -> None:
+        """Restore a state captured by `snapshot`."""
+        self._sync_current()
+        self.value, self._current_value, mods_state = state
+        if self._mods is not None:
+            for alteration in (*self._mods.buffs, *self._mods.debuffs):
+                if alteration._holder is self._mods:
+                    alteration._duration = alteration.duration
+                    alteration._holder = None
+        if mods_state is None:
+            self._mods = None
+            return
+        nb_buffs, bound, expiry, round_ = mods_state
+        # a new holder: heap entries of alterations no longer active stay stale
+        mods = self._mods = _Modifiers()
+        mods.expiry = list(expiry)
+        mods.round = round_
+        for i, (alteration, expires, applied) in enumerate(bound):
+            alteration._holder = mods
+            alteration._expires = expires
+            alteration._applied = applied
+            if i < nb_buffs:
+                mods.buffs.append(alteration)
+                mods.buff_total += applied
+            else:
+                mods.debuffs.append(alteration)
+                mods.debuff_total -= applied
+
     def get_effect_value(self) -> int:
         """Get the total modified value from all effects."""
         return self.current_value - self.value
     
     def end_round(self) -> None:
-        for alteration in self.buffs + self.debuffs:
-            alteration.decrease()
-
-        self.buffs = [buff for buff in self.buffs if not buff.is_over()]
-        self.debuffs = [debuff for debuff in self.debuffs if not debuff.is_over()]
+        """Count one round down for every alteration and drop the ended ones."""
+        mods = self._mods
+        if mods is None:
+            return
+        if mods.expire():
+            self._recalculate()
+            if not mods.buffs and not mods.debuffs:
+                self._mods = None
 
     
     # Private methods #########################################################
+
+    def _sync_current(self) -> None:
+        """
+        Bring `_current_value` up to date; called before it is read or written.
+
+        Nothing to do for a plain stat. A stat whose value moves between two
+        accesses (`Energie` and its rests) overrides it, together with the
+        `current_value` getter, which does not call it here to stay a plain read.
+        """
+
+    def _set_alterations(self, buffs: Sequence[Buff], debuffs: Sequence[DeBuff]) -> None:
+        old = self._mods
+        buffs, debuffs = list(buffs), list(debuffs)
+        if old is not None:
+            for buff in old.buffs:
+                old.unbind(buff)
+            for debuff in old.debuffs:
+                old.unbind(debuff)
+        if not buffs and not debuffs:
+            self._mods = None
+            return
+        mods = self._mods = _Modifiers()
+        for buff in buffs:
+            mods.bind(buff, False)
+        for debuff in debuffs:
+            mods.bind(debuff, True)
     
     def _recalculate(self) -> None:
-        """Recalculate current value based on base value and effects."""
-        total = self.value
-        # Apply buffs
-        for buff in self.buffs:
-            total += buff.get_value()
-        
-        # Apply debuffs
-        for debuff in self.debuffs:
-            total = max(1, total - debuff.get_value())
-        
+        """Recalculate current value based on base value and effects.
+
+        Buffs add up, then every debuff is subtracted without going under 1;
+        debuff values being positive, that is the running totals clamped once.
+        """
+        mods = self._mods
+        if mods is None:
+            total = self.value
+        elif mods.debuffs:
+            total = max(1, self.value + mods.buff_total - mods.debuff_total)
+        else:
+            total = self.value + mods.buff_total
+
+        self._sync_current()
         self._current_value = total
         self._clamp_current_value()
     
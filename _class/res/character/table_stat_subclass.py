@@ -5,6 +5,7 @@ from jeuxRPG._class.res.advantage import Advantage
 from jeuxRPG._class.res.character.alteration.alteration import AlterationType
 from jeuxRPG._class.res.character.stats.basic_stat import HP, Aura, Endurance, Foie, Force, Intelligence, Mana, Sagesse
 
+from jeuxRPG._class.res.class_table import freeze_class_table
 from jeuxRPG._class.res.classType import ClassType, DamageType, SkillType
 from jeuxRPG._class.res.dictType import ClassTable
 
@@ -845,3 +846,19 @@ mob_table: ClassTable = {
     }
 }
 
+
+# Tables partagées par toutes les instances d'une classe, jamais copiées :
+# les écarts propres à un personnage passent par son ClassTableView.
+knight_table = freeze_class_table(knight_table)
+necromancien_table = freeze_class_table(necromancien_table)
+squelette_table = freeze_class_table(squelette_table)
+goblin_table = freeze_class_table(goblin_table)
+orc_table = freeze_class_table(orc_table)
+dragon_whelp_table = freeze_class_table(dragon_whelp_table)
+physical_resistant_mob_table = freeze_class_table(physical_resistant_mob_table)
+magic_resistant_mob_table = freeze_class_table(magic_resistant_mob_table)
+sacred_resistant_mob_table = freeze_class_table(sacred_resistant_mob_table)
+priest_table = freeze_class_table(priest_table)
+archer_table = freeze_class_table(archer_table)
+mage_table = freeze_class_table(mage_table)
+mob_table = freeze_class_table(mob_table)
@@ -0,0 +1,161 @@
+"""
+Shared, immutable class tables and their per-character view.
+
+A class table (`ClassTable`) describes a whole class: base stats, upgrades,
+advantages and skills. It used to be deep-copied by every character although
+almost nothing in it diverges. Tables are now frozen once and shared; what a
+character really changes (an advantage forced by the simulator, the one-shot
+"new" upgrades already claimed) lives in its own `ClassTableView` layer.
+"""
+
+from collections.abc import Mapping
+from copy import deepcopy
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from jeuxRPG._class.res.level_table import clear_level_tables
+
+
+class FrozenDict(dict):
+    """Read-only dict; copies (`copy`, `deepcopy`) give back plain dicts."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("class tables are shared and read-only, write through the character's class_table")
+
+    __setitem__ = __delitem__ = _readonly
+    pop = popitem = clear = update = setdefault = _readonly
+    __ior__ = _readonly
+
+    def __deepcopy__(self, memo: Dict) -> dict:
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+
+def freeze_class_table(table: Mapping) -> FrozenDict:
+    """
+    Freeze a class table and every nested dict of it.
+
+    Values that are not dicts (skills, advantages, stat types) are shared
+    as is. Freezing an already frozen table returns it unchanged.
+    """
+    if isinstance(table, FrozenDict):
+        return table
+    return FrozenDict(
+        (key, freeze_class_table(value) if isinstance(value, dict) else value)
+        for key, value in table.items()
+    )
+
+
+def patch_class_table(table: dict, patch: Mapping) -> None:
+    """
+    Deep-merge `patch` into a shared table, in place.
+
+    Reserved to balance overrides applied at load time: every character of
+    the class sees the change, exactly like a code change of the table.
+    Cached level tables are rebuilt from the patched table.
+    """
+    clear_level_tables()
+    for key, value in patch.items():
+        current = table.get(key)
+        if isinstance(value, Mapping) and isinstance(current, dict):
+            patch_class_table(current, value)
+        else:
+            dict.__setitem__(table, key, freeze_class_table(value) if isinstance(value, dict) else value)
+
+
+class ClassTableView(Mapping):
+    """
+    Class table of one character: the shared frozen table plus its overrides.
+
+    Reading falls back to the shared table, writing (`view[key] = value`)
+    only touches the character. `claimed_upgrades` lists the upgrade
+    thresholds whose "new" energies were already granted.
+
+    Values of `OWN_KEYS` are changed in place (`add_weakness`,
+    `change_all_advantage`...): `view[key]` copies them into the overrides
+    on first access, so the shared value is never handed out for writing.
+    `peek` reads without copying, for read-only hot paths.
+    """
+
+    __slots__ = ("_base", "_overrides", "claimed_upgrades")
+
+    OWN_KEYS = frozenset({"advantage"})
+
+    def __init__(self, table: Mapping) -> None:
+        self._base = freeze_class_table(table)
+        self._overrides: Optional[Dict[str, Any]] = None
+        self.claimed_upgrades: Tuple[int, ...] = ()
+
+    @property
+    def base(self) -> FrozenDict:
+        """Shared table, identical for every character of the class."""
+        return self._base
+
+    @property
+    def overrides(self) -> Dict[str, Any]:
+        """Copy of the fields this character overrides."""
+        return dict(self._overrides or {})
+
+    def __getitem__(self, key: str) -> Any:
+        overrides = self._overrides
+        if overrides is not None and key in overrides:
+            return overrides[key]
+        if key in self.OWN_KEYS:
+            value = self[key] = deepcopy(self._base[key])
+            return value
+        return self._base[key]
+
+    def peek(self, key: str, default: Any = None) -> Any:
+        """Value of `key` without copying it, not to be modified."""
+        overrides = self._overrides
+        if overrides is not None and key in overrides:
+            return overrides[key]
+        return self._base.get(key, default)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self._overrides is None:
+            self._overrides = {}
+        self._overrides[key] = value
+
+    def reset(self, key: str) -> None:
+        """Drop the override of `key`, back to the shared value."""
+        if self._overrides is not None:
+            self._overrides.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._base
+        if self._overrides:
+            yield from (key for key in self._overrides if key not in self._base)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def claim_upgrade(self, threshold: int) -> bool:
+        """Mark the "new" part of an upgrade as granted; False if it already was."""
+        if threshold in self.claimed_upgrades:
+            return False
+        self.claimed_upgrades += (threshold,)
+        return True
+
+    def __deepcopy__(self, memo: Dict) -> 'ClassTableView':
+        view = ClassTableView(self._base)
+        if self._overrides is not None:
+            view._overrides = deepcopy(self._overrides, memo)
+        view.claimed_upgrades = self.claimed_upgrades
+        return view
+
+    def __reduce__(self):
+        return (_rebuild_view, (self._base, self._overrides, self.claimed_upgrades))
+
+    def __repr__(self) -> str:
+        return f"ClassTableView(overrides={sorted(self._overrides or {})}, claimed={self.claimed_upgrades})"
+
+
+def _rebuild_view(base: FrozenDict, overrides: Optional[Dict[str, Any]], claimed: Tuple[int, ...]) -> ClassTableView:
+    view = ClassTableView(base)
+    view._overrides = overrides
+    view.claimed_upgrades = claimed
+    return view
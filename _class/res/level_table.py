@@ -0,0 +1,141 @@
+"""
+Cumulative progression of a class, by level.
+
+Levelling up used to replay every level one by one (and recursively): new
+skills of the level, then every `upgrade_stats` threshold already reached,
+then the "new" energies. A `LevelTable` folds a class table into cumulative
+gains by level so that going from level a to level b is one subtraction per
+stat, whatever the distance.
+
+Gains of level L are those of every threshold <= L; past the last threshold
+they no longer change, so the table stops there and extrapolates linearly.
+"""
+
+from bisect import bisect_right
+from math import isqrt
+from typing import Any, Dict, Iterator, List, Mapping, Tuple
+
+from jeuxRPG._class.res.character.stats.basic_stat import (
+    HP, Endurance, Force, Intelligence, Sagesse
+)
+
+UPGRADABLE_STATS = (HP, Force, Endurance, Intelligence, Sagesse)
+
+Gains = Dict[type, int]
+
+
+def exp_to_reach(level: int) -> int:
+    """XP needed to go from level 1 to `level` (`level * 100` per level passed)."""
+    return 50 * level * (level - 1) if level > 1 else 0
+
+
+def level_for_exp(exp: int) -> int:
+    """Highest level reached with `exp` XP gained since level 1."""
+    # 50 * L * (L - 1) <= exp  <=>  (2L - 1)^2 <= 4 * exp / 50 + 1
+    return max(1, (1 + isqrt(4 * max(0, exp) // 50 + 1)) // 2)
+
+
+class LevelTable:
+    """
+    Gains of a class from level 1 to each level: stats, energies, skills.
+
+    Attributes:
+        thresholds: (threshold, upgrade data) sorted by threshold
+        new_energies: (threshold, {energy type: base value}) of the "new" upgrades
+        skill_levels: levels with new skills, sorted
+    """
+
+    __slots__ = ("thresholds", "new_energies", "skill_levels", "_skills", "_stats", "_energies", "_last")
+
+    def __init__(self, upgrades: Mapping[int, Mapping], class_skills_dict: Mapping[str, Mapping]) -> None:
+        self.thresholds: Tuple[Tuple[int, Mapping], ...] = tuple(sorted(upgrades.items(), key=lambda item: item[0]))
+        self.new_energies = tuple(
+            (threshold, data["new"]["Energie"])
+            for threshold, data in self.thresholds
+            if "new" in data and "Energie" in data["new"]
+        )
+        skills = {}
+        for key, level_skills in class_skills_dict.items():
+            prefix, _, number = str(key).partition(" ")
+            if prefix == "level" and number.isdigit() and int(number) > 1:
+                skills[int(number)] = level_skills
+        self.skill_levels: List[int] = sorted(skills)
+        self._skills = skills
+        # Cumulative gains for levels 1.._last, level 1 being the starting point
+        self._last = max([2] + [threshold for threshold, _ in self.thresholds])
+        self._stats: List[Gains] = [{}, {}]
+        self._energies: List[Gains] = [{}, {}]
+        for level in range(2, self._last + 1):
+            stats, energies = self._gains_of(level)
+            self._stats.append(_added(self._stats[-1], stats))
+            self._energies.append(_added(self._energies[-1], energies))
+
+    def _gains_of(self, level: int) -> Tuple[Gains, Gains]:
+        """Gains of reaching `level` alone, in threshold order."""
+        stats: Gains = {}
+        energies: Gains = {}
+        for threshold, data in self.thresholds:
+            if threshold > level:
+                break
+            for stat_type, value in data.items():
+                if stat_type in UPGRADABLE_STATS:
+                    stats[stat_type] = stats.get(stat_type, 0) + value
+            for energy_type, value in data.get("Energie", {}).items():
+                energies[energy_type] = energies.get(energy_type, 0) + value
+        return stats, energies
+
+    def _cumulative(self, table: List[Gains], level: int) -> Gains:
+        if level <= self._last:
+            return table[max(level, 1)]
+        # past the last threshold every level gains the same
+        last = table[self._last]
+        step = {key: value - table[self._last - 1].get(key, 0) for key, value in last.items()}
+        return {key: value + (level - self._last) * step[key] for key, value in last.items()}
+
+    def stat_gains(self, start: int, end: int) -> Gains:
+        """Stat gains from `start` to `end` level, in the order stepwise levelling meets them."""
+        return _difference(self._cumulative(self._stats, end), self._cumulative(self._stats, start))
+
+    def energy_gains(self, start: int, end: int) -> Gains:
+        """Energy gains from `start` to `end` level, in the order stepwise levelling meets them."""
+        return _difference(self._cumulative(self._energies, end), self._cumulative(self._energies, start))
+
+    def new_energies_until(self, end: int) -> Iterator[Tuple[int, Mapping]]:
+        """"new" energies of the thresholds reached by `end`, to claim once each."""
+        return ((threshold, energies) for threshold, energies in self.new_energies if threshold <= end)
+
+    def skills_between(self, start: int, end: int) -> Iterator[Mapping[str, Any]]:
+        """New skills of the levels start < L <= end, in level order."""
+        levels = self.skill_levels
+        for level in levels[bisect_right(levels, start):bisect_right(levels, end)]:
+            yield self._skills[level]
+
+
+def _added(gains: Gains, more: Gains) -> Gains:
+    total = dict(gains)
+    for key, value in more.items():
+        total[key] = total.get(key, 0) + value
+    return total
+
+
+def _difference(end: Gains, start: Gains) -> Gains:
+    return {key: value - start.get(key, 0) for key, value in end.items() if value != start.get(key, 0)}
+
+
+# One table per (upgrade_stats, class_skills_dict), both shared by the whole class
+_TABLES: Dict[Tuple[int, int], Tuple[Mapping, Mapping, LevelTable]] = {}
+
+
+def level_table(upgrades: Mapping[int, Mapping], class_skills_dict: Mapping[str, Mapping]) -> LevelTable:
+    """Cached `LevelTable` of a class (keyed by the identity of its shared tables)."""
+    key = (id(upgrades), id(class_skills_dict))
+    entry = _TABLES.get(key)
+    if entry is None:
+        # the tables are kept alongside so their ids stay theirs
+        entry = _TABLES[key] = (upgrades, class_skills_dict, LevelTable(upgrades, class_skills_dict))
+    return entry[2]
+
+
+def clear_level_tables() -> None:
+    """Forget the cached tables (after a class table was patched)."""
+    _TABLES.clear()
@@ -0,0 +1,212 @@
+"""
+Compiled damage pipeline.
+
+Every term of the damage formula only depends on small integer stats, so the
+expensive parts (`** 0.2`, `math.log`, the endurance logistic curve and the
+weakness/resilience lookups) are evaluated once and then served from tables:
+
+- `attacker_factor`: damage multiplier granted by the caster stat
+- `endurance_multiplier`: damage kept after the target endurance reduction
+- `advantage_row`: damage-type multipliers of a class advantage definition
+
+Values outside of the precomputed range fall back to the reference formulas,
+so results are always identical to the uncompiled computation.
+"""
+
+import math
+from typing import Any, Dict, Tuple
+
+from jeuxRPG._class.res.advantage import Advantage
+from jeuxRPG._class.res.classType import DamageType
+
+
+STAT_TABLE_SIZE = 2048
+
+WEAKNESS_FACTOR = 1.8
+RESILIENCE_FACTOR = 0.6
+
+# Endurance logistic curve parameters (maximum reduction, slope, midpoint)
+ENDURANCE_L = 0.9
+ENDURANCE_K = 0.02
+ENDURANCE_X0 = 150
+
+
+# Reference formulas ##########################################################
+
+def _attacker_factor(stat_value: int) -> float:
+    """Damage multiplier granted by the caster stat (reference formula)."""
+    stat_factor = (stat_value ** 0.2) / 2
+    return max(1, math.log((1 + stat_factor)))
+
+
+def _endurance_reduction(endurance: int) -> int:
+    """Percentage of damage absorbed by the endurance (reference formula)."""
+    return int((ENDURANCE_L / (1 + math.exp(-ENDURANCE_K * (endurance - ENDURANCE_X0)))) * 100)
+
+
+def _endurance_multiplier(endurance: int) -> float:
+    """Fraction of the damage kept after the endurance reduction."""
+    return 1 - (_endurance_reduction(endurance) / 100)
+
+
+_ATTACKER_FACTORS: Tuple[float, ...] = tuple(_attacker_factor(v) for v in range(STAT_TABLE_SIZE))
+_ENDURANCE_REDUCTIONS: Tuple[int, ...] = tuple(_endurance_reduction(v) for v in range(STAT_TABLE_SIZE))
+_ENDURANCE_MULTIPLIERS: Tuple[float, ...] = tuple(_endurance_multiplier(v) for v in range(STAT_TABLE_SIZE))
+
+
+# Table lookups ###############################################################
+
+def attacker_factor(stat_value: int) -> float:
+    """Get the caster stat multiplier, served from the table when possible."""
+    if 0 <= stat_value < STAT_TABLE_SIZE:
+        return _ATTACKER_FACTORS[stat_value]
+    return _attacker_factor(stat_value)
+
+
+def endurance_reduction(endurance: int) -> int:
+    """Get the endurance damage reduction percentage."""
+    if 0 <= endurance < STAT_TABLE_SIZE:
+        return _ENDURANCE_REDUCTIONS[endurance]
+    return _endurance_reduction(endurance)
+
+
+def endurance_multiplier(endurance: int) -> float:
+    """Get the fraction of damage kept after the endurance reduction."""
+    if 0 <= endurance < STAT_TABLE_SIZE:
+        return _ENDURANCE_MULTIPLIERS[endurance]
+    return _endurance_multiplier(endurance)
+
+
+def compute_damage(base_damage: int, stat_value: int, modifier: float = 1.0) -> int:
+    """
+    Compute the raw damage of a damage skill before the target reductions.
+
+    Args:
+        base_damage: Damage value of the skill effect
+        stat_value: Current value of the caster scaling stat
+        modifier: Damage-type multiplier of the target
+
+    Returns:
+        Damage amount, always at least 1
+    """
+    damage = int(max(1, base_damage * attacker_factor(stat_value)))
+    if modifier == 1.0:
+        return damage
+    return int(max(1, damage * modifier))
+
+
+def apply_endurance(amount: int, endurance: int) -> int:
+    """Apply the endurance-based reduction to a damage amount."""
+    return int(amount * endurance_multiplier(endurance))
+
+
+# Damage-type matrix ##########################################################
+
+_NEUTRAL_ROW: Tuple[float, ...] = tuple(1.0 for _ in DamageType)
+_ROWS: Dict[Tuple[float, ...], Tuple[float, ...]] = {}
+
+
+def _advantage_lists(adv: Any) -> Tuple[Any, Any]:
+    """Extract (weakness, resilience) from an Advantage instance or a dict."""
+    if hasattr(adv, "get_weakness"):
+        return set(adv.get_weakness()), set(adv.get_resilience())
+    if isinstance(adv, dict):
+        return (
+            set(adv.get("weakness", adv.get("weak", []))),
+            set(adv.get("resilience", adv.get("resilient", []))),
+        )
+    return None, None
+
+
+def _build_row(adv: Any) -> Tuple[float, ...]:
+    """Build the multiplier of every damage type for an advantage definition."""
+    if adv is None:
+        return _NEUTRAL_ROW
+    try:
+        weak_list, resi_list = _advantage_lists(adv)
+    except Exception:
+        return _NEUTRAL_ROW
+
+    row = []
+    for damage_type in DamageType:
+        modifier = 1.0
+        if weak_list is not None and damage_type in weak_list:
+            modifier *= WEAKNESS_FACTOR
+        if resi_list is not None and damage_type in resi_list:
+            modifier *= RESILIENCE_FACTOR
+        row.append(modifier)
+    return tuple(row)
+
+
+def advantage_row(adv: Any) -> Tuple[float, ...]:
+    """
+    Get the damage-type multipliers of an advantage definition.
+
+    Rows are shared between every advantage with the same content, so all
+    the characters of a class end up pointing to the same matrix row.
+
+    Args:
+        adv: Advantage instance, advantage dict or None
+
+    Returns:
+        Tuple of multipliers indexed by `DamageType.value`
+    """
+    row = _build_row(adv)
+    return _ROWS.setdefault(row, row)
+
+
+# Rows of the advantage dicts, by (weaknesses, resiliences) content
+_DICT_ROWS: Dict[Tuple[Tuple, Tuple], Tuple[float, ...]] = {}
+
+
+def _dict_row(adv: Dict) -> Tuple[float, ...]:
+    """Row of an advantage dict, looked up by content (a dict has no revision to watch)."""
+    try:
+        key = (
+            tuple(adv.get("weakness", adv.get("weak", ()))),
+            tuple(adv.get("resilience", adv.get("resilient", ()))),
+        )
+        row = _DICT_ROWS.get(key)
+    except TypeError:
+        return advantage_row(adv)
+    if row is None:
+        row = _DICT_ROWS[key] = advantage_row(adv)
+    return row
+
+
+def damage_type_multiplier(target: Any, damage_type: DamageType) -> float:
+    """
+    Get the multiplier applied to `damage_type` damage dealt to `target`.
+
+    For an `Advantage` the row is cached on the target and rebuilt only when
+    the instance is replaced or its revision changes. Advantage dicts have no
+    revision and may be changed in place: their row is looked up by content.
+
+    Args:
+        target: Character receiving the damage
+        damage_type: Type of the incoming damage
+
+    Returns:
+        Damage multiplier (1.0 when neutral)
+    """
+    if damage_type is None:
+        return 1.0
+    try:
+        table = getattr(target, "class_table", {})
+        adv = table.peek("advantage") if hasattr(table, "peek") else table.get("advantage", None)
+    except Exception:
+        return 1.0
+
+    if not isinstance(adv, Advantage):
+        row = _dict_row(adv) if isinstance(adv, dict) else advantage_row(adv)
+        return row[damage_type.value]
+
+    revision = adv.revision
+    cached = getattr(target, "_advantage_row", None)
+    if cached is None or cached[0] is not adv or cached[1] != revision:
+        cached = (adv, revision, advantage_row(adv))
+        try:
+            target._advantage_row = cached
+        except AttributeError:
+            pass
+    return cached[2][damage_type.value]
@@ -1,16 +1,78 @@
 import copy
 import logging
+from operator import attrgetter
 from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 from jeuxRPG.i18n import t
 from jeuxRPG._class.res.character.alteration.alteration import AlterationType
 from jeuxRPG._class.res.character.stats.basic_stat import AttributeStat, Energie, Force, Intelligence, Mana, Sagesse
 from jeuxRPG._class.res.classType import DamageType, SkillType
+from jeuxRPG._class.skills.damage_pipeline import compute_damage, damage_type_multiplier
 from jeuxRPG._class.skills.skillEffect import SkillEffect
+from jeuxRPG._class.stats.rest_clock import RestClock
 
 
-class Skill:
-    all_Skills: list['Skill'] = []
+DAMAGE_STAT_MAPPING = {
+    DamageType.PHYSICAL: Force,
+    DamageType.MAGIC: Intelligence,
+    DamageType.SACRED: Sagesse
+}
+
+
+class SkillRegistry(list):
+    """Liste des sorts uniques, indexée par nom (en minuscules)."""
+
+    __slots__ = ("by_name",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.by_name: Dict[str, 'Skill'] = {}
+
+    def append(self, skill: 'Skill') -> None:
+        key = skill.name.lower()
+        if key not in self.by_name:
+            self.by_name[key] = skill
+            super().append(skill)
+
+    def remove(self, skill: 'Skill') -> None:
+        super().remove(skill)
+        if self.by_name.get(skill.name.lower()) is skill:
+            del self.by_name[skill.name.lower()]
+
+    def clear(self) -> None:
+        super().clear()
+        self.by_name.clear()
+
+
+class _Cooldown:
+    """Compteur de recharge, porté par un `CharacterSkill` (ou un `Skill` utilisé seul)."""
+
+    __slots__ = ()
+
+    def is_ready(self) -> bool:
+        return self.current_cooldown <= 0
+
+    def setcooldown(self) -> None:
+        if self.current_cooldown > 0: raise RuntimeError(f"cooldown is not ready for : {self.name}")
+        self.current_cooldown = self.cooldown
+
+    def update_cooldown(self) -> None:
+        if self.current_cooldown > 0:
+            self.current_cooldown -= 1
+
+    def reset_cooldown(self) -> None:
+        self.current_cooldown = 0
+
+
+class Skill(_Cooldown):
+    """
+    Définition d'un sort, partagée par tous les personnages qui le possèdent.
+
+    Les personnages ne tiennent que des `CharacterSkill` (voir `bind`) : le
+    cooldown de la définition ne sert que lorsqu'elle est utilisée seule.
+    """
+
+    all_Skills: SkillRegistry = SkillRegistry()
     def __init__(
         self,
         name: str,
@@ -61,12 +123,16 @@ class Skill:
 
     def _register_skill(self):
         """Enregistre le sort s'il est unique"""
-        if not any(skill.name.lower() == self.name.lower() 
-                for skill in Skill.all_Skills):
-            Skill.all_Skills.append(self)
-    
-    def is_ready(self) -> bool:
-        return self.current_cooldown <= 0
+        Skill.all_Skills.append(self)
+
+    @property
+    def skill(self) -> 'Skill':
+        """La définition du sort (soi-même)."""
+        return self
+
+    def bind(self, clock: Optional[RestClock] = None) -> 'CharacterSkill':
+        """État propre à un personnage pour ce sort, sans copier la définition."""
+        return CharacterSkill(self, clock=clock)
 
     def can_afford(self, caster: Any) -> bool:
         try:
@@ -82,12 +148,9 @@ class Skill:
         result = copy_skill.execute(copy_caster, copy_target)
         return result.get("effects", {}).get("true_damage", 0) or 0
 
-    def setcooldown(self) -> None:
-        if self.current_cooldown > 0: raise RuntimeError(f"cooldown is not ready for : {self.name}")
-        self.current_cooldown = self.cooldown
-    
-    def execute(self, caster: Any, target: Any) -> Dict[str, Any]:
-        if not self.is_ready():
+    def execute(self, caster: Any, target: Any, state: Optional[_Cooldown] = None) -> Dict[str, Any]:
+        state = state if state is not None else self
+        if not state.is_ready():
             raise RuntimeError(f"Compétence {self.name} en cooldown")
         if not self.can_afford(caster):
             return {
@@ -103,7 +166,7 @@ class Skill:
         }
 
         caster.consume_energie(self.energie_cost, self.energie_target)
-        self.setcooldown()
+        state.setcooldown()
 
         if self.custom_action:
             try:
@@ -149,52 +212,15 @@ class Skill:
 
     def _execute_damage_action(self, caster: Any, target: Any, results: Dict[str, Any]) -> Dict[str, Any]:
         """Gère les actions de dégâts"""
-        def calculate_damage(caster_stat_instance: AttributeStat) -> int:
-            import math
-            base_damage = self.effects["damage"].value
-            stat_value = caster_stat_instance.current_value
-            stat_factor = (stat_value ** 0.2) / 2
-            damage = base_damage * max(1, math.log((1 + stat_factor)))
-            return int(max(1, damage))
-
-        stat_mapping = {
-            DamageType.PHYSICAL: Force,
-            DamageType.MAGIC: Intelligence,
-            DamageType.SACRED: Sagesse
-        }
-
-        stat_target = stat_mapping.get(self.DamageType)
+        stat_target = DAMAGE_STAT_MAPPING.get(self.DamageType)
         if not stat_target:
             raise NotImplementedError(f"Damage type {self.DamageType.name} not implemented")
 
-        caster_stat = caster.status["stats"][stat_target.__name__]
-        damage = calculate_damage(caster_stat)
+        caster_stat: AttributeStat = caster.status.stats[stat_target.__name__]
 
         # Apply target advantage/resilience on damage type if available
-        modifier = 1.0
-        try:
-            adv = getattr(target, "class_table", {}).get("advantage", None)
-            if adv is not None and self.DamageType is not None:
-                weak_list = None
-                resi_list = None
-                # Support Advantage instance or dict forms
-                if hasattr(adv, "get_weakness"):
-                    weak_list = set(adv.get_weakness())
-                    resi_list = set(adv.get_resilience())
-                elif isinstance(adv, dict):
-                    weak_list = set(adv.get("weakness", adv.get("weak", [])))
-                    resi_list = set(adv.get("resilience", adv.get("resilient", [])))
-                if weak_list is not None and self.DamageType in weak_list:
-                    # Weakness factor tuned empirically
-                    modifier *= 1.8
-                if resi_list is not None and self.DamageType in resi_list:
-                    # Stronger resilience factor
-                    modifier *= 0.6
-        except Exception:
-            # If anything goes wrong, ignore advantage modifiers
-            pass
-
-        damage = int(max(1, damage * modifier))
+        modifier = damage_type_multiplier(target, self.DamageType)
+        damage = compute_damage(self.effects["damage"].value, caster_stat.current_value, modifier)
         initial_hp = target.get_stat("HP").current_value
         
         results["message"] = target.lose_hp(caster, damage)
@@ -270,13 +296,6 @@ class Skill:
         
         return results
 
-    def update_cooldown(self) -> None:
-        if self.current_cooldown > 0:
-            self.current_cooldown -= 1
-
-    def reset_cooldown(self) -> None:
-        self.current_cooldown = 0
-
     @classmethod
     def apply_alteration(cls,caster, target = None, skill_effect : SkillEffect = None) ->tuple[bool, str]:
         if not skill_effect: raise ValueError("skill_effect must be given")
@@ -287,8 +306,99 @@ class Skill:
     @classmethod
     def get_skill_by_name(cls, name: str) -> 'Skill':
         """Retourne le skill ou lève une exception si non trouvé"""
-        skill = next((s for s in cls.all_Skills if s.name.lower() == name.lower()), None)
+        skill = cls.all_Skills.by_name.get(name.lower())
         if skill is None:
             raise ValueError(f"Skill '{name}' not found")
         return skill
+
+
+class CharacterSkill(_Cooldown):
+    """
+    Sort d'un personnage : la définition partagée et son cooldown courant.
+
+    Les attributs de la définition (nom, effets, coûts...) sont lus à
+    travers, en lecture seule ; seul `current_cooldown` est propre au
+    personnage. Rattaché au `RestClock` du personnage, le cooldown est
+    stocké comme le nombre de repos auquel le sort redevient prêt : un
+    repos ne touche donc plus aux sorts.
+    """
+
+    __slots__ = ("skill", "_clock", "_ready_at")
+
+    # Champs lus à chaque tour de combat : accès direct, sans passer par __getattr__
+    name = property(attrgetter("skill.name"))
+    skill_type = property(attrgetter("skill.skill_type"))
+    effects = property(attrgetter("skill.effects"))
+    energie_cost = property(attrgetter("skill.energie_cost"))
+    energie_target = property(attrgetter("skill.energie_target"))
+    cooldown = property(attrgetter("skill.cooldown"))
+    requires_target = property(attrgetter("skill.requires_target"))
+    can_target_others = property(attrgetter("skill.can_target_others"))
+
+    def __init__(self, skill: Skill, current_cooldown: int = 0, clock: Optional[RestClock] = None):
+        self.skill = skill
+        self._clock = clock
+        self.current_cooldown = current_cooldown
+
+    @property
+    def current_cooldown(self) -> int:
+        clock = self._clock
+        if clock is None:
+            return self._ready_at
+        remaining = self._ready_at - clock.rests
+        return remaining if remaining > 0 else 0
+
+    @current_cooldown.setter
+    def current_cooldown(self, value: int) -> None:
+        clock = self._clock
+        self._ready_at = value if clock is None else clock.rests + value
+
+    def is_ready(self) -> bool:
+        clock = self._clock
+        return self._ready_at <= (clock.rests if clock is not None else 0)
+
+    def update_cooldown(self) -> None:
+        # rattaché, le cooldown avance avec le compteur de repos
+        if self._clock is None:
+            super().update_cooldown()
+
+    def __getattr__(self, name: str) -> Any:
+        if name in CharacterSkill.__slots__:
+            raise AttributeError(name)
+        return getattr(self.skill, name)
+
+    def __str__(self) -> str:
+        return str(self.skill)
+
+    def __repr__(self) -> str:
+        skill = self.skill
+        cost = f"{skill.energie_cost} {skill.energie_target.__name__}"
+        return f"{skill.name} (cost: {cost}, cooldown: {self.current_cooldown})"
+
+    def bind(self, clock: Optional[RestClock] = None) -> 'CharacterSkill':
+        return CharacterSkill(self.skill, self.current_cooldown, clock)
+
+    def __copy__(self) -> 'CharacterSkill':
+        return CharacterSkill(self.skill, self.current_cooldown, self._clock)
+
+    def __deepcopy__(self, memo: Dict) -> 'CharacterSkill':
+        # le compteur suit la copie du personnage quand elle l'a déjà copié
+        return CharacterSkill(self.skill, self.current_cooldown, copy.deepcopy(self._clock, memo))
+
+    def execute(self, caster: Any, target: Any) -> Dict[str, Any]:
+        return self.skill.execute(caster, target, self)
+
+    def get_true_damage(self, caster, target):
+        copy_caster = copy.deepcopy(caster)
+        copy_target = copy.deepcopy(target)
+        result = self.bind().execute(copy_caster, copy_target)
+        return result.get("effects", {}).get("true_damage", 0) or 0
+
+
+def bind_skills(
+    skills: Dict[str, Union[Skill, CharacterSkill]],
+    clock: Optional[RestClock] = None
+) -> Dict[str, CharacterSkill]:
+    """États par personnage des sorts donnés, les définitions restant partagées."""
+    return {name: skill.bind(clock) for name, skill in skills.items()}
         
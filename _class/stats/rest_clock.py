@@ -0,0 +1,25 @@
+"""
+Rest clock of a character.
+
+Resting used to walk every energy (`regenerate`) and every skill
+(`update_cooldown`) of the character. It now only ticks this counter: the
+energies keep (current value, rests seen) and replay the missed regenerations
+when read, the skills keep the rest count at which they are ready again.
+Both stay exact because a rest is the only thing happening between two
+reads or writes of those values.
+"""
+
+
+class RestClock:
+    """Number of rests taken by one character (see `SkillMixin.rest`)."""
+
+    __slots__ = ("rests",)
+
+    def __init__(self, rests: int = 0) -> None:
+        self.rests = rests
+
+    def tick(self) -> None:
+        self.rests += 1
+
+    def __repr__(self) -> str:
+        return f"RestClock(rests={self.rests})"
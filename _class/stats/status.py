@@ -0,0 +1,380 @@
+"""
+Typed, slot-based character status.
+
+Replaces the per-character deep copy of `alteration.json`: a fresh character
+only carries its stats index and `Death_in`, the alteration lists are only
+allocated the first time something is written to them. Every object still
+behaves as the former nested dictionary (`status["alteration"]["Damage"]
+["Reduction"]["%"]`, `.get(...)`, item assignment), so `Status_Dict_type`
+keeps describing its shape.
+"""
+
+import heapq
+import itertools
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_EMPTY = ()
+# Tie-breaker of the expiry heap (alterations are not ordered)
+_SEQUENCE = itertools.count()
+
+
+class _SlotMapping(Mapping):
+    """Read/write mapping view over the slots listed in `_KEYS`."""
+
+    __slots__ = ()
+    _KEYS: Dict[str, str] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, self._KEYS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        setattr(self, self._KEYS[key], value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self.items())!r})"
+
+
+class TimedList(list):
+    """
+    Alteration list of a character whose entries are timed by its `AlterationStatus`.
+
+    Every alteration added (append, insert, extend, slice assignment) is
+    bound to the status heap; removing it (remove, pop, clear) unbinds it.
+    """
+
+    __slots__ = ("_timer",)
+
+    def __init__(self, timer: Optional['AlterationStatus'], items: Iterable = ()) -> None:
+        super().__init__()
+        self._timer = timer
+        self.extend(items)
+
+    def _bind(self, alteration: Any) -> None:
+        if self._timer is not None:
+            self._timer.bind(alteration)
+
+    def _unbind(self, alteration: Any) -> None:
+        if self._timer is not None and getattr(alteration, "_holder", None) is self._timer:
+            self._timer.unbind(alteration)
+
+    def append(self, alteration: Any) -> None:
+        self._bind(alteration)
+        super().append(alteration)
+
+    def insert(self, index: int, alteration: Any) -> None:
+        self._bind(alteration)
+        super().insert(index, alteration)
+
+    def extend(self, alterations: Iterable) -> None:
+        for alteration in alterations:
+            self.append(alteration)
+
+    def __iadd__(self, alterations: Iterable) -> 'TimedList':
+        self.extend(alterations)
+        return self
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            for alteration in value:
+                self._bind(alteration)
+        else:
+            self._bind(value)
+        super().__setitem__(index, value)
+
+    def remove(self, alteration: Any) -> None:
+        super().remove(alteration)
+        self._unbind(alteration)
+
+    def pop(self, index: int = -1) -> Any:
+        alteration = super().pop(index)
+        self._unbind(alteration)
+        return alteration
+
+    def clear(self) -> None:
+        for alteration in self:
+            self._unbind(alteration)
+        super().clear()
+
+    def _drop(self, ended: set) -> List:
+        """Remove the ended alterations without touching their binding; returns them in list order."""
+        dropped = [alteration for alteration in self if alteration in ended]
+        if dropped:
+            list.__setitem__(self, slice(None), [alteration for alteration in self if alteration not in ended])
+        return dropped
+
+    def __reduce_ex__(self, protocol):
+        # items come back through the list protocol once the status exists (cycles)
+        return (TimedList, (None,), (None, {"_timer": self._timer}), iter(list(self)))
+
+
+class ReductionBuckets(_SlotMapping):
+    """Damage reductions by kind: `%` (percentage), `+` and `-` (flat)."""
+
+    __slots__ = ("_timer", "percent", "plus", "minus")
+    _KEYS = {"%": "percent", "+": "plus", "-": "minus"}
+
+    def __init__(self, timer: Optional['AlterationStatus'] = None) -> None:
+        object.__setattr__(self, "_timer", timer)
+        self.percent: List = TimedList(timer)
+        self.plus: List = TimedList(timer)
+        self.minus: List = TimedList(timer)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("percent", "plus", "minus") and not (isinstance(value, TimedList) and value._timer is self._timer):
+            value = TimedList(self._timer, value)
+        object.__setattr__(self, name, value)
+
+    def __bool__(self) -> bool:
+        return bool(self.percent or self.plus or self.minus)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in ReductionBuckets.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+
+class _NoReduction(ReductionBuckets):
+    """Shared, empty and read-only buckets of a character without alteration."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        for name in ("_timer", "percent", "plus", "minus"):
+            object.__setattr__(self, name, None if name == "_timer" else _EMPTY)
+
+
+NO_REDUCTION = _NoReduction()
+
+
+class _DamageView(_SlotMapping):
+    """`status["alteration"]["Damage"]` view over the owning alterations."""
+
+    __slots__ = ("_owner",)
+    _KEYS = {"Incoming": "incoming", "Reduction": "reduction"}
+
+    def __init__(self, owner: 'AlterationStatus') -> None:
+        self._owner = owner
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self._owner, self._KEYS[key])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        setattr(self._owner, self._KEYS[key], value)
+
+
+class AlterationStatus(_SlotMapping):
+    """
+    Active alterations of a character, grouped by kind.
+
+    Stuns, invulnerabilities, DoTs and reductions are timed here like the
+    buffs of a stat (see `_Modifiers` in stat.py): `expiry` is a min-heap of
+    (end round, seq, alteration) on the status' own `round` counter, bound
+    alterations read their remaining duration from it, and `advance` only
+    pops the ones ending this round. Stale heap entries (alteration removed
+    or rescheduled since) are skipped when they surface.
+    """
+
+    __slots__ = ("buff", "debuff", "invulnerability", "stun", "incoming", "reduction", "expiry", "round")
+    _KEYS = {
+        "buff": "buff",
+        "debuff": "debuff",
+        "invulnerability": "invulnerability",
+        "Damage": "damage",
+        "stun": "stun",
+    }
+    _TIMED = frozenset(("invulnerability", "stun", "incoming"))
+
+    def __init__(self) -> None:
+        self.expiry: List[Tuple[int, int, Any]] = []
+        self.round = 0
+        self.buff: List = []
+        self.debuff: List = []
+        self.invulnerability: List = TimedList(self)
+        self.stun: List = TimedList(self)
+        self.incoming: List = TimedList(self)
+        self.reduction = ReductionBuckets(self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in AlterationStatus._TIMED and not (isinstance(value, TimedList) and value._timer is self):
+            value = TimedList(self, value)
+        elif name == "reduction" and not (isinstance(value, ReductionBuckets) and value._timer is self):
+            buckets = ReductionBuckets(self)
+            for key in ReductionBuckets._KEYS:
+                buckets[key] = value[key]
+            value = buckets
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in AlterationStatus.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def damage(self) -> _DamageView:
+        return _DamageView(self)
+
+    @damage.setter
+    def damage(self, value: Mapping) -> None:
+        self.incoming = value["Incoming"]
+        self.reduction = value["Reduction"]
+
+    # Timing (same protocol as the stats' _Modifiers: round, reschedule) #####
+
+    def bind(self, alteration: Any) -> None:
+        if alteration._holder is self:
+            return
+        alteration._expires = self.round + alteration.duration
+        alteration._holder = self
+        heapq.heappush(self.expiry, (alteration._expires, next(_SEQUENCE), alteration))
+
+    def unbind(self, alteration: Any) -> None:
+        alteration._duration = alteration.duration
+        alteration._holder = None
+
+    def reschedule(self, alteration: Any, duration: int) -> None:
+        """New remaining duration of a bound alteration (e.g. `decrease()`)."""
+        if duration <= 0:
+            # Ended by hand: leaves its list now, so list lengths stay the active counts
+            alteration._holder = None
+            alteration._duration = duration
+            for items in self.timed_lists():
+                if alteration in items:
+                    list.remove(items, alteration)
+                    break
+            return
+        expires = self.round + duration
+        if alteration._expires != expires:
+            alteration._expires = expires
+            heapq.heappush(self.expiry, (expires, next(_SEQUENCE), alteration))
+
+    def timed_lists(self) -> Tuple[TimedList, ...]:
+        reduction = self.reduction
+        return (self.stun, self.invulnerability, self.incoming, reduction.percent, reduction.plus, reduction.minus)
+
+    def advance(self) -> List:
+        """
+        Advance one round and drop the alterations ending with it.
+
+        Returns:
+            Ended alterations, DoTs excepted, in the former reporting order
+            (stuns, invulnerabilities, then reductions by bucket)
+        """
+        self.round += 1
+        expiry = self.expiry
+        ended = set()
+        while expiry and expiry[0][0] <= self.round:
+            expires, _, alteration = heapq.heappop(expiry)
+            if alteration._holder is not self or alteration._expires != expires:
+                continue
+            self.unbind(alteration)
+            ended.add(alteration)
+        if not ended:
+            return []
+        reduction = self.reduction
+        self.incoming._drop(ended)
+        return [
+            alteration
+            for items in (self.stun, self.invulnerability, reduction.percent, reduction.plus, reduction.minus)
+            for alteration in items._drop(ended)
+        ]
+
+
+class AdvantageStatus(_SlotMapping):
+    """Weaknesses and resiliences of a character."""
+
+    __slots__ = ("weakness", "resilience")
+    _KEYS = {"weakness": "weakness", "resilience": "resilience"}
+
+    def __init__(self) -> None:
+        self.weakness: List = []
+        self.resilience: List = []
+
+
+class CharacterStatus(_SlotMapping):
+    """
+    Status of a character: stats index, alterations, advantages, death timer.
+
+    The typed accessors (`stuns`, `invulnerabilities`, `dots`, `reduction`)
+    never allocate; `alteration` and `advantage` allocate on first access
+    because their callers usually write to them.
+    """
+
+    __slots__ = ("stats", "_alteration", "_advantage", "death_in")
+    _KEYS = {"stats": "stats", "alteration": "alteration", "advantage": "advantage", "Death_in": "death_in"}
+
+    def __init__(self, stats: Optional[Dict[str, Any]] = None) -> None:
+        self.stats: Dict[str, Any] = stats if stats is not None else {"energie": {}}
+        self._alteration: Optional[AlterationStatus] = None
+        self._advantage: Optional[AdvantageStatus] = None
+        self.death_in = -1
+
+    @property
+    def alteration(self) -> AlterationStatus:
+        if self._alteration is None:
+            self._alteration = AlterationStatus()
+        return self._alteration
+
+    @alteration.setter
+    def alteration(self, value: Mapping) -> None:
+        alteration = AlterationStatus()
+        for key in AlterationStatus._KEYS:
+            alteration[key] = value[key]
+        self._alteration = alteration
+
+    @property
+    def advantage(self) -> AdvantageStatus:
+        if self._advantage is None:
+            self._advantage = AdvantageStatus()
+        return self._advantage
+
+    @advantage.setter
+    def advantage(self, value: Mapping) -> None:
+        advantage = AdvantageStatus()
+        advantage.weakness = value["weakness"]
+        advantage.resilience = value["resilience"]
+        self._advantage = advantage
+
+    def get_alteration(self) -> Optional[AlterationStatus]:
+        """Alterations if any were ever allocated, without allocating them."""
+        return self._alteration
+
+    @property
+    def stuns(self) -> List:
+        alteration = self._alteration
+        return alteration.stun if alteration is not None else _EMPTY
+
+    @property
+    def invulnerabilities(self) -> List:
+        alteration = self._alteration
+        return alteration.invulnerability if alteration is not None else _EMPTY
+
+    @property
+    def dots(self) -> List:
+        alteration = self._alteration
+        return alteration.incoming if alteration is not None else _EMPTY
+
+    @property
+    def reduction(self) -> ReductionBuckets:
+        alteration = self._alteration
+        return alteration.reduction if alteration is not None else NO_REDUCTION
@@ -18,5 +18,5 @@ class Archer(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=archer_table.copy(),
+            class_table=archer_table,
         )
\ No newline at end of file
@@ -13,5 +13,5 @@ class DragonWhelp(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=dragon_whelp_table.copy(),
+            class_table=dragon_whelp_table,
         )
@@ -13,5 +13,5 @@ class Goblin(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=goblin_table.copy(),
+            class_table=goblin_table,
         )
@@ -13,5 +13,5 @@ class Knight(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=knight_table.copy(),
+            class_table=knight_table,
         )
@@ -12,6 +12,6 @@ class Mage(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=mage_table.copy(),
+            class_table=mage_table,
         )
 
@@ -13,5 +13,5 @@ class MagicResistantMob(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=magic_resistant_mob_table.copy(),
+            class_table=magic_resistant_mob_table,
         )
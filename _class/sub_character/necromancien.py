@@ -21,16 +21,17 @@ class Necromancien(Character):
         )
         self.class_type = ClassType.SUMMONER
     
-    def attack(self, target: 'Character', skill_name: str = None) -> tuple[bool, str]:
+    def perform_attack(self, target: 'Character', skill_name: str = None) -> tuple[bool, str, str | None]:
+        # Sans skill_name, ce sont les invocations qui attaquent : pas de skill unique à rejouer
         
         if skill_name:
             if self.get_skill(skill_name).skill_type is SkillType.INVOCATION:
-                return self._invocation(skill_name)
+                return *self._invocation(skill_name), skill_name
         
         if not self.have_invocation():
             success, message = self._invocation()
-            if not success : return False, f"{self.name} can't attack"
-            return True, message + " (it's not an attack)"
+            if not success : return False, f"{self.name} can't attack", None
+            return True, message + " (it's not an attack)", None
 
         invocations = self.invocations.get_all()
 
@@ -53,7 +54,7 @@ class Necromancien(Character):
         if isinstance(message, list):
             message = ", ".join(message)
 
-        return success, message
+        return success, message, None
 
     def lose_hp(self, source, amount):
         div = int(amount / 2)
@@ -13,5 +13,5 @@ class Orc(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=orc_table.copy(),
+            class_table=orc_table,
         )
@@ -13,5 +13,5 @@ class PhysicalResistantMob(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=physical_resistant_mob_table.copy(),
+            class_table=physical_resistant_mob_table,
         )
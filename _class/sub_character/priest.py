@@ -13,5 +13,5 @@ class Priest(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=priest_table.copy(),
+            class_table=priest_table,
         )
\ No newline at end of file
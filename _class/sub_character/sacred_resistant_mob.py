@@ -13,5 +13,5 @@ class SacredResistantMob(Character):
         super().__init__(
             user_id=user_id,
             name=name,
-            class_table=sacred_resistant_mob_table.copy(),
+            class_table=sacred_resistant_mob_table,
         )
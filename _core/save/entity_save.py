@@ -89,7 +89,8 @@ class EntitySaveData:
         for stat_name in ["force", "endurance", "intelligence", "sagesse"]:
             stat = getattr(character, stat_name, None)
             if stat is not None:
-                stats[stat_name] = getattr(stat, "current_value", int(stat))
+                value = getattr(stat, "current_value", None)
+                stats[stat_name] = value if value is not None else int(stat)
         
         # Extract energies
         energies = []
@@ -4,7 +4,7 @@ def level_up_f(target : Character, level_target) -> None:
     """_summary_
     
     Role:
-        level up using auto exp, use only when create a new Character or a Boss phase
+        level up in a single step (see `set_level`), use only when create a new Character or a Boss phase
         
     Args:
         target (Character): a new born or a boss switching pahse
@@ -14,5 +14,4 @@ def level_up_f(target : Character, level_target) -> None:
         Character: the Character after the leveling
     """
     if target.level < level_target:
-        target.gain_exp(target._required_exp_for_next_level())
-        level_up_f(target, level_target)
\ No newline at end of file
+        target.set_level(level_target)
\ No newline at end of file
@@ -3,7 +3,7 @@ from jeuxRPG._class.skills.skill import Skill
 
 def handle_damage_effect(caster, target, effect) -> dict[str, Union[bool,str,dict[str,int]]]:
     """Gère spécifiquement l'effet de dégâts"""
-    damage = effect.value + int(caster.status["stats"]["Force"].current_value * 0.5)
+    damage = effect.value + int(caster.status.stats["Force"].current_value * 0.5)
     initial_hp = target.get_stat("HP").current_value
     message = target.lose_hp(caster, damage)
     true_damage = initial_hp - target.get_stat("HP").current_value
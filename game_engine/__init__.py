@@ -1,5 +1,7 @@
 """Game engine package for async battle management."""
 
 from .engine import GameEngine
+from .admission import PRIORITIES, EngineBusy
+from .result import FightResult
 
-__all__ = ["GameEngine"]
+__all__ = ["GameEngine", "FightResult", "EngineBusy", "PRIORITIES"]
@@ -0,0 +1,290 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+OVERLOAD_POLICIES = ("reject", "wait")
+PRIORITIES = ("interactive", "tower", "background")  # most urgent first
+DEFAULT_PRIORITY = "interactive"
+
+
+def check_priority(priority: str) -> str:
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority: {priority} (expected one of {', '.join(PRIORITIES)})")
+    return priority
+
+
+class EngineBusy(RuntimeError):
+    """Raised when the engine cannot take more fights (queue full or admission timeout)."""
+
+
+class _Waiter:
+    __slots__ = ("slots", "priority", "loop", "future", "granted")
+
+    def __init__(self, slots: int, priority: str, loop: asyncio.AbstractEventLoop):
+        self.slots = slots
+        self.priority = priority
+        self.loop = loop
+        self.future = loop.create_future()
+        self.granted = False
+
+    def wake(self) -> None:
+        self.granted = True
+
+        def resolve(future: asyncio.Future) -> None:
+            if not future.done():
+                future.set_result(None)
+
+        try:
+            self.loop.call_soon_threadsafe(resolve, self.future)
+        except RuntimeError:
+            pass  # loop closed, the waiter is gone
+
+
+class AdmissionController:
+    """
+    Concurrency limit, bounded pending queue and priority scheduler shared by the engine runs.
+
+    A run first reserves its slots (`reserve`), which puts them in the
+    pending queue; each fight (or batch) then waits for a running slot
+    (`acquire`) and gives it back when it ends (`release`).
+
+    Priorities (`PRIORITIES`, most urgent first): freed slots go to the
+    most urgent waiting class, FIFO inside a class. Background work is
+    guaranteed about `background_share` of the slots handed out while it
+    waits, so it is slowed down but never starved. The pending bound only
+    counts fights of the same or a more urgent class, so a queue full of
+    background work does not turn interactive fights away.
+
+    When the queue is full, the "reject" policy raises EngineBusy at once;
+    the "wait" policy holds the caller back (without blocking its event
+    loop) until the queue has room. Any wait longer than `timeout` raises
+    EngineBusy as well, so no caller is queued without bound.
+
+    Every counter is protected by a lock: runs on different event loops (the
+    engine loop, a host loop, the caller's `asyncio.run`) share the limits.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        overload: str = "reject",
+        timeout: Optional[float] = None,
+        background_share: float = 0.1,
+    ):
+        if overload not in OVERLOAD_POLICIES:
+            raise ValueError(f"Unknown overload policy: {overload} (expected one of {', '.join(OVERLOAD_POLICIES)})")
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        if max_pending is not None and max_pending < 0:
+            raise ValueError("max_pending cannot be negative")
+        if not 0 <= background_share <= 1:
+            raise ValueError("background_share must be between 0 and 1")
+        self.max_concurrent = max_concurrent
+        self.max_pending = max_pending
+        self.overload = overload
+        self.timeout = timeout
+        self.background_share = background_share
+
+        self.running = 0
+        self.peak_queued = 0
+        self.peak_running = 0
+        self.queued: Dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self.admitted: Dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self.rejected: Dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self.timed_out: Dict[str, int] = dict.fromkeys(PRIORITIES, 0)
+        self._room_waiters: Dict[str, Deque[_Waiter]] = {p: deque() for p in PRIORITIES}
+        self._slot_waiters: Dict[str, Deque[_Waiter]] = {p: deque() for p in PRIORITIES}
+        self._background_credit = 0.0
+        self._lock = threading.Lock()
+
+    # Capacity ###############################################################
+
+    def slots_for(self, fights: int) -> int:
+        """Number of running slots a batch of `fights` takes (capped by the limit)."""
+        return fights if self.max_concurrent is None else min(fights, self.max_concurrent)
+
+    def _room_for(self, slots: int, priority: str) -> bool:
+        if self.max_concurrent is None or self.max_pending is None:
+            return True
+        free = self.max_concurrent - self.running
+        ahead = sum(self.queued[p] for p in PRIORITIES[:PRIORITIES.index(priority) + 1])
+        return ahead + slots <= max(0, free) + self.max_pending
+
+    def _slot_for(self, slots: int) -> bool:
+        return self.max_concurrent is None or self.running + slots <= self.max_concurrent
+
+    def _waiting_ahead(self, waiters: Dict[str, Deque[_Waiter]], priority: str) -> bool:
+        return any(waiters[p] for p in PRIORITIES[:PRIORITIES.index(priority) + 1])
+
+    def _background_due(self) -> bool:
+        return bool(self._slot_waiters["background"]) and self._background_credit >= 1
+
+    def is_busy(self, priority: str = DEFAULT_PRIORITY) -> bool:
+        """True when a new fight of `priority` would be rejected or held back."""
+        with self._lock:
+            return self._waiting_ahead(self._room_waiters, priority) or not self._room_for(1, priority)
+
+    @property
+    def busy(self) -> bool:
+        """`is_busy` for interactive fights."""
+        return self.is_busy()
+
+    def _next_slot_waiter(self) -> Optional[_Waiter]:
+        if self._background_due():
+            return self._slot_waiters["background"][0]
+        for priority in PRIORITIES:
+            if self._slot_waiters[priority]:
+                return self._slot_waiters[priority][0]
+        return None
+
+    def _wake(self) -> None:
+        # Called with the lock held
+        while True:
+            waiter = self._next_slot_waiter()
+            if waiter is None or not self._slot_for(waiter.slots):
+                break
+            self._slot_waiters[waiter.priority].popleft()
+            self._start(waiter.slots, waiter.priority)
+            waiter.wake()
+        for priority in PRIORITIES:
+            waiters = self._room_waiters[priority]
+            while waiters and self._room_for(waiters[0].slots, priority):
+                waiter = waiters.popleft()
+                self._enqueue(waiter.slots, priority)
+                waiter.wake()
+
+    def _start(self, slots: int, priority: str) -> None:
+        if priority == "background":
+            self._background_credit = max(0.0, self._background_credit - 1)
+        elif self._slot_waiters["background"]:
+            self._background_credit = min(1.0, self._background_credit + self.background_share)
+        self.running += slots
+        self.queued[priority] -= slots
+        self.admitted[priority] += slots
+        self.peak_running = max(self.peak_running, self.running)
+
+    def _enqueue(self, slots: int, priority: str) -> None:
+        self.queued[priority] += slots
+        self.peak_queued = max(self.peak_queued, sum(self.queued.values()))
+
+    async def _wait(
+        self, waiter: _Waiter, waiters: Dict[str, Deque[_Waiter]], undo: Callable[[_Waiter], None]
+    ) -> None:
+        """
+        Wait for `waiter` to be granted.
+
+        On timeout or cancellation the waiter leaves the queue; if it was
+        granted meanwhile, `undo` gives the grant back (lock held) unless it
+        was a timeout, in which case the caller simply keeps it.
+        """
+        try:
+            await asyncio.wait_for(waiter.future, self.timeout)
+        except BaseException as exc:
+            timeout = isinstance(exc, asyncio.TimeoutError)
+            with self._lock:
+                if not waiter.granted:
+                    waiters[waiter.priority].remove(waiter)
+                    if timeout:
+                        self.timed_out[waiter.priority] += waiter.slots
+                    self._wake()
+                elif timeout:
+                    return
+                else:
+                    undo(waiter)
+                    self._wake()
+            if timeout:
+                raise EngineBusy(f"No fight slot freed within {self.timeout}s") from None
+            raise
+
+    # Admission ##############################################################
+
+    async def reserve(self, slots: int, priority: str = DEFAULT_PRIORITY) -> None:
+        """Put `slots` in the pending queue (EngineBusy when it is full, see the policies)."""
+        with self._lock:
+            if not self._waiting_ahead(self._room_waiters, priority) and self._room_for(slots, priority):
+                self._enqueue(slots, priority)
+                return
+            if self.overload == "reject":
+                self.rejected[priority] += slots
+                raise EngineBusy(
+                    f"Engine busy: {self.running} fights running, {sum(self.queued.values())} pending "
+                    f"(limits {self.max_concurrent}/{self.max_pending})"
+                )
+            waiter = _Waiter(slots, priority, asyncio.get_running_loop())
+            self._room_waiters[priority].append(waiter)
+        await self._wait(waiter, self._room_waiters, self._ungrant_room)
+
+    async def acquire(self, slots: int, priority: str = DEFAULT_PRIORITY) -> None:
+        """
+        Turn `slots` reserved slots into running slots, waiting for them to free up.
+
+        If the wait fails (timeout, cancellation) the reservation is dropped.
+        """
+        with self._lock:
+            if (
+                not self._waiting_ahead(self._slot_waiters, priority)
+                and not (priority != "background" and self._background_due())
+                and self._slot_for(slots)
+            ):
+                self._start(slots, priority)
+                self._wake()
+                return
+            waiter = _Waiter(slots, priority, asyncio.get_running_loop())
+            self._slot_waiters[priority].append(waiter)
+        try:
+            await self._wait(waiter, self._slot_waiters, self._ungrant_slot)
+        except BaseException:
+            self.cancel(slots, priority)
+            raise
+
+    def _ungrant_slot(self, waiter: _Waiter) -> None:
+        self.running -= waiter.slots
+        self.queued[waiter.priority] += waiter.slots
+        self.admitted[waiter.priority] -= waiter.slots
+
+    def _ungrant_room(self, waiter: _Waiter) -> None:
+        self.queued[waiter.priority] -= waiter.slots
+
+    def cancel(self, slots: int, priority: str = DEFAULT_PRIORITY) -> None:
+        """Drop reserved slots that will never be acquired."""
+        with self._lock:
+            self.queued[priority] -= slots
+            self._wake()
+
+    def release(self, slots: int) -> None:
+        """Give running slots back."""
+        with self._lock:
+            self.running -= slots
+            self._wake()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and admission counters (totals and per priority)."""
+        with self._lock:
+            return {
+                "running": self.running,
+                "queued": sum(self.queued.values()),
+                "waiting_for_queue": sum(w.slots for q in self._room_waiters.values() for w in q),
+                "peak_queued": self.peak_queued,
+                "peak_running": self.peak_running,
+                "admitted": sum(self.admitted.values()),
+                "rejected": sum(self.rejected.values()),
+                "timed_out": sum(self.timed_out.values()),
+                "max_concurrent": self.max_concurrent,
+                "max_pending": self.max_pending,
+                "overload": self.overload,
+                "background_share": self.background_share,
+                "priorities": {
+                    p: {
+                        "queued": self.queued[p],
+                        "waiting_for_queue": sum(w.slots for w in self._room_waiters[p]),
+                        "waiting_for_slot": sum(w.slots for w in self._slot_waiters[p]),
+                        "admitted": self.admitted[p],
+                        "rejected": self.rejected[p],
+                        "timed_out": self.timed_out[p],
+                    }
+                    for p in PRIORITIES
+                },
+            }
@@ -1,15 +1,254 @@
 import asyncio
+import concurrent.futures
+import multiprocessing
 import threading
-from typing import List, Set
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class._event.confrontation.encounter.replay import (
+    apply_character_state,
+    capture_character,
+    capture_fight,
+    capture_live_states,
+    load_live_states,
+    restore_fight,
+)
+from jeuxRPG.game_engine.admission import DEFAULT_PRIORITY, PRIORITIES, AdmissionController, check_priority
+from jeuxRPG.game_engine.metrics import EngineMetrics, render_prometheus
+from jeuxRPG.game_engine.result import CANCELLED, DRAW, TIMED_OUT, FightResult
+from jeuxRPG.game_engine.stats import LatencyStats
+
+
+EXECUTION_MODES = ("round", "fight")
+BACKENDS = ("thread", "process")
+
+_engine_loop: Optional[asyncio.AbstractEventLoop] = None
+_engine_loop_lock = threading.Lock()
+
+
+def engine_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide engine event loop.
+
+    The loop is created on first use and runs forever in a daemon thread,
+    so synchronous callers share one loop (and one default executor)
+    instead of creating one per call.
+    """
+    global _engine_loop
+    with _engine_loop_lock:
+        if _engine_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="game-engine-loop", daemon=True).start()
+            _engine_loop = loop
+        return _engine_loop
+
+
+def _limit_reason(rounds_played: int, max_rounds: Optional[int], deadline: Optional[float]) -> Optional[str]:
+    """Why a fight must stop before its next round (None to keep playing)."""
+    if deadline is not None and time.perf_counter() >= deadline:
+        return TIMED_OUT
+    if max_rounds is not None and rounds_played >= max_rounds:
+        return DRAW
+    return None
+
+
+# Process backend #############################################################
+# Fights cross the process boundary as plain data (see replay.capture_fight),
+# plus the pickled live states (alterations, invocations) of the fighters; the
+# final states come back the same way and are applied to the caller's
+# Character objects.
+
+def _serialize_fight(fight: Fight, max_rounds: Optional[int] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """Compact picklable form of a fight, its limits and the AI policies of its fighters."""
+    fighters = fight.get_all_individuals()
+    return {
+        "fight": capture_fight(fight, live=True),
+        "max_rounds": max_rounds,
+        "timeout": timeout,
+        "policies": {
+            i: policy for i, policy in enumerate(fight.get_policy(c) for c in fighters) if policy is not None
+        },
+    }
+
+
+def _play_serialized(payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Worker side: rebuild the fights, play them round-robin, return their final states."""
+    fights = []
+    for payload in payloads:
+        fight, fighters = restore_fight(payload["fight"])
+        for i, policy in payload["policies"].items():
+            fight.set_policy(fighters[i], policy)
+        fights.append(fight)
+        fight.clear_log()
+
+    started = time.perf_counter()
+    start_rounds = [fight.round for fight in fights]
+    deadlines = [started + p["timeout"] if p["timeout"] else None for p in payloads]
+    wall_times: Dict[Fight, float] = {}
+    statuses: Dict[Fight, Optional[str]] = {}
+    round_times: Dict[Fight, List[float]] = {fight: [] for fight in fights}
+    pending = list(zip(fights, payloads, start_rounds, deadlines))
+    while pending:
+        for entry in list(pending):
+            fight, payload, start_round, deadline = entry
+            over = fight.is_over()
+            status = None if over else _limit_reason(fight.round - start_round, payload["max_rounds"], deadline)
+            if over or status is not None:
+                pending.remove(entry)
+                wall_times[fight] = time.perf_counter() - started
+                statuses[fight] = status
+            else:
+                round_started = time.perf_counter()
+                fight.start_round(True)
+                round_times[fight].append(time.perf_counter() - round_started)
+
+    results = []
+    for fight in fights:
+        winner = fight.get_winner() if statuses[fight] is None else None
+        results.append({
+            "round": fight.round,
+            "status": statuses[fight],
+            "winner": "A" if winner is fight.attackers else "D" if winner is fight.defenders else None,
+            "log": fight.log_message,
+            "fighters": [capture_character(c) for c in fight.get_all_individuals()],
+            "live": capture_live_states(fight.get_all_individuals()),
+            "damage": fight.damage_dealt,
+            "healing": fight.healing_done,
+            "wall_time": wall_times[fight],
+            "round_times": round_times[fight],
+        })
+    return results
+
+
+def _apply_fight_result(fight: Fight, result: Dict[str, Any]) -> None:
+    """Caller side: copy a worker result back onto the fight and its characters."""
+    fighters = fight.get_all_individuals()
+    lives = load_live_states(result["live"], fighters)
+    for character, state, live in zip(fighters, result["fighters"], lives):
+        apply_character_state(character, state, live)
+    fight.round = result["round"]
+    fight.log_message.extend(result["log"])
+    fight.damage_dealt = dict(result["damage"])
+    fight.healing_done = dict(result["healing"])
+    fight._winner = {"A": fight.attackers, "D": fight.defenders}.get(result["winner"])
 
 
 class GameEngine:
-    """Manage concurrent fights asynchronously and prevent unit overlap."""
+    """Manage concurrent fights asynchronously and prevent unit overlap.
+
+    Execution modes:
+    - "fight" (default): a whole fight, or a batch of `batch_size` fights
+      stepped round-robin, is handed to a worker in one dispatch and its
+      completion comes back through a future.
+    - "round": every round is a separate thread hop (legacy behaviour).
+
+    Backends (for the "fight" mode):
+    - "thread" (default): workers are threads playing the caller's fights.
+    - "process": workers are processes, so fights use several cores. Each
+      fight is shipped as plain data (fighters, sides, AI policies), played
+      in the worker and its final character states and log are applied
+      back to the caller's objects. Custom Character classes and policies
+      must be importable and picklable by the workers.
+
+    Results:
+    Every run returns one `FightResult` per fight (winner, rounds, wall
+    time, damage and healing per side). `submit` starts a single fight and
+    returns a future, so callers can stream results with `as_completed`
+    (threads) or `async for ... in engine.results(fights)` (asyncio)
+    instead of waiting for a whole batch.
+
+    Admission control:
+    `max_concurrent` caps the fights played at once (a batch takes one slot
+    per fight) and `max_pending` bounds the fights queued behind them. When
+    the queue is full, `overload="reject"` makes the run fail at once with
+    EngineBusy, while `overload="wait"` holds the caller back until there is
+    room; `admission_timeout` bounds any wait for a slot (EngineBusy too).
+    A run is admitted as a whole before its first fight starts. `busy`
+    tells whether a new fight would be rejected or held back and
+    `admission_stats()` reports the queue depth and admission counters.
 
-    def __init__(self):
+    Per-fight limits:
+    `max_rounds` caps the rounds of every fight (reaching it is a draw) and
+    `fight_timeout` gives every fight a deadline, counted from its first
+    round (status "timed_out"). A fight's own `max_rounds` / `timeout`
+    attribute overrides the engine value. `cancel(fight)` stops one fight.
+    All of them are checked between rounds, so a fight can never spin
+    forever, and the participants of a stopped fight are released at once
+    while the other fights of the run go on. The `status` of each
+    FightResult tells how the fight ended.
+
+    Priorities:
+    Every run has a priority class, "interactive" > "tower" > "background"
+    (the `priority` argument, else the most urgent `priority` attribute of
+    its fights, else "interactive"). Freed slots go to the most urgent
+    waiting class first, but background work keeps about
+    `background_share` of the slots while it waits, so simulations fill
+    the spare capacity without starving or delaying player fights much.
+    `latency_stats()` gives the recent queue wait and end-to-end latency
+    percentiles of every class.
+
+    Metrics:
+    The engine counts started/completed/failed/timed out/cancelled fights
+    and keeps histograms of rounds per fight, round execution time,
+    end-to-end latency and queue wait (the last two per priority).
+    `metrics_snapshot()` (JSON) and `metrics_text()` (Prometheus text
+    format) pull them together with the active characters, running and
+    queued gauges; nothing is computed until they are called.
+
+    Event loop:
+    `run_fights` submits the batch to a long-lived event loop and waits for
+    it: the `loop` given to the engine (e.g. the host application loop,
+    running in another thread) or the process-wide engine loop started on
+    first use (see `engine_loop`). Code already running inside asyncio
+    awaits `run_fights_async` instead, which runs on the caller's loop
+    without blocking it.
+    """
+
+    def __init__(
+        self,
+        execution: str = "fight",
+        batch_size: int = 1,
+        max_workers: Optional[int] = None,
+        backend: str = "thread",
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        max_concurrent: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        overload: str = "reject",
+        admission_timeout: Optional[float] = None,
+        background_share: float = 0.1,
+        max_rounds: Optional[int] = None,
+        fight_timeout: Optional[float] = None,
+    ):
+        if execution not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {execution} (expected one of {', '.join(EXECUTION_MODES)})")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {', '.join(BACKENDS)})")
+        if backend == "process" and execution != "fight":
+            raise ValueError("The process backend needs the \"fight\" execution mode")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_rounds is not None and max_rounds < 1:
+            raise ValueError("max_rounds must be at least 1")
+        if fight_timeout is not None and fight_timeout <= 0:
+            raise ValueError("fight_timeout must be positive")
+        self.execution = execution
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.backend = backend
+        self.max_rounds = max_rounds
+        self.fight_timeout = fight_timeout
+        self._executor: Optional[Executor] = None
+        self._loop = loop
+        self.admission = AdmissionController(max_concurrent, max_pending, overload, admission_timeout, background_share)
+        self._queue_wait = LatencyStats(PRIORITIES)
+        self._latency = LatencyStats(PRIORITIES)
+        self.metrics = EngineMetrics(PRIORITIES)
         self._active_characters: Set[str] = set()
+        self._fight_participants: Dict[Fight, Set[str]] = {}
+        self._cancelled: Set[Fight] = set()
         self._lock = threading.Lock()
 
     def _participants_ids(self, fight: Fight) -> Set[str]:
@@ -30,47 +269,430 @@ class GameEngine:
                 raise ValueError(f"Characters already in active fights: {', '.join(overlap)}")
         return seen
 
-    async def _run_fight(self, fight: Fight):
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.backend == "process":
+                    # spawn: same behaviour on every platform, and no fork of a threaded process
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+                else:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fight")
+            return self._executor
+
+    @property
+    def busy(self) -> bool:
+        """True when a new interactive fight would be rejected (or held back) by admission control."""
+        return self.admission.busy
+
+    def is_busy(self, priority: str = DEFAULT_PRIORITY) -> bool:
+        """True when a new fight of `priority` would be rejected (or held back)."""
+        return self.admission.is_busy(check_priority(priority))
+
+    def admission_stats(self) -> Dict[str, Any]:
+        """Running fights, queue depth and admission counters."""
+        return self.admission.stats()
+
+    def latency_stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Recent queue wait and end-to-end latency (seconds) per priority class."""
+        return {"queue_wait": self._queue_wait.summary(), "latency": self._latency.summary()}
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """Counters, gauges and histograms as a JSON-serializable dict."""
+        admission = self.admission.stats()
+        with self._lock:
+            active = len(self._active_characters)
+        return self.metrics.snapshot({
+            "active_characters": active,
+            "running_fights": admission["running"],
+            "queued_fights": admission["queued"],
+        })
+
+    def metrics_text(self) -> str:
+        """Metrics in the Prometheus text exposition format (for a /metrics endpoint)."""
+        return render_prometheus(self.metrics_snapshot())
+
+    @staticmethod
+    def _resolve_priority(fights: List[Fight], priority: Optional[str]) -> str:
+        if priority is not None:
+            return check_priority(priority)
+        wanted = [check_priority(p) for p in (getattr(f, "priority", None) for f in fights) if p is not None]
+        return min(wanted, key=PRIORITIES.index) if wanted else DEFAULT_PRIORITY
+
+    def close(self) -> None:
+        """Shut the worker pool down (a new one is created on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self) -> 'GameEngine':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # Whole-fight execution ##################################################
+
+    def _limits(self, fight: Fight) -> Tuple[Optional[int], Optional[float]]:
+        """Round cap and timeout of `fight` (its own attributes first, then the engine's)."""
+        max_rounds = getattr(fight, "max_rounds", None) or self.max_rounds
+        timeout = getattr(fight, "timeout", None) or self.fight_timeout
+        return max_rounds, timeout
+
+    def _stop_reason(self, fight: Fight, rounds_played: int, max_rounds: Optional[int], deadline: Optional[float]):
+        if fight in self._cancelled:
+            return CANCELLED
+        return _limit_reason(rounds_played, max_rounds, deadline)
+
+    def _result(self, fight: Fight, start_round: int, wall_time: float, status: Optional[str] = None) -> FightResult:
+        """Build the FightResult of `fight` and count its outcome."""
+        result = FightResult.from_fight(fight, start_round, wall_time, status)
+        self.metrics.record_outcome(result.status, result.rounds)
+        return result
+
+    def _timed_round(self, fight: Fight) -> None:
+        round_started = time.perf_counter()
+        fight.start_round(True)
+        self.metrics.observe("round_seconds", time.perf_counter() - round_started)
+
+    def _end_fight(self, fight: Fight) -> None:
+        """Clean a finished or stopped fight up and release its participants."""
+        try:
+            fight.end()
+        except Exception:
+            pass
+        self._release_fight(fight)
+
+    def _play_batch(self, fights: List[Fight], stop: Optional[threading.Event] = None) -> List[FightResult]:
+        """Play fights to completion (or to their limits), stepping them round-robin."""
+        started = time.perf_counter()
+        start_rounds = {fight: fight.round for fight in fights}
+        limits = {}
+        for fight in fights:
+            max_rounds, timeout = self._limits(fight)
+            limits[fight] = (max_rounds, started + timeout if timeout else None)
+        done: Dict[Fight, FightResult] = {}
+        self.metrics.inc("fights_started_total", len(fights))
+        pending = list(fights)
+        try:
+            while pending:
+                if stop is not None and stop.is_set():
+                    break
+                for fight in list(pending):
+                    over = fight.is_over()
+                    rounds_played = fight.round - start_rounds[fight]
+                    status = None if over else self._stop_reason(fight, rounds_played, *limits[fight])
+                    if over or status is not None:
+                        pending.remove(fight)
+                        done[fight] = self._result(fight, start_rounds[fight], time.perf_counter() - started, status)
+                        self._end_fight(fight)
+                    else:
+                        self._timed_round(fight)
+            # fights interrupted by `stop` (run timeout) get a result without winner
+            for fight in pending:
+                done[fight] = self._result(fight, start_rounds[fight], time.perf_counter() - started, TIMED_OUT)
+            return [done[fight] for fight in fights]
+        finally:
+            failed = [fight for fight in pending if fight not in done]
+            if failed:
+                self.metrics.inc("fights_failed_total", len(failed))
+            for fight in pending:
+                self._end_fight(fight)
+
+    def dispatch(self, fights: List[Fight], stop: Optional[threading.Event] = None) -> Future:
+        """
+        Hand a batch of fights to a worker in one dispatch.
+
+        The fights are played round-robin until they are all over or hit
+        their limits, or until `stop` is set (checked between rounds;
+        process workers always play to the end and their results are
+        dropped once stopped). Overlap checks and participant registration
+        are left to the caller; each fight releases its participants as
+        soon as it ends.
+
+        Returns:
+            Future resolved with the list of FightResult of the batch
+        """
+        fights = list(fights)
+        if self.backend == "thread":
+            return self._get_executor().submit(self._play_batch, fights, stop)
+
+        start_rounds = [f.round for f in fights]
+        payloads = [_serialize_fight(f, *self._limits(f)) for f in fights]
+        inner = self._get_executor().submit(_play_serialized, payloads)
+        self.metrics.inc("fights_started_total", len(fights))
+        outer: Future = Future()
+
+        def forward_cancel(future: Future) -> None:
+            if future.cancelled():
+                inner.cancel()
+
+        def apply_results(future: Future) -> None:
+            cancelled = outer.cancelled() or future.cancelled()
+            if cancelled or (stop is not None and stop.is_set()):
+                outer.cancel()
+                for fight in fights:
+                    # same split as the thread path: a cancel wins over the run timeout
+                    status = CANCELLED if cancelled or fight in self._cancelled else TIMED_OUT
+                    self.metrics.record_outcome(status, 0)
+                    self._end_fight(fight)
+                return
+            try:
+                results = []
+                for fight, start_round, result in zip(fights, start_rounds, future.result()):
+                    self.metrics.observe_many("round_seconds", result["round_times"])
+                    if fight in self._cancelled:
+                        # the worker could not be reached: drop its outcome
+                        results.append(self._result(fight, start_round, result["wall_time"], CANCELLED))
+                    else:
+                        _apply_fight_result(fight, result)
+                        results.append(self._result(fight, start_round, result["wall_time"], result["status"]))
+                    self._end_fight(fight)
+            except BaseException as exc:
+                self.metrics.inc("fights_failed_total", len(fights) - len(results))
+                for fight in fights:
+                    self._end_fight(fight)
+                outer.set_exception(exc)
+            else:
+                outer.set_result(results)
+
+        outer.add_done_callback(forward_cancel)
+        inner.add_done_callback(apply_results)
+        return outer
+
+    # Per-round execution ####################################################
+
+    async def _run_fight(self, fight: Fight) -> FightResult:
         # Run fight rounds in a thread to avoid blocking the event loop
+        started = time.perf_counter()
+        start_round = fight.round
+        max_rounds, timeout = self._limits(fight)
+        deadline = started + timeout if timeout else None
+        status = None
+        self.metrics.inc("fights_started_total")
         try:
             while not fight.is_over():
-                await asyncio.to_thread(fight.start_round, True)
+                status = self._stop_reason(fight, fight.round - start_round, max_rounds, deadline)
+                if status is not None:
+                    break
+                await asyncio.to_thread(self._timed_round, fight)
                 await asyncio.sleep(0)
+            return self._result(fight, start_round, time.perf_counter() - started, status)
+        except asyncio.CancelledError:
+            # run timeout
+            self.metrics.record_outcome(TIMED_OUT, fight.round - start_round)
+            raise
+        except Exception:
+            self.metrics.inc("fights_failed_total")
+            raise
         finally:
             # ensure fight end cleanup
-            try:
-                await asyncio.to_thread(fight.end)
-            except Exception:
-                pass
+            await asyncio.to_thread(self._end_fight, fight)
 
-    async def _run_all(self, fights: List[Fight]):
-        tasks = [asyncio.create_task(self._run_fight(f)) for f in fights]
-        await asyncio.gather(*tasks)
+    async def _admitted(
+        self,
+        slots: int,
+        run: Callable[[], Awaitable[Any]],
+        settled: Set[int],
+        priority: str,
+        fights: int,
+        submitted: float,
+    ):
+        """Wait for `slots` running slots (already reserved), await `run()`, give them back."""
+        settled.add(id(run))  # from here on, `acquire` owns the reservation
+        await self.admission.acquire(slots, priority)
+        started = time.perf_counter()
+        for _ in range(fights):
+            self._queue_wait.record(priority, started - submitted)
+            self.metrics.observe("queue_wait_seconds", started - submitted, priority)
+        try:
+            result = await run()
+        finally:
+            self.admission.release(slots)
+        for r in (result if isinstance(result, list) else [result]):
+            self._latency.record(priority, started - submitted + r.wall_time)
+            self.metrics.observe("fight_latency_seconds", started - submitted + r.wall_time, priority)
+        return result
 
-    def run_fights(self, fights: List[Fight], timeout: float | None = None):
-        """
-        Run multiple fights concurrently until completion.
+    async def _run_batch(self, batch: List[Fight], stop: threading.Event) -> List[FightResult]:
+        future = self.dispatch(batch, stop)
+        try:
+            return await asyncio.wrap_future(future)
+        finally:
+            if not future.done():
+                # On timeout, let the worker finish its current round before returning
+                stop.set()
+                await asyncio.wait([asyncio.wrap_future(future)])
 
-        - Validates that no character is present in more than one fight.
-        - Prevents starting fights that include characters already active in previous runs.
+    async def _run_all(self, fights: List[Fight], priority: str = DEFAULT_PRIORITY) -> List[FightResult]:
+        submitted = time.perf_counter()
+        if self.execution == "round":
+            units = [([f], partial(self._run_fight, f)) for f in fights]
+            stop = None
+        else:
+            stop = threading.Event()
+            batches = [fights[i:i + self.batch_size] for i in range(0, len(fights), self.batch_size)]
+            units = [(batch, partial(self._run_batch, batch, stop)) for batch in batches]
+
+        slots = [self.admission.slots_for(len(batch)) for batch, _ in units]
+        await self.admission.reserve(sum(slots), priority)
+        settled: Set[int] = set()
+        tasks = [
+            asyncio.create_task(self._admitted(n, run, settled, priority, len(batch), submitted))
+            for n, (batch, run) in zip(slots, units)
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            if stop is not None:
+                stop.set()
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
+            # tasks cancelled before their first step never reached `acquire`
+            unused = sum(n for n, (_, run) in zip(slots, units) if id(run) not in settled)
+            if unused:
+                self.admission.cancel(unused, priority)
+        if self.execution == "round":
+            return list(results)
+        return [result for batch in results for result in batch]
+
+    def _register(self, fights: List[Fight]) -> None:
+        self._check_overlaps(fights)
+        with self._lock:
+            for fight in fights:
+                participants = self._participants_ids(fight)
+                self._fight_participants[fight] = participants
+                self._active_characters.update(participants)
+
+    def _release_fight(self, fight: Fight) -> None:
+        """Unregister the participants of `fight` (no-op once done)."""
+        with self._lock:
+            self._active_characters.difference_update(self._fight_participants.pop(fight, ()))
+            self._cancelled.discard(fight)
+
+    def cancel(self, fight: Fight) -> bool:
         """
-        if not fights:
-            return
+        Stop `fight` before its next round.
 
-        participants = self._check_overlaps(fights)
+        The fight ends with the "cancelled" status (a fight still queued
+        stops as soon as it gets its turn) and its participants are
+        released; the other fights are not affected.
 
-        # register participants
+        Returns:
+            False when the fight is not running in this engine
+        """
         with self._lock:
-            self._active_characters.update(participants)
+            if fight not in self._fight_participants:
+                return False
+            self._cancelled.add(fight)
+            return True
+
+    async def run_fights_async(
+        self, fights: List[Fight], timeout: float | None = None, priority: Optional[str] = None
+    ) -> List[FightResult]:
+        """
+        Run multiple fights concurrently until completion, on the running loop.
+
+        Same checks and arguments as `run_fights`; the fights are played by
+        the workers so the calling loop keeps serving other tasks meanwhile.
+
+        Returns:
+            One FightResult per fight, in the order of `fights`
+        """
+        if not fights:
+            return []
 
+        priority = self._resolve_priority(fights, priority)
+        self._register(fights)
         try:
-            # Use asyncio.run to provide an event loop for this call
             if timeout:
-                asyncio.run(asyncio.wait_for(self._run_all(fights), timeout))
-            else:
-                asyncio.run(self._run_all(fights))
+                return await asyncio.wait_for(self._run_all(fights, priority), timeout)
+            return await self._run_all(fights, priority)
+        finally:
+            for fight in fights:
+                self._release_fight(fight)
+
+    async def _run_one(self, fight: Fight, priority: str) -> FightResult:
+        try:
+            results = await self._run_all([fight], priority)
+            return results[0]
         finally:
-            # unregister participants
-            with self._lock:
-                for p in participants:
-                    self._active_characters.discard(p)
+            self._release_fight(fight)
+
+    def submit(self, fight: Fight, priority: Optional[str] = None) -> 'Future[FightResult]':
+        """
+        Start one fight and return immediately.
+
+        The overlap check and the registration of the participants happen
+        now, so a character already fighting makes the returned future fail
+        with ValueError. The participants are released when the fight ends.
+
+        Returns:
+            concurrent.futures.Future resolved with the FightResult
+        """
+        try:
+            priority = self._resolve_priority([fight], priority)
+            self._register([fight])
+        except ValueError as exc:
+            future: Future = Future()
+            future.set_exception(exc)
+            return future
+        loop = self._loop or engine_loop()
+        try:
+            return asyncio.run_coroutine_threadsafe(self._run_one(fight, priority), loop)
+        except BaseException:
+            self._release_fight(fight)
+            raise
+
+    @staticmethod
+    def as_completed(futures: Iterable[Future], timeout: float | None = None) -> Iterator[Future]:
+        """Yield the futures returned by `submit` as their fights finish."""
+        return concurrent.futures.as_completed(futures, timeout)
+
+    async def results(self, fights: Iterable[Fight], priority: Optional[str] = None) -> AsyncIterator[FightResult]:
+        """
+        Run fights on the running loop and yield each FightResult as soon as its fight ends.
+
+        Every fight is checked and registered before the first one starts,
+        like `run_fights_async`.
+        """
+        fights = list(fights)
+        priorities = [self._resolve_priority([f], priority) for f in fights]
+        if fights:
+            self._register(fights)
+        tasks = [asyncio.ensure_future(self._run_one(f, prio)) for f, prio in zip(fights, priorities)]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def run_fights(
+        self, fights: List[Fight], timeout: float | None = None, priority: Optional[str] = None
+    ) -> List[FightResult]:
+        """
+        Run multiple fights concurrently until completion.
+
+        - Validates that no character is present in more than one fight.
+        - Prevents starting fights that include characters already active in previous runs.
+        - `priority` ("interactive", "tower" or "background") overrides the
+          `priority` attribute of the fights.
+
+        The fights run on the engine event loop; this call only blocks the
+        calling thread. Do not call it from a coroutine: await
+        `run_fights_async` instead.
+
+        Returns:
+            One FightResult per fight, in the order of `fights`
+        """
+        if not fights:
+            return []
+
+        loop = self._loop or engine_loop()
+        return asyncio.run_coroutine_threadsafe(self.run_fights_async(fights, timeout, priority), loop).result()
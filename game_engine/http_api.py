@@ -0,0 +1,433 @@
+"""
+Local HTTP game API over the GameEngine.
+
+A small asyncio HTTP/1.1 server (stdlib only, keep-alive, JSON bodies)
+exposing real game work, so load tests measure fights and saves instead of
+file serving:
+
+    GET  /api/health                  engine admission state
+    GET  /metrics                     engine metrics (Prometheus text)
+    POST /api/characters              {"class", "name"?, "level"?, "user_id"?} -> 201 character
+    GET  /api/characters/<user_id>    character of the roster
+    POST /api/fights/duel             {"attacker": <fighter>, "defender": <fighter>, "max_rounds"?}
+    POST /api/fights/team             {"attackers": [<fighter>...], "defenders": [<fighter>...], "max_rounds"?}
+    POST /api/tower/run               {"party": [<fighter>...], "start_floor"?, "floors"?, "enemies"?, "difficulty"?}
+    POST /api/saves/<user_id>         save a roster character with SaveManager
+    GET  /api/saves/<user_id>         saved data
+    POST /api/saves/<user_id>/load    rebuild the saved character into the roster
+
+A <fighter> is either {"user_id": ...} for a roster character or a spec
+{"class", "level"?, "name"?} for a throwaway character built for the request.
+
+The event loop only parses requests and routes them: building and
+levelling characters, tower runs and save files go through a worker pool,
+and fights are awaited with `GameEngine.run_fights_async`, so a handler
+never blocks the loop. EngineBusy answers 503, a character already
+fighting 409.
+
+Usage:
+    python -m jeuxRPG.game_engine.http_api --port 8080 --workers 8 --saves .data/api_saves
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import partial
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class.character import Character
+from jeuxRPG._core.save import PlayerSaveData, SaveCategory, SaveManager
+from jeuxRPG.game_engine.admission import EngineBusy
+from jeuxRPG.game_engine.engine import GameEngine
+from jeuxRPG.game_engine.result import FightResult
+from jeuxRPG.game_engine.tower import TowerRun
+
+logger = logging.getLogger(__name__)
+
+MAX_BODY = 64 * 1024
+MAX_LEVEL = 100
+MAX_FIGHTERS = 8
+MAX_FLOORS = 20
+
+
+class HTTPError(Exception):
+    """Error answered to the client with `status` and a JSON message."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+Response = Tuple[int, Any]
+Handler = Callable[..., Awaitable[Response]]
+
+
+def _xp_for_level(level: int) -> int:
+    # XP to go from level 1 to `level` (100 XP per level reached)
+    return sum(i * 100 for i in range(1, level))
+
+
+def character_view(character: Character) -> Dict[str, Any]:
+    """JSON view of a character (same fields as its save data)."""
+    data = asdict(PlayerSaveData.from_character(character))
+    data["alive"] = character.is_alive()
+    return data
+
+
+def result_view(result: FightResult) -> Dict[str, Any]:
+    return {
+        "name": result.name,
+        "status": result.status,
+        "winner": result.winner_side,
+        "rounds": result.rounds,
+        "wall_time": result.wall_time,
+        "damage": result.damage,
+        "healing": result.healing,
+    }
+
+
+class GameAPIServer:
+    """
+    HTTP front of a GameEngine.
+
+    Args:
+        engine: Engine playing the fights, a new one capped at `max_rounds`
+            rounds per fight when omitted (Priest pairings may never end)
+        saves: SaveManager used by the save endpoints
+        workers: Size of the worker pool running the blocking work
+        max_roster: Characters kept in the roster, least recently used first out
+        max_rounds: Round cap of the default engine
+    """
+
+    def __init__(
+        self,
+        engine: Optional[GameEngine] = None,
+        saves: Optional[SaveManager] = None,
+        workers: int = 4,
+        max_roster: int = 10000,
+        max_rounds: int = 200,
+    ):
+        self._own_engine = engine is None
+        self.engine = engine or GameEngine(max_rounds=max_rounds)
+        self.saves = saves or SaveManager.get_instance()
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="game-api")
+        self.max_roster = max_roster
+        self.roster: "OrderedDict[str, Character]" = OrderedDict()
+        self._ids = itertools.count()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes: List[Tuple[str, re.Pattern, Handler]] = [
+            ("GET", re.compile(r"/api/health"), self.health),
+            ("GET", re.compile(r"/metrics"), self.metrics),
+            ("POST", re.compile(r"/api/characters"), self.create_character),
+            ("GET", re.compile(r"/api/characters/(?P<user_id>[^/]+)"), self.get_character),
+            ("POST", re.compile(r"/api/fights/duel"), self.duel),
+            ("POST", re.compile(r"/api/fights/team"), self.team_battle),
+            ("POST", re.compile(r"/api/tower/run"), self.tower_run),
+            ("POST", re.compile(r"/api/saves/(?P<user_id>[^/]+)"), self.save_character),
+            ("GET", re.compile(r"/api/saves/(?P<user_id>[^/]+)"), self.get_save),
+            ("POST", re.compile(r"/api/saves/(?P<user_id>[^/]+)/load"), self.load_save),
+        ]
+
+    # ------------------------------------------------------------------ server
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> int:
+        """Start listening on the running loop and return the bound port."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.pool.shutdown(wait=True)
+        if self._own_engine:
+            self.engine.close()
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        await self.start(host, port)
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    await self._write(writer, HTTPStatus.BAD_REQUEST, {"error": "Malformed request"}, False)
+                    break
+                if length > MAX_BODY:
+                    await self._write(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Body too large"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self.handle(method, target, body)
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                await self._write(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool) -> None:
+        if isinstance(payload, str):
+            body, content_type = payload.encode(), "text/plain; version=0.0.4"
+        else:
+            body, content_type = json.dumps(payload, default=str).encode(), "application/json"
+        status = HTTPStatus(status)
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            head.append("Retry-After: 1")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def handle(self, method: str, target: str, body: bytes) -> Response:
+        """Route one request and turn the errors into HTTP statuses."""
+        path = target.split("?", 1)[0].rstrip("/") or "/"
+        allowed = False
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            if route_method != method:
+                allowed = True
+                continue
+            try:
+                payload = json.loads(body) if body else {}
+                if not isinstance(payload, dict):
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "The body must be a JSON object")
+                return await handler(payload, **match.groupdict())
+            except HTTPError as exc:
+                return exc.status, {"error": exc.message}
+            except json.JSONDecodeError:
+                return HTTPStatus.BAD_REQUEST, {"error": "Invalid JSON body"}
+            except EngineBusy as exc:
+                return HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(exc)}
+            except Exception:
+                logger.exception("Error while handling %s %s", method, path)
+                return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal error"}
+        if allowed:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"{method} not allowed on {path}"}
+        return HTTPStatus.NOT_FOUND, {"error": f"No route for {path}"}
+
+    async def _offload(self, func: Callable, *args, **kwargs) -> Any:
+        """Run blocking work on the worker pool."""
+        return await asyncio.get_running_loop().run_in_executor(self.pool, partial(func, *args, **kwargs))
+
+    # ------------------------------------------------------------------ roster
+
+    def _remember(self, character: Character) -> None:
+        self.roster[character.user_id] = character
+        self.roster.move_to_end(character.user_id)
+        while len(self.roster) > self.max_roster:
+            self.roster.popitem(last=False)
+
+    def _lookup(self, user_id: str) -> Character:
+        character = self.roster.get(user_id)
+        if character is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"Unknown character {user_id}")
+        self.roster.move_to_end(user_id)
+        return character
+
+    def _build(self, spec: Dict[str, Any], user_id: Optional[str] = None) -> Character:
+        """Create a character from a spec (called on the worker pool)."""
+        class_name = spec.get("class")
+        if not isinstance(class_name, str):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "A character needs a \"class\"")
+        level = spec.get("level", 1)
+        if not isinstance(level, int) or not 1 <= level <= MAX_LEVEL:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"\"level\" must be an integer between 1 and {MAX_LEVEL}")
+        user_id = user_id or f"api{next(self._ids)}"
+        try:
+            character = Character.create(class_name, user_id=user_id, name=str(spec.get("name") or user_id))
+        except ValueError as exc:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(exc))
+        if level > 1:
+            character.gain_exp(_xp_for_level(level))
+        return character
+
+    async def _fighters(self, specs: Any, field: str) -> List[Character]:
+        """Roster characters are looked up on the loop, the others built on the pool."""
+        if isinstance(specs, dict):
+            specs = [specs]
+        if not isinstance(specs, list) or not 1 <= len(specs) <= MAX_FIGHTERS:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"\"{field}\" must hold 1 to {MAX_FIGHTERS} fighters")
+        if not all(isinstance(spec, dict) for spec in specs):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Invalid fighter in \"{field}\"")
+        fighters = [self._lookup(spec["user_id"]) if "user_id" in spec else None for spec in specs]
+        to_build = [spec for spec, fighter in zip(specs, fighters) if fighter is None]
+        if to_build:
+            built = iter(await self._offload(lambda: [self._build(spec) for spec in to_build]))
+            fighters = [fighter or next(built) for fighter in fighters]
+        return fighters
+
+    # ---------------------------------------------------------------- handlers
+
+    async def health(self, payload: Dict[str, Any]) -> Response:
+        return HTTPStatus.OK, {"status": "busy" if self.engine.busy else "ok", **self.engine.admission_stats()}
+
+    async def metrics(self, payload: Dict[str, Any]) -> Response:
+        return HTTPStatus.OK, self.engine.metrics_text()
+
+    async def create_character(self, payload: Dict[str, Any]) -> Response:
+        user_id = payload.get("user_id")
+        if user_id is not None and (not isinstance(user_id, str) or not user_id.strip()):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "\"user_id\" must be a non-empty string")
+        character = await self._offload(self._build, payload, user_id)
+        self._remember(character)
+        return HTTPStatus.CREATED, character_view(character)
+
+    async def get_character(self, payload: Dict[str, Any], user_id: str) -> Response:
+        return HTTPStatus.OK, character_view(self._lookup(user_id))
+
+    async def _fight(self, attackers: Any, defenders: Any, payload: Dict[str, Any], name: str) -> Response:
+        sides = await self._fighters(attackers, "attackers"), await self._fighters(defenders, "defenders")
+        try:
+            fight = Fight(*sides, name=f"{name}-{next(self._ids)}")
+        except ValueError as exc:
+            # the same character on both sides
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(exc))
+        max_rounds = payload.get("max_rounds")
+        if max_rounds is not None:
+            if not isinstance(max_rounds, int) or max_rounds < 1:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "\"max_rounds\" must be a positive integer")
+            fight.max_rounds = max_rounds
+        try:
+            result, = await self.engine.run_fights_async([fight])
+        except ValueError as exc:
+            # a roster character is already fighting
+            raise HTTPError(HTTPStatus.CONFLICT, str(exc))
+        return HTTPStatus.OK, result_view(result)
+
+    async def duel(self, payload: Dict[str, Any]) -> Response:
+        for side in ("attacker", "defender"):
+            if not isinstance(payload.get(side), dict):
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"\"{side}\" is required")
+        return await self._fight(payload["attacker"], payload["defender"], payload, "duel")
+
+    async def team_battle(self, payload: Dict[str, Any]) -> Response:
+        return await self._fight(payload.get("attackers"), payload.get("defenders"), payload, "team")
+
+    async def tower_run(self, payload: Dict[str, Any]) -> Response:
+        start_floor = payload.get("start_floor", 1)
+        floors = payload.get("floors", 1)
+        enemies = payload.get("enemies", 2)
+        for name, value, high in (("start_floor", start_floor, MAX_LEVEL), ("floors", floors, MAX_FLOORS),
+                                  ("enemies", enemies, MAX_FIGHTERS)):
+            if not isinstance(value, int) or not 1 <= value <= high:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, f"\"{name}\" must be an integer between 1 and {high}")
+        party = await self._fighters(payload.get("party"), "party")
+
+        def run() -> Dict[str, Any]:
+            tower = TowerRun(self.engine)
+            try:
+                reached = tower.run_tour(
+                    party,
+                    start_floor=start_floor,
+                    max_floors=start_floor + floors - 1,
+                    enemies_before_boss_range=(enemies, enemies),
+                    difficulty=str(payload.get("difficulty") or "normal"),
+                )
+            except ValueError as exc:
+                raise HTTPError(HTTPStatus.CONFLICT, str(exc))
+            return {"reached_floor": reached, "party": [character_view(c) for c in party]}
+
+        # run_tour plays its floors one after the other with the blocking run_fights
+        return HTTPStatus.OK, await self._offload(run)
+
+    async def save_character(self, payload: Dict[str, Any], user_id: str) -> Response:
+        character = self._lookup(user_id)
+        data = PlayerSaveData.from_character(character).to_dict()
+        if not await self._offload(self.saves.save, SaveCategory.PLAYERS, user_id, data):
+            raise HTTPError(HTTPStatus.INTERNAL_SERVER_ERROR, f"Could not save {user_id}")
+        return HTTPStatus.OK, {"saved": user_id}
+
+    async def get_save(self, payload: Dict[str, Any], user_id: str) -> Response:
+        data = await self._offload(self.saves.load, SaveCategory.PLAYERS, user_id)
+        if data is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No save for {user_id}")
+        return HTTPStatus.OK, data
+
+    async def load_save(self, payload: Dict[str, Any], user_id: str) -> Response:
+        def load() -> Optional[Character]:
+            data = self.saves.load(SaveCategory.PLAYERS, user_id)
+            if data is None:
+                return None
+            save = PlayerSaveData.from_dict(data)
+            character = self._build({"class": save.char_class, "name": save.name, "level": 1}, user_id)
+            # replay the progression: the level reached plus the XP kept toward the next one
+            xp = _xp_for_level(save.level) + save.exp
+            if xp > 0:
+                character.gain_exp(xp)
+            return character
+
+        character = await self._offload(load)
+        if character is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No save for {user_id}")
+        self._remember(character)
+        return HTTPStatus.OK, character_view(character)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local HTTP game API over the GameEngine")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=8, help="Worker pool of the blocking handlers")
+    parser.add_argument("--engine-workers", type=int, default=None, help="Workers of the GameEngine")
+    parser.add_argument("--max-concurrent", type=int, default=None)
+    parser.add_argument("--max-pending", type=int, default=None)
+    parser.add_argument("--max-rounds", type=int, default=200)
+    parser.add_argument("--saves", default=".data/api_saves", help="SaveManager directory")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    engine = GameEngine(
+        max_workers=args.engine_workers,
+        max_concurrent=args.max_concurrent,
+        max_pending=args.max_pending,
+        max_rounds=args.max_rounds,
+    )
+    server = GameAPIServer(engine, SaveManager(args.saves), workers=args.workers)
+    print(f"Game API listening on http://{args.host}:{args.port}", flush=True)
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.close()
+
+
+if __name__ == "__main__":
+    main()
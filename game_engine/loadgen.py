@@ -0,0 +1,388 @@
+"""
+Open-loop load generator for the GameEngine.
+
+Fights arrive following a Poisson process at the configured rate, whatever
+the engine is doing: an arrival never waits for a previous fight to finish.
+Each arrival is a duel, a team battle or a tower floor built from the real
+game classes, and is handed to `GameEngine.run_fights_async` on the running
+loop. Latencies are measured from the *scheduled* arrival time, so a
+generator that falls behind does not hide the queueing delay (no
+coordinated omission).
+
+The rate can be stepped (e.g. 50,100,200,400 fights/s) to find the
+saturation point of the engine on a given box: the stage where the
+completed throughput stops following the offered rate, or the tail latency
+explodes.
+
+Usage:
+    python -m jeuxRPG.game_engine.loadgen --rate 50,100,200,400 --step 10 \\
+        --mix duel=5,team=3,tower=2 --max-concurrent 64 --max-pending 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class.character import Character
+from jeuxRPG.game_engine.admission import EngineBusy
+from jeuxRPG.game_engine.engine import GameEngine
+from jeuxRPG.game_engine.result import WON
+from jeuxRPG.game_engine.stats import percentile
+from jeuxRPG.game_engine.tower import TowerRun
+
+
+HERO_CLASSES = ("Knight", "Priest", "Mage", "Archer", "Necromancien")
+WORKLOADS = ("duel", "team", "tower")
+DEFAULT_MIX = {"duel": 5.0, "team": 3.0, "tower": 2.0}
+PERCENTILES = (("p50", 50), ("p95", 95), ("p99", 99), ("p999", 99.9))
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Parse "duel=5,team=3,tower=2" into workload weights."""
+    mix: Dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, weight = item.partition("=")
+        if name not in WORKLOADS:
+            raise ValueError(f"Unknown workload {name!r}, expected one of {WORKLOADS}")
+        mix[name] = float(weight or 1)
+    if not mix or sum(mix.values()) <= 0:
+        raise ValueError("The workload mix needs at least one positive weight")
+    return mix
+
+
+class WorkloadFactory:
+    """
+    Builds the fights of the load test.
+
+    - duel: one hero against another, levels 1-10
+    - team: two parties of 2 to 3 heroes
+    - tower: a party of 2 heroes against the mobs of a random floor (a boss
+      every 5 floors), queued with the "tower" priority like `TowerRun`
+
+    Every fight gets `max_rounds` (a draw past it): some pairings, e.g. a
+    Priest healing against a low-damage class, never end on their own and
+    would hold their engine slot forever.
+
+    Parties are given to Fight as character lists rather than Team objects,
+    so `Team.all_teams` does not grow during a long run.
+    """
+
+    def __init__(
+        self, engine: GameEngine, seed: Optional[int] = None, max_floor: int = 10, max_rounds: Optional[int] = 200
+    ):
+        self.rng = random.Random(seed)
+        self.max_floor = max_floor
+        self.max_rounds = max_rounds
+        self.tower = TowerRun(engine)
+        self._ids = itertools.count()
+
+    def _hero(self, level: int) -> Character:
+        n = next(self._ids)
+        cls_name = self.rng.choice(HERO_CLASSES)
+        hero = Character.create(cls_name, user_id=f"load{n}", name=f"{cls_name} {n}")
+        xp = self.tower._xp_for_level(level)
+        if xp > 0:
+            hero.gain_exp(xp)
+        return hero
+
+    def _party(self, size: int, level: int) -> List[Character]:
+        return [self._hero(level) for _ in range(size)]
+
+    def build(self, kind: str) -> Fight:
+        fight = self._build(kind)
+        if self.max_rounds is not None:
+            fight.max_rounds = self.max_rounds
+        return fight
+
+    def _build(self, kind: str) -> Fight:
+        n = next(self._ids)
+        if kind == "duel":
+            level = self.rng.randint(1, 10)
+            return Fight(self._hero(level), self._hero(level), name=f"duel-{n}")
+        if kind == "team":
+            level = self.rng.randint(1, 10)
+            size = self.rng.randint(2, 3)
+            return Fight(self._party(size, level), self._party(size, level), name=f"team-{n}")
+        if kind == "tower":
+            floor = self.rng.randint(1, self.max_floor)
+            party = self._party(2, floor + 1)
+            if floor % 5 == 0:
+                mobs = [self.tower._make_mob(floor, 0, is_boss=True, boss_rank=floor // 5)]
+            else:
+                mobs = [self.tower._make_mob(floor, i) for i in range(self.rng.randint(1, 3))]
+            fight = Fight(party, mobs, name=f"tower-{n}")
+            fight.priority = "tower"
+            return fight
+        raise ValueError(f"Unknown workload {kind!r}")
+
+
+class _Window:
+    """Outcomes collected between two reports."""
+
+    __slots__ = ("offered", "completed", "draws", "rejected", "failed", "latencies", "by_kind")
+
+    def __init__(self) -> None:
+        self.offered = 0
+        self.completed = 0
+        self.draws = 0
+        self.rejected = 0
+        self.failed = 0
+        self.latencies: List[float] = []
+        self.by_kind: Dict[str, List[float]] = {}
+
+    def merge(self, other: '_Window') -> None:
+        self.offered += other.offered
+        self.completed += other.completed
+        self.draws += other.draws
+        self.rejected += other.rejected
+        self.failed += other.failed
+        self.latencies += other.latencies
+        for kind, values in other.by_kind.items():
+            self.by_kind.setdefault(kind, []).extend(values)
+
+
+def _latency_summary(values: Sequence[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    summary = {name: percentile(ordered, q) * 1000 for name, q in PERCENTILES}
+    summary["max"] = ordered[-1] * 1000 if ordered else 0.0
+    return summary
+
+
+def _window_summary(window: _Window, seconds: float) -> Dict[str, Any]:
+    seconds = max(seconds, 1e-9)
+    return {
+        "offered_per_s": window.offered / seconds,
+        "throughput_per_s": window.completed / seconds,
+        "completed": window.completed,
+        "draws": window.draws,
+        "rejected": window.rejected,
+        "failed": window.failed,
+        "latency_ms": _latency_summary(window.latencies),
+    }
+
+
+@dataclass
+class LoadReport:
+    """Result of `run_load`.
+
+    Attributes:
+        intervals: One summary per reporting interval (time series)
+        stages: One summary per target rate
+        saturation_rate: First target rate the engine could not follow, None if it kept up
+        engine: `GameEngine.metrics_snapshot()` at the end of the run
+    """
+    intervals: List[Dict[str, Any]] = field(default_factory=list)
+    stages: List[Dict[str, Any]] = field(default_factory=list)
+    saturation_rate: Optional[float] = None
+    engine: Dict[str, Any] = field(default_factory=dict)
+
+
+def find_saturation(
+    stages: Sequence[Mapping[str, Any]], min_ratio: float = 0.9, slo_ms: Optional[float] = None
+) -> Optional[float]:
+    """
+    First stage whose completed throughput falls under `min_ratio` of the
+    rate the generator actually offered, or whose p99 exceeds `slo_ms`.
+
+    Fights rejected by the admission control count as not served.
+    """
+    for stage in stages:
+        if stage["throughput_per_s"] < min_ratio * stage["offered_per_s"]:
+            return stage["rate"]
+        if slo_ms is not None and stage["latency_ms"]["p99"] > slo_ms:
+            return stage["rate"]
+    return None
+
+
+async def run_load(
+    engine: GameEngine,
+    rates: Sequence[float],
+    step: float,
+    mix: Optional[Mapping[str, float]] = None,
+    interval: float = 1.0,
+    drain: float = 30.0,
+    seed: Optional[int] = None,
+    max_rounds: Optional[int] = 200,
+    slo_ms: Optional[float] = None,
+    report=None,
+) -> LoadReport:
+    """
+    Drive `engine` with Poisson arrivals, `step` seconds per rate of `rates`.
+
+    Args:
+        engine: Engine under test (its admission settings decide what is rejected)
+        rates: Target arrival rates, in fights per second
+        step: Duration of each rate stage, in seconds
+        mix: Workload weights (see `WORKLOADS`), `DEFAULT_MIX` by default
+        interval: Reporting period of the time series, in seconds
+        drain: Seconds left to the in-flight fights once the arrivals stop
+        seed: Seed of the arrivals and of the workloads
+        max_rounds: Round cap of every fight (see `WorkloadFactory`)
+        slo_ms: Optional p99 objective used to detect the saturation point
+        report: Callable receiving each interval summary as it is produced
+
+    Returns:
+        LoadReport
+    """
+    mix = dict(mix or DEFAULT_MIX)
+    kinds = list(mix)
+    weights = [mix[k] for k in kinds]
+    rng = random.Random(seed)
+    factory = WorkloadFactory(engine, seed=None if seed is None else seed + 1, max_rounds=max_rounds)
+    result = LoadReport()
+    window = _Window()
+    stage_window = _Window()
+    in_flight: set = set()
+
+    async def one(kind: str, fight: Fight, scheduled: float) -> None:
+        try:
+            fight_result, = await engine.run_fights_async([fight])
+        except EngineBusy:
+            window.rejected += 1
+            return
+        except Exception:
+            window.failed += 1
+            return
+        latency = time.perf_counter() - scheduled
+        window.completed += 1
+        if fight_result.status != WON:
+            window.draws += 1
+        window.latencies.append(latency)
+        window.by_kind.setdefault(kind, []).append(latency)
+
+    def flush(now: float, rate: float) -> None:
+        nonlocal window, last_flush
+        summary = _window_summary(window, now - last_flush)
+        last_flush = now
+        summary.update({"t": round(now - started, 3), "rate": rate, "in_flight": len(in_flight)})
+        result.intervals.append(summary)
+        stage_window.merge(window)
+        window = _Window()
+        if report is not None:
+            report(summary)
+
+    started = last_flush = time.perf_counter()
+    for rate in rates:
+        stage_start = time.perf_counter()
+        stage_end = stage_start + step
+        next_arrival = stage_start + rng.expovariate(rate)
+        next_report = stage_start + interval
+        while True:
+            now = time.perf_counter()
+            if now >= next_report:
+                flush(now, rate)
+                next_report += interval
+            if next_arrival >= stage_end:
+                if now >= stage_end:
+                    break
+                await asyncio.sleep(min(stage_end, next_report) - now)
+                continue
+            if now < next_arrival:
+                await asyncio.sleep(min(next_arrival, next_report) - now)
+                continue
+            # arrivals are due whether or not the previous fights finished
+            kind = rng.choices(kinds, weights)[0]
+            task = asyncio.create_task(one(kind, factory.build(kind), next_arrival))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+            window.offered += 1
+            next_arrival += rng.expovariate(rate)
+            # let the started fights reach the engine even when running late
+            await asyncio.sleep(0)
+        if window.offered or window.completed:
+            flush(time.perf_counter(), rate)
+        # fights completing during the next stage are credited to it
+        elapsed = time.perf_counter() - stage_start
+        stage = _window_summary(stage_window, elapsed)
+        stage.update({
+            "rate": rate,
+            "seconds": round(elapsed, 3),
+            "in_flight": len(in_flight),
+            "by_kind": {kind: _latency_summary(v) for kind, v in stage_window.by_kind.items()},
+        })
+        result.stages.append(stage)
+        stage_window = _Window()
+
+    if in_flight:
+        done, pending = await asyncio.wait(set(in_flight), timeout=drain)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+    result.saturation_rate = find_saturation(result.stages, slo_ms=slo_ms)
+    result.engine = engine.metrics_snapshot()
+    return result
+
+
+def _print_interval(summary: Mapping[str, Any]) -> None:
+    lat = summary["latency_ms"]
+    print(
+        f"t={summary['t']:7.1f}s rate={summary['rate']:7.1f} offered={summary['offered_per_s']:7.1f}/s "
+        f"done={summary['throughput_per_s']:7.1f}/s in_flight={summary['in_flight']:5d} "
+        f"rejected={summary['rejected']:4d} failed={summary['failed']:3d} "
+        f"p50={lat['p50']:8.2f} p95={lat['p95']:8.2f} p99={lat['p99']:8.2f} p999={lat['p999']:8.2f} ms",
+        flush=True,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open-loop load test of the GameEngine")
+    parser.add_argument("--rate", default="50", help="Arrival rate(s) in fights/s, e.g. 50,100,200")
+    parser.add_argument("--step", type=float, default=10.0, help="Seconds spent at each rate")
+    parser.add_argument("--interval", type=float, default=1.0, help="Reporting period in seconds")
+    parser.add_argument("--mix", default="duel=5,team=3,tower=2")
+    parser.add_argument("--drain", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--max-rounds", type=int, default=200, help="Round cap of every fight (0: none)")
+    parser.add_argument("--slo-ms", type=float, default=None, help="p99 objective used for the saturation point")
+    parser.add_argument("--execution", default="fight", choices=("fight", "round"))
+    parser.add_argument("--batch-size", type=int, default=1)
+    parser.add_argument("--backend", default="thread", choices=("thread", "process"))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-concurrent", type=int, default=None)
+    parser.add_argument("--max-pending", type=int, default=None)
+    parser.add_argument("--json", default=None, help="Write the full report to this file")
+    args = parser.parse_args()
+
+    rates = [float(r) for r in args.rate.split(",") if r.strip()]
+    engine = GameEngine(
+        execution=args.execution,
+        batch_size=args.batch_size,
+        max_workers=args.workers,
+        backend=args.backend,
+        max_concurrent=args.max_concurrent,
+        max_pending=args.max_pending,
+    )
+    with engine:
+        report = asyncio.run(run_load(
+            engine, rates, args.step, parse_mix(args.mix), interval=args.interval,
+            drain=args.drain, seed=args.seed, max_rounds=args.max_rounds or None, slo_ms=args.slo_ms,
+            report=_print_interval,
+        ))
+
+    print("\nstage      rate   offered/s      done/s   rejected       p50       p95       p99      p999 (ms)")
+    for stage in report.stages:
+        lat = stage["latency_ms"]
+        print(
+            f"{stage['rate']:12.1f} {stage['offered_per_s']:11.1f} {stage['throughput_per_s']:11.1f} "
+            f"{stage['rejected']:10d} {lat['p50']:9.2f} {lat['p95']:9.2f} {lat['p99']:9.2f} {lat['p999']:9.2f}"
+        )
+    if report.saturation_rate is None:
+        print("The engine kept up with every rate.")
+    else:
+        print(f"Saturation reached at {report.saturation_rate:g} fights/s.")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as fh:
+            json.dump(report.__dict__, fh, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
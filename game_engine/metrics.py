@@ -0,0 +1,171 @@
+"""
+Engine instrumentation.
+
+Counters and fixed-bucket histograms updated by `GameEngine` while it plays
+fights. Recording a value is a bisect and a few integer additions under a
+lock; nothing is formatted until someone pulls a snapshot, either as JSON
+(`EngineMetrics.snapshot`) or as Prometheus text (`render_prometheus`).
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+ROUND_TIME_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 0.1, 1.0)
+ROUNDS_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377)
+
+COUNTERS = {
+    "fights_started_total": "Fights that started playing",
+    "fights_completed_total": "Fights that ended with a winner or a draw",
+    "fights_failed_total": "Fights stopped by an error",
+    "fights_timed_out_total": "Fights stopped by their deadline or by the run timeout",
+    "fights_cancelled_total": "Fights stopped by GameEngine.cancel",
+}
+HISTOGRAMS = {
+    "fight_rounds": ("Rounds played per fight", ROUNDS_BUCKETS, False),
+    "round_seconds": ("Execution time of one round", ROUND_TIME_BUCKETS, False),
+    "fight_latency_seconds": ("End-to-end fight latency, queue wait included", LATENCY_BUCKETS, True),
+    "queue_wait_seconds": ("Time spent waiting for a fight slot", LATENCY_BUCKETS, True),
+}
+GAUGES = {
+    "active_characters": "Characters registered in running fights",
+    "running_fights": "Fight slots in use",
+    "queued_fights": "Fights waiting for a slot",
+}
+STATUS_COUNTERS = {
+    "won": "fights_completed_total",
+    "draw": "fights_completed_total",
+    "timed_out": "fights_timed_out_total",
+    "cancelled": "fights_cancelled_total",
+}
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics: value <= bound)."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(sorted(bounds))
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = []
+        total = 0
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            buckets.append([bound, total])
+        return {"buckets": buckets, "sum": self.sum, "count": self.count}
+
+
+class EngineMetrics:
+    """
+    Metrics of one GameEngine.
+
+    Histograms flagged as per-priority hold one Histogram per priority
+    class; the others a single one.
+    """
+
+    def __init__(self, priorities: Iterable[str]):
+        self.priorities = tuple(priorities)
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.histograms: Dict[str, Any] = {}
+        for name, (_, bounds, per_priority) in HISTOGRAMS.items():
+            if per_priority:
+                self.histograms[name] = {p: Histogram(bounds) for p in self.priorities}
+            else:
+                self.histograms[name] = Histogram(bounds)
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def observe(self, name: str, value: float, priority: Optional[str] = None) -> None:
+        histogram = self.histograms[name]
+        with self._lock:
+            (histogram[priority] if priority is not None else histogram).observe(value)
+
+    def observe_many(self, name: str, values: Iterable[float]) -> None:
+        histogram = self.histograms[name]
+        with self._lock:
+            for value in values:
+                histogram.observe(value)
+
+    def record_outcome(self, status: str, rounds: int) -> None:
+        """Count a finished fight by status and record its rounds."""
+        with self._lock:
+            self.counters[STATUS_COUNTERS[status]] += 1
+            self.histograms["fight_rounds"].observe(rounds)
+
+    def snapshot(self, gauges: Optional[Mapping[str, float]] = None) -> Dict[str, Any]:
+        """JSON-serializable copy of every metric (gauges are given by the caller)."""
+        with self._lock:
+            histograms = {
+                name: (
+                    {p: h.snapshot() for p, h in histogram.items()}
+                    if isinstance(histogram, dict) else histogram.snapshot()
+                )
+                for name, histogram in self.histograms.items()
+            }
+            return {
+                "counters": dict(self.counters),
+                "gauges": dict(gauges or {}),
+                "histograms": histograms,
+            }
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value == float("inf"):
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _histogram_lines(name: str, histogram: Dict[str, Any], labels: str = "") -> List[str]:
+    prefix = f"{labels}," if labels else ""
+    lines = [f'{name}_bucket{{{prefix}le="{_format_value(bound)}"}} {count}' for bound, count in histogram["buckets"]]
+    lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {histogram["count"]}')
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {_format_value(histogram['sum'])}")
+    lines.append(f"{name}_count{suffix} {histogram['count']}")
+    return lines
+
+
+def render_prometheus(snapshot: Mapping[str, Any], namespace: str = "game_engine") -> str:
+    """
+    Render a snapshot (see `EngineMetrics.snapshot`) in the Prometheus text format.
+
+    Args:
+        snapshot: Metrics snapshot
+        namespace: Prefix of every metric name
+
+    Returns:
+        Exposition text, ending with a newline
+    """
+    lines: List[str] = []
+    for name, value in snapshot["counters"].items():
+        full = f"{namespace}_{name}"
+        lines += [f"# HELP {full} {COUNTERS.get(name, name)}", f"# TYPE {full} counter", f"{full} {value}"]
+    for name, value in snapshot["gauges"].items():
+        full = f"{namespace}_{name}"
+        lines += [f"# HELP {full} {GAUGES.get(name, name)}", f"# TYPE {full} gauge", f"{full} {_format_value(value)}"]
+    for name, histogram in snapshot["histograms"].items():
+        full = f"{namespace}_{name}"
+        lines += [f"# HELP {full} {HISTOGRAMS[name][0]}", f"# TYPE {full} histogram"]
+        if "buckets" in histogram:
+            lines += _histogram_lines(full, histogram)
+        else:
+            for priority, per_priority in histogram.items():
+                lines += _histogram_lines(full, per_priority, f'priority="{priority}"')
+    return "\n".join(lines) + "\n"
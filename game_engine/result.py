@@ -0,0 +1,75 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class.res.team.alliance import Alliance
+
+
+# Outcomes of a fight run by the engine
+WON = "won"                # one side won
+DRAW = "draw"              # no winner, or the round cap was reached
+TIMED_OUT = "timed_out"    # per-fight deadline or run timeout hit first
+CANCELLED = "cancelled"    # cancelled with GameEngine.cancel
+STATUSES = (WON, DRAW, TIMED_OUT, CANCELLED)
+
+
+@dataclass
+class FightResult:
+    """Outcome of a fight run by the GameEngine.
+
+    Attributes:
+        fight: The fight itself (its alliances are emptied once it ended)
+        winner: Winning alliance, None for a draw or an unfinished fight
+        winner_side: "attackers", "defenders" or None
+        rounds: Rounds played by the engine
+        wall_time: Seconds between the start of the fight and its result
+        damage: HP removed by each side ("attackers"/"defenders")
+        healing: HP restored by each side
+        status: One of `STATUSES`
+    """
+    fight: Fight
+    winner: Optional[Alliance]
+    winner_side: Optional[str]
+    rounds: int
+    wall_time: float
+    damage: Dict[str, int] = field(default_factory=dict)
+    healing: Dict[str, int] = field(default_factory=dict)
+    status: str = WON
+
+    @property
+    def name(self) -> str:
+        return self.fight.name
+
+    @property
+    def is_draw(self) -> bool:
+        return self.status == DRAW
+
+    @property
+    def interrupted(self) -> bool:
+        """True when the fight was stopped before its end (deadline or cancellation)."""
+        return self.status in (TIMED_OUT, CANCELLED)
+
+    @classmethod
+    def from_fight(
+        cls, fight: Fight, start_round: int, wall_time: float, status: Optional[str] = None
+    ) -> 'FightResult':
+        """
+        Build the result of `fight` (to call before `fight.end()`).
+
+        `status` is given for fights stopped by the engine (round cap,
+        deadline, cancellation): they never have a winner.
+        """
+        winner = fight.get_winner() if status is None else None
+        if status is None:
+            status = WON if winner is not None else DRAW
+        side = "attackers" if winner is fight.attackers else "defenders" if winner is fight.defenders else None
+        return cls(
+            fight=fight,
+            winner=winner,
+            winner_side=side,
+            rounds=fight.round - start_round,
+            wall_time=wall_time,
+            damage=dict(fight.damage_dealt),
+            healing=dict(fight.healing_done),
+            status=status,
+        )
@@ -0,0 +1,48 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, Iterable, List
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+class LatencyStats:
+    """
+    Recent latency samples per key (e.g. per priority).
+
+    Only the last `window` samples of each key are kept, so the summary
+    follows the current load instead of the whole process lifetime.
+    """
+
+    def __init__(self, keys: Iterable[str], window: int = 2048):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {k: deque(maxlen=window) for k in keys}
+        self._counts: Dict[str, int] = {k: 0 for k in self._samples}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[key].append(seconds)
+            self._counts[key] += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean, p50/p95/p99 and max (seconds) of every key."""
+        with self._lock:
+            samples = {k: sorted(v) for k, v in self._samples.items()}
+            counts = dict(self._counts)
+        return {
+            key: {
+                "count": counts[key],
+                "mean": sum(values) / len(values) if values else 0.0,
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+                "max": values[-1] if values else 0.0,
+            }
+            for key, values in samples.items()
+        }
@@ -1,10 +1,11 @@
 import random
-from typing import Callable, Iterable, Tuple
+from typing import Callable, Iterable, Optional, Tuple
 
 from jeuxRPG.game_engine.engine import GameEngine
 from jeuxRPG._class.character import Character
 from jeuxRPG._class.mob.mob import Mob
 from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class._event.confrontation.encounter.policy import FightPolicy
 
 
 TOWER_DIFFICULTIES = {
@@ -53,10 +54,19 @@ class TowerRun:
     - Every `special_boss_interval` boss floors spawn a stronger tough mob.
     - Mobs are scaled to the floor by granting XP to reach target level.
     - Tower mobs inherit reduced mob XP rewards and may apply tower-specific reward tuning.
+    - Bosses play with `boss_policy` (e.g. an MCTSPolicy) and regular mobs with
+      `mob_policy` (e.g. a TablePolicy) when they are given.
     """
 
-    def __init__(self, engine: GameEngine):
+    def __init__(
+        self,
+        engine: GameEngine,
+        boss_policy: Optional[FightPolicy] = None,
+        mob_policy: Optional[FightPolicy] = None,
+    ):
         self.engine = engine
+        self.boss_policy = boss_policy
+        self.mob_policy = mob_policy
 
     def _party_members(self, player: Character | Iterable[Character]) -> list[Character]:
         if isinstance(player, Character):
@@ -125,14 +135,16 @@ class TowerRun:
         boss_level_bonus = 2 + (max(1, boss_rank) - 1) * 2
         level_floor = max(1, round(floor * self._difficulty_multiplier(difficulty, "level_multiplier")))
         target_level = level_floor + (boss_level_bonus if is_boss else 0)
-        xp = self._xp_for_level(target_level)
-        if xp > 0:
-            mob.gain_exp(xp)
+        mob.set_level(target_level)
         if is_boss:
             mob.is_boss = True
             mob.is_tough = True
             mob.boss_rank = max(1, boss_rank)
             self._apply_tough_boss_stats(mob, floor, mob.boss_rank, difficulty)
+            if self.boss_policy is not None:
+                mob.ai_policy = self.boss_policy
+        elif self.mob_policy is not None:
+            mob.ai_policy = self.mob_policy
         self._apply_tower_xp_reward(mob, difficulty)
         return mob
 
@@ -173,6 +185,7 @@ class TowerRun:
             for i in range(1, count + 1):
                 mob = self._make_mob(floor, i, is_boss=False, difficulty=difficulty)
                 fight = Fight(party, mob, name=f"Floor{floor}-m{i}")
+                fight.priority = "tower"
                 self.engine.run_fights([fight])
                 if not self._party_is_alive(party):
                     return floor
@@ -182,6 +195,7 @@ class TowerRun:
                 boss_rank = 2 if special_boss_interval > 0 and floor % special_boss_interval == 0 else 1
                 boss = self._make_mob(floor, 0, is_boss=True, boss_rank=boss_rank, difficulty=difficulty)
                 boss_fight = Fight(party, boss, name=f"Floor{floor}-Boss")
+                boss_fight.priority = "tower"
                 self.engine.run_fights([boss_fight])
                 if not self._party_is_alive(party):
                     return floor
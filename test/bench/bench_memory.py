@@ -0,0 +1,64 @@
+"""
+Memory footprint of resident characters, measured with tracemalloc.
+
+Allocates `--count` characters of every playable class plus mobs and
+reports the traced bytes per character, the bytes taken by the stat
+objects alone (HP, the four attributes and the energies of a character)
+and by an empty status.
+
+Usage:
+    python test/bench/bench_memory.py --count 2000
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from jeuxRPG._class.character import Character  # noqa: E402
+from jeuxRPG._class.mob.mob import Mob  # noqa: E402,F401  (registers the "Mob" class)
+from jeuxRPG._class.res.character.stats.basic_stat import (  # noqa: E402
+    HP, Endurance, Force, Intelligence, Mana, Sagesse,
+)
+from jeuxRPG._class.stats.status import CharacterStatus  # noqa: E402
+
+CLASSES = ("Knight", "Priest", "Mage", "Archer", "Necromancien", "Mob")
+
+
+def traced(build, count: int) -> float:
+    """Traced bytes per object built by `build`, kept alive during the measure."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-character memory footprint")
+    parser.add_argument("--count", type=int, default=2000)
+    args = parser.parse_args()
+
+    Character.create("Knight", user_id="warmup", name="warmup")
+    for cls_name in CLASSES:
+        per_char = traced(lambda i: Character.create(cls_name, user_id=f"{cls_name}{i}", name=f"{cls_name} {i}"),
+                          args.count)
+        print(f"{cls_name:<14} {per_char:10.0f} B/character")
+
+    per_stats = traced(
+        lambda i: (HP(100), Force(10), Endurance(10), Intelligence(10), Sagesse(10), Mana(50)), args.count
+    )
+    print(f"{'stats only':<14} {per_stats:10.0f} B/character (HP, 4 attributes, 1 energy)")
+
+    per_status = traced(lambda i: CharacterStatus(), args.count)
+    print(f"{'status only':<14} {per_status:10.0f} B/character (no alteration yet)")
+
+
+if __name__ == "__main__":
+    main()
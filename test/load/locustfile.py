@@ -1,5 +1,7 @@
 from locust import HttpUser, between, task
 import json
+import random
+import uuid
 
 
 class ProjectPagesUser(HttpUser):
@@ -99,3 +101,100 @@ class ApiUser(HttpUser):
                 r.success()
             else:
                 r.failure(f"Unexpected status code: {r.status_code}")
+
+
+# ---------------------------------------------------------------------------
+# Game API users: run against the local game service
+#   python -m jeuxRPG.game_engine.http_api --port 8080
+#   locust -f test/load/locustfile.py --host http://127.0.0.1:8080 GameFightUser TowerUser SaveUser
+# 503 answers are the engine admission control shedding load, not errors.
+
+HERO_CLASSES = ["Knight", "Priest", "Mage", "Archer", "Necromancien"]
+
+
+def _fighter(level_max: int = 10) -> dict:
+    return {"class": random.choice(HERO_CLASSES), "level": random.randint(1, level_max)}
+
+
+def _check(response, *expected) -> None:
+    if response.status_code in expected or response.status_code == 503:
+        response.success()
+    else:
+        response.failure(f"Unexpected status code: {response.status_code}")
+
+
+class GameFightUser(HttpUser):
+    wait_time = between(0.5, 1.5)
+
+    @task(5)
+    def duel(self):
+        payload = {"attacker": _fighter(), "defender": _fighter()}
+        with self.client.post("/api/fights/duel", json=payload, name="POST /api/fights/duel",
+                              catch_response=True) as r:
+            _check(r, 200)
+
+    @task(2)
+    def team_battle(self):
+        size = random.randint(2, 3)
+        payload = {
+            "attackers": [_fighter() for _ in range(size)],
+            "defenders": [_fighter() for _ in range(size)],
+        }
+        with self.client.post("/api/fights/team", json=payload, name="POST /api/fights/team",
+                              catch_response=True) as r:
+            _check(r, 200)
+
+    @task(1)
+    def health(self):
+        self.client.get("/api/health", name="GET /api/health")
+
+
+class TowerUser(HttpUser):
+    wait_time = between(1, 3)
+
+    @task
+    def tower_run(self):
+        floor = random.randint(1, 10)
+        payload = {
+            "party": [_fighter(floor + 2), _fighter(floor + 2)],
+            "start_floor": floor,
+            "floors": 1,
+            "enemies": random.randint(1, 3),
+        }
+        with self.client.post("/api/tower/run", json=payload, name="POST /api/tower/run",
+                              catch_response=True) as r:
+            _check(r, 200)
+
+
+class SaveUser(HttpUser):
+    wait_time = between(0.5, 1.5)
+
+    def on_start(self) -> None:
+        self.user_id = f"locust-{uuid.uuid4().hex[:12]}"
+        payload = {"user_id": self.user_id, **_fighter()}
+        self.client.post("/api/characters", json=payload, name="POST /api/characters")
+
+    @task(3)
+    def save(self):
+        with self.client.post(f"/api/saves/{self.user_id}", name="POST /api/saves/<id>",
+                              catch_response=True) as r:
+            _check(r, 200)
+
+    @task(3)
+    def fetch_character(self):
+        self.client.get(f"/api/characters/{self.user_id}", name="GET /api/characters/<id>")
+
+    @task(2)
+    def load(self):
+        with self.client.post(f"/api/saves/{self.user_id}/load", name="POST /api/saves/<id>/load",
+                              catch_response=True) as r:
+            # nothing saved yet on the first calls
+            _check(r, 200, 404)
+
+    @task(1)
+    def fight_with_saved_character(self):
+        payload = {"attacker": {"user_id": self.user_id}, "defender": _fighter()}
+        with self.client.post("/api/fights/duel", json=payload, name="POST /api/fights/duel (roster)",
+                              catch_response=True) as r:
+            # 409: the roster character is still in a previous fight
+            _check(r, 200, 409)
@@ -7,7 +7,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pytest
 from jeuxRPG._class.character import Character, CharacterMeta
 from jeuxRPG._class.sub_character.knight import Knight
-from jeuxRPG._class.res.character.stats.basic_stat import HP, Force, Intelligence, Mana, Energie
+from jeuxRPG._class.res.character.stats.basic_stat import HP, Aura, Foie, Force, Intelligence, Ki, Mana, Energie
 
 
 class TestCharacterCreation:
@@ -164,6 +164,89 @@ class TestCharacterEnergie:
         with pytest.raises(ValueError, match="Not enough energy"):
             char.consume_energie(10, type(energie))
 
+    def test_energie_index_follows_add_and_change(self):
+        """Test energies added or replaced are found by type and by name."""
+        char = Character.create("Knight", "user123", "TestKnight")
+        aura = char.get_energie(Aura)
+        assert char.get_energie(Energie) is aura
+
+        foie = Foie(90)
+        char.add_energie(foie)
+        assert char.get_energie(Foie) is foie and char.get_stat("Foie") is foie
+        assert char.get_energie(Energie) is aura
+
+        mana = Mana(40)
+        char.change_energie(Foie, mana)
+        assert char.get_energie(Mana) is mana and char.get_stat("Mana") is mana
+        with pytest.raises(TypeError):
+            char.get_energie(Foie)
+        with pytest.raises(TypeError):
+            char.get_stat("Foie")
+
+    def test_energie_index_follows_change_type(self):
+        """Test an energy converted in place is found under its new type only."""
+        char = Character.create("Knight", "user123", "TestKnight")
+        aura = char.get_energie(Aura)
+        aura.change_type(Ki)
+        assert char.get_energie(Ki) is aura and char.get_stat("Ki") is aura
+        with pytest.raises(TypeError):
+            char.get_energie(Aura)
+        with pytest.raises(TypeError):
+            char.get_stat("Aura")
+
+    def test_rest_regenerates_like_stepwise(self):
+        """Test lazily caught-up rests give the values of one regenerate per rest."""
+        char = Character.create("Knight", "user123", "TestKnight")
+        aura = char.get_energie(Aura)
+        reference = Aura(aura.value, aura.regen_rate)
+        for energie in (aura, reference):
+            energie.current_value = 1
+        for _ in range(3):
+            char.rest()
+            reference.regenerate()
+        assert aura.current_value == reference.current_value < aura.value
+        for _ in range(50):
+            char.rest()
+        assert aura.current_value == aura.value
+
+    def test_rest_before_regen_rate_change(self):
+        """Test rests taken before a regen rate change regenerate at the former rate."""
+        char = Character.create("Knight", "user123", "TestKnight")
+        aura = char.get_energie(Aura)
+        aura.value = 100
+        aura.current_value = 0
+        former_rate = aura.regen_rate
+        char.rest()
+        char.rest()
+        aura.regen_rate = 0.05
+        char.rest()
+        assert aura.current_value == 2 * int(100 * former_rate) + 5
+
+    def test_writes_after_rests_are_not_regenerated_again(self):
+        """Test a write after rests replaces the caught-up value instead of being regenerated on top."""
+        char = Character.create("Knight", "user123", "TestKnight")
+        aura = char.get_energie(Aura)
+        aura.value = 100
+        aura.current_value = 0
+        char.rest()
+        aura.current_value = 10
+        assert aura.current_value == 10
+        char.rest()
+        aura -= 5
+        assert aura.current_value == 5 + int(100 * aura.regen_rate)
+        char.rest()
+        aura.set_max()
+        assert aura.current_value == 100
+
+    def test_replaced_energie_stops_regenerating(self):
+        """Test an energy replaced by change_energie no longer follows the rests."""
+        char = Character.create("Knight", "user123", "TestKnight")
+        aura = char.get_energie(Aura)
+        aura.current_value = 0
+        char.change_energie(Aura, Mana(40))
+        char.rest()
+        assert aura.current_value == 0
+
 
 class TestCharacterString:
     """Tests for character string representation."""
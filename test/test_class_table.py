@@ -0,0 +1,91 @@
+"""
+Tests for shared class tables and the per-character override layer.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.res.character.stats.basic_stat import Foie
+from jeuxRPG._class.res.character.table_stat_subclass import knight_table
+from jeuxRPG._class.res.class_table import ClassTableView, FrozenDict, freeze_class_table, patch_class_table
+from jeuxRPG._class.res.classType import DamageType
+from jeuxRPG._class.skills.damage_pipeline import damage_type_multiplier
+
+
+def xp_to_level(level):
+    return sum(i * 100 for i in range(1, level))
+
+
+class TestSharedClassTable:
+    """Characters of a class share one frozen table."""
+
+    def test_table_is_shared_and_frozen(self):
+        a = Character.create("Knight", "ct_a", "A")
+        b = Character.create("Knight", "ct_b", "B")
+        assert isinstance(a.class_table, ClassTableView)
+        assert a.class_table.base is b.class_table.base is knight_table
+        with pytest.raises(TypeError):
+            knight_table["advantage"] = None
+        with pytest.raises(TypeError):
+            knight_table["upgrade_stats"][20].pop("new")
+
+    def test_override_only_touches_one_character(self):
+        a = Character.create("Knight", "ct_c", "C")
+        b = Character.create("Knight", "ct_d", "D")
+        neutral = {"weakness": [], "resilience": []}
+        a.class_table["advantage"] = neutral
+        assert a.class_table["advantage"] is neutral
+        assert b.class_table.peek("advantage") is knight_table["advantage"]
+        a.class_table.reset("advantage")
+        assert a.class_table.peek("advantage") is knight_table["advantage"]
+
+    def test_advantage_changed_in_place_only_touches_one_character(self):
+        a = Character.create("Knight", "ct_h", "H")
+        b = Character.create("Knight", "ct_i", "I")
+        shared = knight_table["advantage"]
+        weakness, resilience = shared.get_weakness(), list(shared.resilience)
+        revision = shared.revision
+        b_row = damage_type_multiplier(b, DamageType.MAGIC)
+
+        a.class_table["advantage"].change_all_advantage()
+        a.class_table["advantage"].del_weakness(DamageType.PHYSICAL)
+
+        assert a.class_table["advantage"] is not shared
+        assert a.class_table["advantage"].weakness == []
+        assert (shared.get_weakness(), shared.resilience, shared.revision) == (weakness, resilience, revision)
+        assert b.class_table["advantage"].weakness == weakness
+        assert damage_type_multiplier(b, DamageType.MAGIC) == b_row
+        assert damage_type_multiplier(a, DamageType.MAGIC) != b_row
+
+    def test_new_energy_granted_once_per_character(self):
+        """The level 20 "new" energy is claimed on the character, not popped from the table."""
+        for user_id in ("ct_e", "ct_f"):
+            knight = Character.create("Knight", user_id, "Knight")
+            knight.gain_exp(xp_to_level(22))
+            assert knight.level == 22
+            assert [type(e) for e in knight.energie].count(Foie) == 1
+            assert knight.class_table.claimed_upgrades == (20,)
+        assert "new" in knight_table["upgrade_stats"][20]
+
+    def test_copy_and_pickle(self):
+        knight = Character.create("Knight", "ct_g", "G")
+        knight.class_table["advantage"] = {"weakness": [], "resilience": []}
+        for clone in (copy.deepcopy(knight.class_table), pickle.loads(pickle.dumps(knight.class_table))):
+            assert clone["advantage"] == {"weakness": [], "resilience": []}
+            assert set(clone) == set(knight_table)
+        assert copy.deepcopy(knight.class_table).base is knight_table
+
+    def test_freeze_is_idempotent_and_copies_are_plain(self):
+        frozen = freeze_class_table({"a": {"b": 1}})
+        assert isinstance(frozen["a"], FrozenDict)
+        assert freeze_class_table(frozen) is frozen
+        assert type(frozen.copy()) is dict and type(copy.deepcopy(frozen)) is dict
+
+    def test_balance_patch_updates_shared_table(self):
+        table = freeze_class_table({"base_stats": {"hp": 10, "force": 2}})
+        patch_class_table(table, {"base_stats": {"hp": 12}, "extra": {"a": 1}})
+        assert table["base_stats"] == {"hp": 12, "force": 2}
+        assert isinstance(table["extra"], FrozenDict)
@@ -0,0 +1,178 @@
+"""
+Tests for the compiled damage pipeline.
+
+The reference functions below are the original per-hit formulas; the compiled
+tables must reproduce them exactly over the whole stat range.
+"""
+
+import math
+
+import pytest
+
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.mob.mob import Mob  # registers the "Mob" class
+from jeuxRPG._class.res.advantage import Advantage
+from jeuxRPG._class.res.classType import DamageType, SkillType
+from jeuxRPG._class.skills import damage_pipeline
+from jeuxRPG._class.skills.damage_pipeline import (
+    STAT_TABLE_SIZE,
+    advantage_row,
+    apply_endurance,
+    compute_damage,
+    damage_type_multiplier,
+    endurance_reduction,
+)
+from jeuxRPG._class.skills.skill import Skill
+from jeuxRPG._class.skills.skillEffect import SkillEffect
+
+
+def reference_damage(base_damage, stat_value, modifier=1.0):
+    stat_factor = (stat_value ** 0.2) / 2
+    damage = base_damage * max(1, math.log((1 + stat_factor)))
+    damage = int(max(1, damage))
+    return int(max(1, damage * modifier))
+
+
+def reference_reduction(endurance):
+    L = 0.9
+    k = 0.02
+    x0 = 150
+    return int((L / (1 + math.exp(-k * (endurance - x0)))) * 100)
+
+
+def reference_endurance(amount, endurance):
+    return int(amount * (1 - (reference_reduction(endurance) / 100)))
+
+
+def reference_modifier(adv, damage_type):
+    modifier = 1.0
+    try:
+        weak_list = None
+        resi_list = None
+        if hasattr(adv, "get_weakness"):
+            weak_list = set(adv.get_weakness())
+            resi_list = set(adv.get_resilience())
+        elif isinstance(adv, dict):
+            weak_list = set(adv.get("weakness", adv.get("weak", [])))
+            resi_list = set(adv.get("resilience", adv.get("resilient", [])))
+        if weak_list is not None and damage_type in weak_list:
+            modifier *= 1.8
+        if resi_list is not None and damage_type in resi_list:
+            modifier *= 0.6
+    except Exception:
+        pass
+    return modifier
+
+
+MODIFIERS = sorted({1.0, 1.8, 0.6, 1.8 * 0.6})
+BASE_DAMAGES = [1, 2, 4, 5, 8, 11, 15, 25, 40, 60, 120]
+
+
+def test_damage_identical_over_stat_range():
+    for stat_value in range(STAT_TABLE_SIZE + 64):
+        for base in BASE_DAMAGES:
+            for modifier in MODIFIERS:
+                assert compute_damage(base, stat_value, modifier) == reference_damage(base, stat_value, modifier), (
+                    base, stat_value, modifier
+                )
+
+
+def test_endurance_identical_over_stat_range():
+    for endurance in range(STAT_TABLE_SIZE + 64):
+        assert endurance_reduction(endurance) == reference_reduction(endurance)
+        for amount in (1, 3, 7, 10, 33, 100, 999):
+            assert apply_endurance(amount, endurance) == reference_endurance(amount, endurance), (amount, endurance)
+
+
+@pytest.mark.parametrize("adv", [
+    None,
+    {"weakness": [], "resilience": []},
+    {"weakness": [DamageType.MAGIC], "resilience": []},
+    {"weakness": [], "resilience": [DamageType.MAGIC]},
+    {"weakness": [DamageType.SACRED], "resilience": [DamageType.SACRED]},
+    {"weak": [DamageType.PHYSICAL, DamageType.SACRED], "resilient": [DamageType.MAGIC]},
+    {"weakness": [[1]]},
+    "unsupported",
+])
+def test_advantage_row_matches_reference(adv):
+    row = advantage_row(adv)
+    for damage_type in DamageType:
+        assert row[damage_type.value] == reference_modifier(adv, damage_type)
+
+
+def test_advantage_instance_row_and_revision():
+    adv = Advantage()
+    adv.add_weakness(DamageType.MAGIC)
+    target = Character.create("Knight", user_id="dp_adv", name="Target")
+    target.class_table["advantage"] = adv
+
+    for damage_type in DamageType:
+        assert damage_type_multiplier(target, damage_type) == reference_modifier(adv, damage_type)
+
+    adv.del_weakness(DamageType.MAGIC)
+    adv.add_weakness(DamageType.PHYSICAL)
+    for damage_type in DamageType:
+        assert damage_type_multiplier(target, damage_type) == reference_modifier(adv, damage_type)
+
+
+def test_advantage_dict_changed_in_place():
+    target = Character.create("Mob", user_id="dp_dict", name="Target")
+    adv = {"weakness": [], "resilience": []}
+    target.class_table["advantage"] = adv
+    assert damage_type_multiplier(target, DamageType.MAGIC) == 1.0
+
+    adv["weakness"].append(DamageType.MAGIC)
+    for damage_type in DamageType:
+        assert damage_type_multiplier(target, damage_type) == reference_modifier(adv, damage_type)
+
+    adv["weakness"].clear()
+    assert damage_type_multiplier(target, DamageType.MAGIC) == 1.0
+
+
+def test_rows_are_shared_between_characters_of_a_class():
+    a = Character.create("Knight", user_id="dp_k1", name="K1")
+    b = Character.create("Knight", user_id="dp_k2", name="K2")
+    damage_type_multiplier(a, DamageType.MAGIC)
+    damage_type_multiplier(b, DamageType.MAGIC)
+    assert a._advantage_row[2] is b._advantage_row[2]
+
+
+@pytest.mark.parametrize("target_class", ["Knight", "Mob", "Goblin", "MagicResistantMob", "Necromancien"])
+@pytest.mark.parametrize("damage_type", list(DamageType))
+def test_skill_damage_matches_reference(target_class, damage_type):
+    caster = Character.create("Mage", user_id="dp_caster", name="Caster")
+    skill = Skill(
+        name="Pipeline Probe",
+        skill_type=SkillType.DAMAGE,
+        effects={"damage": SkillEffect(value=9)},
+        damage_type=damage_type,
+        cooldown=0,
+    )
+    stat_name = damage_pipeline_stat(damage_type)
+    for stat_value in (0, 1, 5, 50, 480, 5000):
+        target = Character.create(target_class, user_id="dp_target", name="Target")
+        target.hp.update_base_value(10 ** 6)
+        target.hp.current_value = 10 ** 6
+        caster.get_stat(stat_name).update_base_value(stat_value)
+
+        raw = reference_damage(9, stat_value, reference_modifier(target.class_table.get("advantage"), damage_type))
+        expected = reference_endurance(raw, target.get_stat("Endurance").current_value)
+
+        before = target.hp.current_value
+        skill.reset_cooldown()
+        caster.get_energie(skill.energie_target).set_max()
+        skill.execute(caster, target)
+        assert before - target.hp.current_value == expected
+
+
+def damage_pipeline_stat(damage_type):
+    return {
+        DamageType.PHYSICAL: "Force",
+        DamageType.MAGIC: "Intelligence",
+        DamageType.SACRED: "Sagesse",
+    }[damage_type]
+
+
+def test_tables_cover_declared_range():
+    assert len(damage_pipeline._ATTACKER_FACTORS) == STAT_TABLE_SIZE
+    assert len(damage_pipeline._ENDURANCE_MULTIPLIERS) == STAT_TABLE_SIZE
@@ -223,6 +223,21 @@ class TestFightRounds:
         # Ne devrait pas lever d'erreur
         fight.rest()
 
+    def test_rest_skips_dead_fighters(self):
+        """Test seuls les combattants vivants régénèrent au repos."""
+        knight = Knight("user1", "Sir Knight")
+        mage = Mage("user2", "Gandalf")
+        fight = Fight(knight, mage)
+        for fighter in (knight, mage):
+            fighter.energie[0].current_value = 0
+        mage.hp.current_value = 0
+        fight.rest()
+        assert knight.energie[0].current_value > 0
+        assert mage.energie[0].current_value == 0
+        mage.resurrect(knight)
+        fight.rest()
+        assert mage.energie[0].current_value == int(mage.energie[0].value * mage.energie[0].regen_rate)
+
 
 class TestFightPlay:
     """Tests pour l'action play."""
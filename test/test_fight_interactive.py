@@ -0,0 +1,133 @@
+"""
+Tests for coroutine-driven interactive fights (Fight.next_turn / submit_action).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class._event.confrontation.encounter.policy import FightAction
+from jeuxRPG._class._event.confrontation.encounter.replay import FightRecorder, FightReplay, capture_character
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.res.team.team import Team
+from jeuxRPG.game_engine import GameEngine
+from jeuxRPG.game_engine.tower import TowerRun
+
+
+@pytest.fixture(autouse=True)
+def clear_teams():
+    Team.all_teams.clear()
+    yield
+    Team.all_teams.clear()
+
+
+def make_fight(prefix: str, seed: int = 5) -> Fight:
+    heroes = [
+        Character.create(cls, user_id=f"{prefix}{i}", name=f"{cls} {i}")
+        for i, cls in enumerate(["Knight", "Priest"])
+    ]
+    for hero in heroes:
+        hero.gain_exp(3000)
+    tower = TowerRun(GameEngine())
+    mobs = [tower._make_mob(floor=4, idx=i) for i in range(2)]
+    return Fight(heroes, mobs, name=prefix, seed=seed)
+
+
+def first_action(decision):
+    return decision.actions[0] if decision.actions else None
+
+
+async def drive(fight: Fight):
+    decisions = []
+    while (decision := await fight.next_turn()) is not None:
+        decisions.append(decision)
+        fight.submit_action(first_action(decision))
+    return decisions
+
+
+def test_without_manual_fighters_next_turn_plays_like_start_round():
+    auto = make_fight("auto")
+    rounds = 0
+    while not auto.is_over() and rounds < 300:
+        auto.start_round()
+        rounds += 1
+
+    driven = make_fight("driven")
+    assert asyncio.run(driven.next_turn()) is None
+
+    assert driven.round == auto.round
+    assert driven.log_message == auto.log_message
+    assert [capture_character(c)["stats"] for c in driven.get_all_individuals()] == [
+        capture_character(c)["stats"] for c in auto.get_all_individuals()
+    ]
+
+
+def test_manual_fighter_decides_and_ai_turns_run_inline():
+    fight = make_fight("manual")
+    hero = fight.attackers.fighters[0]
+    fight.set_manual(hero)
+    recorder = FightRecorder(fight)
+
+    decisions = asyncio.run(drive(fight))
+    recorder.finish()
+
+    assert fight.is_over()
+    assert decisions and all(d.actor is hero for d in decisions)
+    assert all(d.round >= 1 for d in decisions)
+    result = FightReplay.from_recorder(recorder).run()
+    assert result.ok, result.mismatches
+
+
+def test_waiting_players_hold_no_thread():
+    async def main():
+        fights = [make_fight(f"wait{i}", seed=i) for i in range(200)]
+        for fight in fights:
+            fight.set_manual(fight.attackers)
+        first = await asyncio.gather(*(fight.next_turn() for fight in fights))
+        assert all(decision is not None for decision in first)
+
+        threads = threading.active_count()
+        drivers = [asyncio.create_task(fight.next_turn()) for fight in fights]
+        await asyncio.sleep(0.01)
+        # every driver is parked on its pending decision
+        assert not any(task.done() for task in drivers)
+        assert threading.active_count() == threads
+
+        for fight, decision in zip(fights, first):
+            fight.submit_action(first_action(decision))
+        for fight, decision in zip(fights, await asyncio.gather(*drivers)):
+            if decision is not None:
+                fight.submit_action(first_action(decision))
+        await asyncio.gather(*(drive(fight) for fight in fights))
+        return fights
+
+    fights = asyncio.run(main())
+    assert all(fight.is_over() for fight in fights)
+
+
+def test_submit_action_validation():
+    fight = make_fight("invalid")
+    hero = fight.attackers.fighters[0]
+    fight.set_manual(hero)
+    with pytest.raises(RuntimeError):
+        fight.submit_action(None)
+
+    decision = asyncio.run(fight.next_turn())
+    assert fight.pending_decision is decision
+    with pytest.raises(ValueError):
+        fight.submit_action(FightAction("no such skill", fight.defenders.fighters[0]))
+
+    action = decision.actions[0]
+    fight.submit_action(action.skill_name, action.target)
+    assert fight.pending_decision is None
+    assert hero not in fight.can_play
+
+
+def test_set_manual_false_restores_ai_turns():
+    fight = make_fight("unset")
+    fight.set_manual(fight.attackers)
+    fight.set_manual(fight.attackers, manual=False)
+    assert asyncio.run(fight.next_turn()) is None
+    assert fight.is_over()
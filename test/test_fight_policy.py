@@ -0,0 +1,186 @@
+"""
+Tests for pluggable fight AI policies and the MCTS policy.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class._event.confrontation.encounter.mcts import MCTSPolicy
+from jeuxRPG._class._event.confrontation.encounter.policy import FightAction, FightPolicy, legal_actions
+from jeuxRPG._class._event.confrontation.encounter.replay import FightRecorder, FightReplay, capture_character
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.res.classType import SkillType
+from jeuxRPG._class.res.team.team import Team
+from jeuxRPG.game_engine import GameEngine
+from jeuxRPG.game_engine.tower import TowerRun
+
+
+@pytest.fixture(autouse=True)
+def clear_teams():
+    Team.all_teams.clear()
+    yield
+    Team.all_teams.clear()
+
+
+class FirstActionPolicy(FightPolicy):
+    """Always plays the first legal action and remembers its calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def choose(self, fight, actor):
+        self.calls.append(actor)
+        actions = legal_actions(fight, actor)
+        return actions[0] if actions else None
+
+
+def make_fight(seed: int = 3) -> Fight:
+    heroes = [
+        Character.create(cls, user_id=f"pol{i}", name=f"{cls} {i}")
+        for i, cls in enumerate(["Knight", "Priest", "Mage"])
+    ]
+    for hero in heroes:
+        hero.gain_exp(4000)
+    mobs = TowerRun(GameEngine())
+    enemies = [mobs._make_mob(floor=6, idx=i) for i in range(3)]
+    return Fight(heroes, enemies, name="Policy", seed=seed)
+
+
+def test_policy_drives_its_fighters_only():
+    fight = make_fight()
+    policy = FirstActionPolicy()
+    fight.set_policy(fight.defenders, policy)
+
+    fight.start_round()
+    assert policy.calls
+    assert all(actor in fight.defenders for actor in policy.calls)
+
+
+def test_set_policy_none_restores_greedy_turn():
+    fight = make_fight()
+    policy = FirstActionPolicy()
+    fight.set_policy(fight.attackers, policy)
+    fight.set_policy(fight.attackers, None)
+
+    fight.start_round()
+    assert policy.calls == []
+
+
+def test_character_ai_policy_attribute():
+    fight = make_fight()
+    policy = FirstActionPolicy()
+    mobs = fight.defenders.get_fighters()
+    for mob in mobs:
+        mob.ai_policy = policy
+
+    fight.start_round()
+    assert policy.calls
+    assert set(policy.calls) <= set(mobs)
+
+
+def test_legal_actions_targets_match_skill_type():
+    fight = make_fight()
+    for actor in fight.get_all_individuals():
+        allies, opponents = fight.sides_of(actor)
+        for action in legal_actions(fight, actor):
+            skill_type = actor.skills[action.skill_name].skill_type
+            if skill_type in (SkillType.DAMAGE, SkillType.DEBUFF):
+                assert action.target in opponents
+            elif skill_type in (SkillType.HEAL, SkillType.BUFF):
+                assert action.target in allies
+
+
+def test_policy_actions_are_replayable():
+    fight = make_fight(9)
+    fight.set_policy(fight.attackers, FirstActionPolicy())
+    recorder = FightRecorder(fight)
+    rounds = 0
+    while not fight.is_over() and rounds < 100:
+        fight.start_round()
+        rounds += 1
+    recorder.finish()
+
+    assert any(action[0] == "A" and len(action) == 5 for action in recorder.actions)
+    result = FightReplay.from_recorder(recorder).run()
+    assert result.ok, result.mismatches
+
+
+def test_mcts_respects_time_budget():
+    fight = make_fight()
+    actor = fight.defenders.fighters[0]
+    policy = MCTSPolicy(time_budget=0.01, max_iterations=10 ** 6, seed=1)
+
+    started = time.perf_counter()
+    policy.choose(fight, actor)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.01 * 1.5 + 0.002
+    assert sum(count for _, count, _ in policy.last_stats) > 0
+
+
+def test_mcts_budget_holds_with_slow_turns():
+    fight = make_fight()
+    actor = fight.defenders.fighters[0]
+    turn_cost = 0.01
+
+    def slow(attack):
+        def perform_attack(target, skill_name=None):
+            time.sleep(turn_cost)
+            return attack(target, skill_name)
+        return perform_attack
+
+    for fighter in fight.get_all_individuals():
+        fighter.perform_attack = slow(fighter.perform_attack)
+    # a rollout round takes six slow turns: only a per-turn check keeps the budget
+    policy = MCTSPolicy(time_budget=0.03, max_iterations=10 ** 6, seed=6)
+
+    started = time.perf_counter()
+    policy.choose(fight, actor)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.03 + 2 * turn_cost + 0.01
+
+
+def test_mcts_respects_iteration_budget_and_leaves_fight_untouched():
+    fight = make_fight()
+    actor = fight.attackers.fighters[0]
+    before = [capture_character(c) for c in fight.get_all_individuals()]
+    can_play = list(fight.can_play)
+    policy = MCTSPolicy(time_budget=10, max_iterations=25, seed=2)
+
+    action = policy.choose(fight, actor)
+
+    assert isinstance(action, FightAction)
+    assert sum(count for _, count, _ in policy.last_stats) == 25
+    assert [capture_character(c) for c in fight.get_all_individuals()] == before
+    assert fight.can_play == can_play
+
+
+def test_mcts_boss_fight_runs_to_completion():
+    tower = TowerRun(GameEngine(), boss_policy=MCTSPolicy(time_budget=0.005, seed=3))
+    boss = tower._make_mob(floor=5, idx=0, is_boss=True)
+    assert boss.ai_policy is tower.boss_policy
+
+    hero = Character.create("Knight", user_id="pol_boss", name="Hero")
+    hero.gain_exp(6000)
+    fight = Fight(hero, boss, seed=4)
+    rounds = 0
+    while not fight.is_over() and rounds < 200:
+        fight.start_round()
+        rounds += 1
+    assert fight.is_over()
+
+
+def test_mcts_merges_worker_searches():
+    fight = make_fight()
+    actor = fight.defenders.fighters[0]
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        executor.submit(int).result()  # start the worker outside of the budget
+        policy = MCTSPolicy(time_budget=2, max_iterations=10, seed=5, executor=executor, workers=1)
+        policy.choose(fight, actor)
+
+    assert sum(count for _, count, _ in policy.last_stats) == 20
@@ -0,0 +1,129 @@
+"""
+Tests for fight snapshot/restore and look-ahead branches.
+"""
+
+import pytest
+
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class._event.confrontation.encounter.replay import FightRecorder, capture_character
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.mob.mob import Mob  # registers the "Mob" class
+from jeuxRPG._class.res.team.team import Team
+
+
+@pytest.fixture(autouse=True)
+def clear_teams():
+    Team.all_teams.clear()
+    yield
+    Team.all_teams.clear()
+
+
+def make_fight(seed: int = 3) -> Fight:
+    heroes = [
+        Character.create(cls, user_id=f"s{i}", name=f"{cls} {i}")
+        for i, cls in enumerate(["Knight", "Priest", "Necromancien", "Mage", "Archer"])
+    ]
+    for hero in heroes:
+        hero.gain_exp(4000)
+    mobs = [Character.create("Mob", user_id=f"sm{i}", name=f"Mob {i}") for i in range(5)]
+    return Fight(heroes, mobs, name="Snapshot", seed=seed)
+
+
+def capture(fight: Fight):
+    return (
+        fight.round,
+        [c.name for c in fight.can_play],
+        [capture_character(c) for c in fight.get_all_individuals()],
+        [[skill.current_cooldown for skill in c.skills.values()] for c in fight.get_all_individuals()],
+        [len(c.invocations.get_all()) for c in fight.get_all_individuals()],
+    )
+
+
+def test_restore_rewinds_every_fighter():
+    fight = make_fight()
+    fight.start_round()
+    state = fight.snapshot()
+    expected = capture(fight)
+
+    for _ in range(6):
+        fight.start_round()
+    assert capture(fight) != expected
+
+    fight.restore(state)
+    assert capture(fight) == expected
+
+
+def test_state_can_be_restored_many_times():
+    fight = make_fight(5)
+    state = fight.snapshot()
+    expected = capture(fight)
+
+    for _ in range(10):
+        for _ in range(3):
+            fight.start_round()
+        fight.restore(state)
+        assert capture(fight) == expected
+
+
+def test_branch_does_not_change_the_real_fight():
+    reference = make_fight(7)
+    explored = make_fight(7)
+    ref_recorder = FightRecorder(reference)
+    exp_recorder = FightRecorder(explored)
+
+    for _ in range(8):
+        for _ in range(5):
+            with explored.branch():
+                for _ in range(4):
+                    explored.start_round()
+        reference.start_round()
+        explored.start_round()
+
+    assert exp_recorder.actions == ref_recorder.actions
+    assert capture(explored) == capture(reference)
+
+
+def test_branch_detaches_recorder():
+    fight = make_fight()
+    recorder = FightRecorder(fight)
+
+    with fight.branch():
+        assert fight.recorder is None
+        fight.start_round()
+    assert fight.recorder is recorder
+    assert recorder.actions == []
+
+
+def test_snapshot_holds_values_only():
+    fight = make_fight()
+    state = fight.snapshot()
+    hero = fight.attackers.fighters[0]
+    hero.hp.current_value = 1
+
+    fight.restore(state)
+    assert hero.hp.current_value == hero.hp.value
+
+
+def test_restore_keeps_invocations_of_other_fights():
+    from jeuxRPG._class.sub_character.invocations.invocation import Invocation
+    from jeuxRPG._class.sub_character.invocations.squelette import Squelette
+
+    def duel(prefix):
+        necro = Character.create("Necromancien", user_id=f"{prefix}n", name=f"Necro {prefix}")
+        return Fight(necro, Character.create("Knight", user_id=f"{prefix}k", name=f"Knight {prefix}")), necro
+
+    first, first_necro = duel("i1")
+    second, second_necro = duel("i2")
+
+    state = first.snapshot()
+    explored = Squelette(first_necro)
+    first_necro.invocations.add_invocation(explored)
+    # the other fight summons while the first one is still branching
+    summoned = Squelette(second_necro)
+    second_necro.invocations.add_invocation(summoned)
+    first.restore(state)
+
+    assert not any(i is explored for i in Invocation.all_invocation)
+    assert any(i is summoned for i in Invocation.all_invocation)
+    summoned.drop_xp(second.defenders.fighters[0])
+    assert not any(i is summoned for i in Invocation.all_invocation)
@@ -47,6 +47,651 @@ def test_prevent_character_in_multiple_fights_same_run():
         engine.run_fights([f1, f2])
 
 
+def make_duels(count: int, prefix: str):
+    return [
+        Fight(make_char("Knight", f"{prefix}a{i}", f"A{i}"), make_char("Mage", f"{prefix}b{i}", f"B{i}"), seed=i)
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize("execution,batch_size", [("round", 1), ("fight", 1), ("fight", 4)])
+def test_execution_modes_play_fights_to_completion(execution, batch_size):
+    fights = make_duels(6, f"{execution}{batch_size}")
+    engine = GameEngine(execution=execution, batch_size=batch_size)
+    engine.run_fights(fights, timeout=10)
+    engine.close()
+
+    assert all(f.round >= 2 for f in fights)
+    assert engine._active_characters == set()
+
+
+def test_whole_fight_mode_matches_inline_play():
+    inline = make_duels(3, "inline")
+    for fight in inline:
+        while not fight.is_over():
+            fight.start_round(True)
+    dispatched = make_duels(3, "disp")
+    engine = GameEngine(execution="fight", batch_size=3)
+    engine.run_fights(dispatched)
+    engine.close()
+
+    assert [f.round for f in dispatched] == [f.round for f in inline]
+
+
+def test_dispatch_returns_a_future_and_honours_stop():
+    import threading
+
+    engine = GameEngine()
+    fight = make_duels(1, "stop")[0]
+    stop = threading.Event()
+    stop.set()
+    future = engine.dispatch([fight], stop)
+    [result] = future.result(timeout=5)
+    assert result.winner is None and result.rounds == 0
+    assert fight.round == 1
+    engine.close()
+
+
+def test_process_backend_applies_results_to_caller_characters():
+    from jeuxRPG._class._event.confrontation.encounter.replay import capture_character
+
+    threaded = make_duels(4, "thr")
+    processed = make_duels(4, "proc")
+    threaded_chars = [f.get_all_individuals() for f in threaded]
+    processed_chars = [f.get_all_individuals() for f in processed]
+
+    GameEngine().run_fights(threaded)
+    engine = GameEngine(backend="process", max_workers=2, batch_size=2)
+    engine.run_fights(processed, timeout=60)
+    engine.close()
+
+    assert [f.round for f in processed] == [f.round for f in threaded]
+    for expected, actual in zip(threaded_chars, processed_chars):
+        assert [capture_character(c)["stats"] for c in actual] == [capture_character(c)["stats"] for c in expected]
+        assert [c.level for c in actual] == [c.level for c in expected]
+    assert engine._active_characters == set()
+
+
+def make_necro_duels(count: int, prefix: str):
+    from jeuxRPG._class.res.character.alteration.alteration import Dot
+    from jeuxRPG._class.sub_character.invocations.squelette import Squelette
+
+    fights = []
+    for i in range(count):
+        necro = make_char("Necromancien", f"{prefix}n{i}", f"N{i}")
+        necro.invocations.add_invocation(Squelette(necro))
+        knight = make_char("Knight", f"{prefix}k{i}", f"K{i}")
+        knight.status["alteration"]["Damage"]["Incoming"].append(Dot("Burn", necro, value=5, time=4, target=knight))
+        fights.append(Fight(necro, knight, seed=i))
+    return fights
+
+
+def test_process_backend_brings_back_invocations_and_alterations():
+    from jeuxRPG._class._event.confrontation.encounter.replay import capture_character
+    from jeuxRPG._class.sub_character.invocations.invocation import Invocation
+
+    def live_state(c):
+        return (
+            [capture_character(invocation)["stats"] for invocation in c.invocations.invocations],
+            [(dot.name, dot.get_duration()) for dot in c.status["alteration"]["Damage"]["Incoming"]],
+        )
+
+    threaded = make_necro_duels(2, "nthr")
+    processed = make_necro_duels(2, "nproc")
+    threaded_chars = [f.get_all_individuals() for f in threaded]
+    processed_chars = [f.get_all_individuals() for f in processed]
+    old_squelettes = [necro.invocations.invocations[0] for necro, _ in processed_chars]
+
+    # one round only: the Squelette and the DoT are still there
+    GameEngine(max_rounds=1).run_fights(threaded)
+    engine = GameEngine(backend="process", max_workers=2, max_rounds=1)
+    engine.run_fights(processed, timeout=60)
+    engine.close()
+
+    assert [f.round for f in processed] == [f.round for f in threaded]
+    for expected, actual in zip(threaded_chars, processed_chars):
+        assert [capture_character(c)["stats"] for c in actual] == [capture_character(c)["stats"] for c in expected]
+        assert [live_state(c) for c in actual] == [live_state(c) for c in expected]
+    for (necro, knight), old in zip(processed_chars, old_squelettes):
+        (squelette,) = necro.invocations.invocations
+        assert squelette.master is necro
+        assert knight.status["alteration"]["Damage"]["Incoming"][0].caster is necro
+        assert any(invocation is squelette for invocation in Invocation.all_invocation)
+        assert not any(invocation is old for invocation in Invocation.all_invocation)
+
+
+def test_process_backend_keeps_overlap_checks():
+    engine = GameEngine(backend="process")
+    a = make_char("Knight", "po1", "Hero")
+    with pytest.raises(ValueError):
+        engine.run_fights([Fight(a, make_char("Mage", "po2", "M")), Fight(a, make_char("Orc", "po3", "O"))])
+    with pytest.raises(ValueError):
+        GameEngine(execution="round", backend="process")
+
+
+def test_run_fights_reuses_the_engine_loop(monkeypatch):
+    import asyncio
+
+    def no_new_loop(*args, **kwargs):
+        raise AssertionError("run_fights must not create an event loop per call")
+
+    engine = GameEngine()
+    engine.run_fights(make_duels(1, "warm"))
+    monkeypatch.setattr(asyncio, "run", no_new_loop)
+    for i in range(3):
+        engine.run_fights(make_duels(2, f"loop{i}"))
+    engine.close()
+
+
+def test_run_fights_async_does_not_block_the_caller_loop():
+    import asyncio
+
+    async def main():
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        fights = make_duels(20, "async")
+        engine = GameEngine(execution="fight")
+        await engine.run_fights_async(fights)
+        done.set()
+        await task
+        engine.close()
+        return fights, ticks
+
+    fights, ticks = asyncio.run(main())
+    assert all(f.round >= 2 for f in fights)
+    assert ticks > 1
+
+
+def test_run_fights_on_host_loop():
+    import asyncio
+    import threading
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        engine = GameEngine(loop=loop)
+        fights = make_duels(2, "host")
+        engine.run_fights(fights)
+        assert all(f.round >= 2 for f in fights)
+        assert engine._active_characters == set()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def test_run_fights_timeout_releases_participants():
+    engine = GameEngine(execution="round")
+    fights = make_duels(2, "timeout")
+    with pytest.raises(TimeoutError):
+        engine.run_fights(fights, timeout=1e-6)
+    assert engine._active_characters == set()
+
+
+@pytest.mark.parametrize("execution,backend", [("round", "thread"), ("fight", "thread"), ("fight", "process")])
+def test_run_fights_returns_fight_results(execution, backend):
+    fights = make_duels(3, f"res{execution}{backend}")
+    engine = GameEngine(execution=execution, backend=backend, batch_size=2, max_workers=1)
+    results = engine.run_fights(fights, timeout=60)
+    engine.close()
+
+    assert [r.fight for r in results] == fights
+    for result in results:
+        assert result.rounds == result.fight.round - 1
+        assert result.wall_time >= 0
+        assert result.winner_side in ("attackers", "defenders") and not result.is_draw
+        loser = "defenders" if result.winner_side == "attackers" else "attackers"
+        assert result.damage[result.winner_side] > 0
+        assert set(result.damage) == {loser, result.winner_side}
+
+
+def test_submit_streams_results_as_completed():
+    engine = GameEngine()
+    fights = make_duels(4, "submit")
+    futures = [engine.submit(f) for f in fights]
+    results = [future.result() for future in engine.as_completed(futures, timeout=10)]
+    engine.close()
+
+    assert sorted(r.name for r in results) == sorted(f.name for f in fights)
+    assert all(r.winner is not None for r in results)
+    assert engine._active_characters == set()
+
+
+def test_submit_rejects_characters_already_fighting():
+    engine = GameEngine(execution="round")
+    a = make_char("Knight", "sub1", "Hero")
+    fight = Fight(a, make_char("Mage", "sub2", "M"))
+    policy = BlockingPolicy()
+    fight.set_policy(fight.attackers, policy)
+    first = engine.submit(fight)
+    try:
+        second = engine.submit(Fight(a, make_char("Orc", "sub3", "O")))
+        with pytest.raises(ValueError):
+            second.result(timeout=10)
+    finally:
+        policy.release.set()
+    first.result(timeout=10)
+    assert engine._active_characters == set()
+
+
+def test_results_async_iterator_yields_every_fight():
+    import asyncio
+
+    async def main():
+        engine = GameEngine()
+        fights = make_duels(5, "aiter")
+        names = [result.name async for result in engine.results(fights)]
+        engine.close()
+        return fights, names, engine
+
+    fights, names, engine = asyncio.run(main())
+    assert sorted(names) == sorted(f.name for f in fights)
+    assert engine._active_characters == set()
+
+
+class BlockingPolicy:
+    """Holds its fight (and its admission slot) until released."""
+
+    def __init__(self):
+        import threading
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def choose(self, fight, actor):
+        self.started.set()
+        self.release.wait(10)
+        return None
+
+
+def blocked_duel(prefix: str):
+    fight = make_duels(1, prefix)[0]
+    policy = BlockingPolicy()
+    fight.set_policy(fight.attackers, policy)
+    return fight, policy
+
+
+def wait_for_queue(engine, depth: int, key: str = "queued"):
+    import time
+    deadline = time.monotonic() + 5
+    while engine.admission_stats()[key] != depth:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+@pytest.mark.parametrize("execution", ["round", "fight"])
+def test_max_concurrent_caps_running_fights(execution):
+    engine = GameEngine(execution=execution, max_concurrent=2, max_pending=10)
+    fights = make_duels(7, f"cap{execution}")
+    results = engine.run_fights(fights, timeout=10)
+    engine.close()
+
+    stats = engine.admission_stats()
+    assert len(results) == 7
+    assert stats["peak_running"] <= 2
+    assert stats["admitted"] == 7
+    assert stats["running"] == stats["queued"] == 0
+
+
+def test_full_queue_rejects_with_engine_busy():
+    from jeuxRPG.game_engine import EngineBusy
+
+    engine = GameEngine(max_concurrent=1, max_pending=1)
+    blocked, policy = blocked_duel("busy0")
+    running = engine.submit(blocked)
+    assert policy.started.wait(5)
+    try:
+        assert not engine.busy
+        queued = engine.submit(make_duels(1, "busy1")[0])
+        wait_for_queue(engine, 1)
+        assert engine.busy
+        with pytest.raises(EngineBusy):
+            engine.run_fights(make_duels(1, "busy2"))
+        assert engine.admission_stats()["queued"] == 1
+    finally:
+        policy.release.set()
+    running.result(timeout=10)
+    queued.result(timeout=10)
+    engine.close()
+
+    stats = engine.admission_stats()
+    assert stats["rejected"] == 1 and stats["admitted"] == 2
+    assert not engine.busy
+    assert engine._active_characters == set()
+
+
+def test_wait_policy_holds_back_then_admits():
+    engine = GameEngine(max_concurrent=1, max_pending=0, overload="wait")
+    blocked, policy = blocked_duel("wait0")
+    running = engine.submit(blocked)
+    assert policy.started.wait(5)
+    waiting = engine.submit(make_duels(1, "wait1")[0])
+    wait_for_queue(engine, 1, "waiting_for_queue")
+    assert engine.busy
+    assert not waiting.done()
+    policy.release.set()
+
+    assert waiting.result(timeout=10).winner is not None
+    running.result(timeout=10)
+    engine.close()
+    assert engine.admission_stats()["rejected"] == 0
+
+
+def test_admission_timeout_gives_busy_signal():
+    from jeuxRPG.game_engine import EngineBusy
+
+    engine = GameEngine(max_concurrent=1, overload="wait", admission_timeout=0.05)
+    blocked, policy = blocked_duel("tmo0")
+    running = engine.submit(blocked)
+    assert policy.started.wait(5)
+    try:
+        with pytest.raises(EngineBusy):
+            engine.run_fights(make_duels(1, "tmo1"))
+    finally:
+        policy.release.set()
+    running.result(timeout=10)
+    engine.close()
+
+    stats = engine.admission_stats()
+    assert stats["timed_out"] == 1
+    assert stats["queued"] == stats["running"] == 0
+    assert engine._active_characters == set()
+
+
+class StartOrderPolicy:
+    """Records the name of every fight on its first turn."""
+
+    def __init__(self, order):
+        self.order = order
+
+    def choose(self, fight, actor):
+        if fight.name not in self.order:
+            self.order.append(fight.name)
+        return None
+
+
+def queued_duels(engine, priorities, order):
+    futures = []
+    for i, priority in enumerate(priorities):
+        fight = make_duels(1, f"prio{priority}{i}")[0]
+        fight.name = f"{priority}{i}"
+        fight.set_policy(fight.attackers, StartOrderPolicy(order))
+        futures.append(engine.submit(fight, priority=priority))
+        wait_for_slot_waiters(engine, i + 1)
+    return futures
+
+
+def wait_for_slot_waiters(engine, count: int):
+    import time
+    deadline = time.monotonic() + 5
+    while sum(p["waiting_for_slot"] for p in engine.admission_stats()["priorities"].values()) != count:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_higher_priority_fights_are_served_first():
+    engine = GameEngine(max_concurrent=1, background_share=0)
+    blocked, policy = blocked_duel("prio_block")
+    running = engine.submit(blocked, priority="background")
+    assert policy.started.wait(5)
+    order = []
+    futures = queued_duels(engine, ["background", "tower", "interactive", "background", "interactive"], order)
+    policy.release.set()
+    for future in [running] + futures:
+        future.result(timeout=10)
+    engine.close()
+
+    assert order == ["interactive2", "interactive4", "tower1", "background0", "background3"]
+
+
+def test_background_keeps_a_minimum_share():
+    engine = GameEngine(max_concurrent=1, background_share=0.5)
+    blocked, policy = blocked_duel("share_block")
+    running = engine.submit(blocked)
+    assert policy.started.wait(5)
+    order = []
+    priorities = ["background", "background"] + ["interactive"] * 4
+    futures = queued_duels(engine, priorities, order)
+    policy.release.set()
+    for future in [running] + futures:
+        future.result(timeout=10)
+    engine.close()
+
+    assert order == ["interactive2", "interactive3", "background0", "interactive4", "interactive5", "background1"]
+
+
+def test_background_queue_does_not_turn_interactive_fights_away():
+    from jeuxRPG.game_engine import EngineBusy
+
+    engine = GameEngine(max_concurrent=1, max_pending=1)
+    blocked, policy = blocked_duel("bgq0")
+    running = engine.submit(blocked, priority="background")
+    assert policy.started.wait(5)
+    try:
+        queued = engine.submit(make_duels(1, "bgq1")[0], priority="background")
+        wait_for_queue(engine, 1)
+        assert engine.is_busy("background")
+        assert not engine.busy
+        with pytest.raises(EngineBusy):
+            engine.run_fights(make_duels(1, "bgq2"), priority="background")
+        interactive = engine.submit(make_duels(1, "bgq3")[0])
+        wait_for_queue(engine, 2)
+    finally:
+        policy.release.set()
+    for future in (running, queued, interactive):
+        future.result(timeout=10)
+    engine.close()
+
+    stats = engine.admission_stats()["priorities"]
+    assert stats["background"]["rejected"] == 1
+    assert stats["interactive"]["rejected"] == 0
+
+
+def test_latency_stats_per_priority():
+    engine = GameEngine()
+    engine.run_fights(make_duels(3, "lat_i"))
+    engine.run_fights(make_duels(2, "lat_b"), priority="background")
+    fights = make_duels(1, "lat_t")
+    fights[0].priority = "tower"
+    engine.run_fights(fights)
+    engine.close()
+
+    stats = engine.latency_stats()
+    assert {k: v["count"] for k, v in stats["latency"].items()} == {"interactive": 3, "tower": 1, "background": 2}
+    assert stats["queue_wait"]["background"]["count"] == 2
+    for summary in stats["latency"].values():
+        assert 0 <= summary["p50"] <= summary["p99"] <= summary["max"]
+    with pytest.raises(ValueError):
+        engine.run_fights(make_duels(1, "lat_x"), priority="urgent")
+
+
+def immortal_duel(prefix: str) -> Fight:
+    """Two fighters with too many HP to finish the fight in any reasonable time."""
+    fighters = [make_char("Priest", f"{prefix}a", "PA"), make_char("Priest", f"{prefix}b", "PB")]
+    for c in fighters:
+        c.hp.value = c.hp.current_value = 10 ** 9
+    return Fight(*fighters, name=prefix, seed=1)
+
+
+@pytest.mark.parametrize("execution,backend", [("round", "thread"), ("fight", "thread"), ("fight", "process")])
+def test_max_rounds_declares_a_draw(execution, backend):
+    engine = GameEngine(execution=execution, backend=backend, max_rounds=5, max_workers=1)
+    stuck = immortal_duel(f"cap_{execution}_{backend}")
+    [result] = engine.run_fights([stuck], timeout=60)
+    engine.close()
+
+    assert result.status == "draw" and result.is_draw
+    assert result.winner is None and result.rounds == 5
+    assert engine._active_characters == set()
+
+
+def test_fight_max_rounds_attribute_overrides_engine():
+    engine = GameEngine(max_rounds=50)
+    stuck = immortal_duel("cap_attr")
+    stuck.max_rounds = 3
+    [result] = engine.run_fights([stuck])
+    assert result.rounds == 3
+
+
+def test_fight_timeout_stops_only_the_stuck_fight():
+    engine = GameEngine(batch_size=2, fight_timeout=0.2)
+    stuck = immortal_duel("deadline")
+    normal = make_duels(1, "deadline_ok")[0]
+    stuck_result, normal_result = engine.run_fights([stuck, normal], timeout=10)
+    engine.close()
+
+    assert stuck_result.status == "timed_out" and stuck_result.interrupted
+    assert normal_result.status == "won"
+    assert normal_result.wall_time < stuck_result.wall_time
+    assert engine._active_characters == set()
+
+
+@pytest.mark.parametrize("execution", ["round", "fight"])
+def test_cancel_one_fight_releases_its_participants(execution):
+    import time
+
+    engine = GameEngine(execution=execution)
+    stuck = immortal_duel(f"cancel_{execution}")
+    fighters = stuck.get_all_individuals()
+    future = engine.submit(stuck)
+    deadline = time.monotonic() + 5
+    while stuck.round < 3:
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+    assert engine.cancel(stuck)
+    result = future.result(timeout=10)
+    assert result.status == "cancelled" and result.winner is None
+    assert engine._active_characters == set()
+    assert not engine.cancel(stuck)
+
+    # the participants can fight again right away
+    again = Fight(fighters[0], make_char("Mage", f"cancel_{execution}_m", "M"))
+    again.max_rounds = 2
+    assert engine.run_fights([again], timeout=10)[0].rounds <= 2
+    engine.close()
+
+
+class FailingPolicy:
+    def choose(self, fight, actor):
+        raise RuntimeError("policy crashed")
+
+
+@pytest.mark.parametrize("execution,backend", [("round", "thread"), ("fight", "thread"), ("fight", "process")])
+def test_metrics_count_fights_and_rounds(execution, backend):
+    engine = GameEngine(execution=execution, backend=backend, max_workers=1, batch_size=2)
+    stuck = immortal_duel(f"metrics_{execution}_{backend}")
+    stuck.max_rounds = 2
+    results = engine.run_fights(make_duels(3, f"metrics_{execution}_{backend}") + [stuck], timeout=60)
+    engine.close()
+
+    snapshot = engine.metrics_snapshot()
+    counters = snapshot["counters"]
+    histograms = snapshot["histograms"]
+    assert counters["fights_started_total"] == 4
+    assert counters["fights_completed_total"] == 4
+    assert counters["fights_failed_total"] == counters["fights_timed_out_total"] == 0
+    assert histograms["fight_rounds"]["count"] == 4
+    assert histograms["fight_rounds"]["sum"] == sum(r.rounds for r in results)
+    assert histograms["round_seconds"]["count"] == sum(r.rounds for r in results)
+    assert histograms["fight_latency_seconds"]["interactive"]["count"] == 4
+    assert histograms["queue_wait_seconds"]["background"]["count"] == 0
+    assert snapshot["gauges"] == {"active_characters": 0, "running_fights": 0, "queued_fights": 0}
+
+
+def test_metrics_count_timeouts_cancellations_and_failures():
+    import time
+
+    engine = GameEngine(fight_timeout=0.05)
+    engine.run_fights([immortal_duel("m_timeout")])
+
+    stuck = immortal_duel("m_cancel")
+    stuck.timeout = 30
+    future = engine.submit(stuck)
+    while stuck.round < 2:
+        time.sleep(0.001)
+    engine.cancel(stuck)
+    future.result(timeout=10)
+
+    broken = make_duels(1, "m_fail")[0]
+    broken.set_policy(broken.attackers, FailingPolicy())
+    with pytest.raises(RuntimeError):
+        engine.run_fights([broken])
+    engine.close()
+
+    counters = engine.metrics_snapshot()["counters"]
+    assert counters["fights_started_total"] == 3
+    assert counters["fights_timed_out_total"] == 1
+    assert counters["fights_cancelled_total"] == 1
+    assert counters["fights_failed_total"] == 1
+    assert engine._active_characters == set()
+
+
+def test_process_backend_splits_cancellations_and_timeouts():
+    import threading
+    import time
+
+    engine = GameEngine(backend="process", max_workers=1, max_rounds=3)
+    cancelled = engine.dispatch(make_duels(1, "pm_cancel"))
+    cancelled.cancel()
+    stop = threading.Event()
+    stop.set()
+    engine.dispatch(make_duels(1, "pm_timeout"), stop)
+
+    counters = engine.metrics_snapshot()["counters"]
+    deadline = time.monotonic() + 30
+    while counters.get("fights_cancelled_total", 0) + counters.get("fights_timed_out_total", 0) < 2:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+        counters = engine.metrics_snapshot()["counters"]
+    engine.close()
+
+    assert counters["fights_cancelled_total"] == 1
+    assert counters["fights_timed_out_total"] == 1
+
+
+def test_metrics_export_formats():
+    import json
+
+    engine = GameEngine()
+    engine.run_fights(make_duels(2, "prom"), priority="tower")
+    snapshot = engine.metrics_snapshot()
+    assert json.loads(json.dumps(snapshot)) == snapshot
+
+    text = engine.metrics_text()
+    lines = text.splitlines()
+    assert "# TYPE game_engine_fights_started_total counter" in lines
+    assert "game_engine_fights_started_total 2" in lines
+    assert "# TYPE game_engine_active_characters gauge" in lines
+    assert "game_engine_active_characters 0" in lines
+    assert "# TYPE game_engine_fight_latency_seconds histogram" in lines
+    assert 'game_engine_fight_latency_seconds_bucket{priority="tower",le="+Inf"} 2' in lines
+    assert 'game_engine_fight_latency_seconds_count{priority="tower"} 2' in lines
+    assert 'game_engine_fight_rounds_bucket{le="+Inf"} 2' in lines
+    buckets = [int(line.rsplit(" ", 1)[1]) for line in lines if line.startswith("game_engine_round_seconds_bucket")]
+    assert buckets == sorted(buckets)
+    assert text.endswith("\n")
+
+
+def test_unknown_execution_mode():
+    with pytest.raises(ValueError):
+        GameEngine(execution="thread-per-round")
+    with pytest.raises(ValueError):
+        GameEngine(batch_size=0)
+    with pytest.raises(ValueError):
+        GameEngine(overload="drop")
+    with pytest.raises(ValueError):
+        GameEngine(max_rounds=0)
+
+
 def test_tower_run_simple_sequence():
     # small deterministic tower run using a 1-enemy floor to validate flow
     random_seed = 42
@@ -103,6 +748,7 @@ def test_tower_boss_floor_interval_controls_boss_floors():
 
     assert reached == 5
     assert boss_floors == [3, 5]
+    assert {getattr(fight, "priority", None) for fight in engine.fights} == {"tower"}
 
 
 def test_tower_default_bosses_spawn_every_five_floors():
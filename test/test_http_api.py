@@ -0,0 +1,96 @@
+import asyncio
+import http.client
+import json
+import threading
+
+import pytest
+
+from jeuxRPG._core.save import SaveManager
+from jeuxRPG.game_engine import GameEngine
+from jeuxRPG.game_engine.http_api import GameAPIServer
+
+
+@pytest.fixture
+def api(tmp_path):
+    """Server running on its own loop thread; yields a request helper."""
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    engine = GameEngine(max_rounds=100)
+    server = GameAPIServer(engine, SaveManager(tmp_path / "saves"), workers=2)
+    port = asyncio.run_coroutine_threadsafe(server.start(port=0), loop).result(5)
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+
+    def request(method, path, body=None):
+        connection.request(method, path, body=None if body is None else json.dumps(body))
+        response = connection.getresponse()
+        raw = response.read()
+        is_json = response.getheader("Content-Type") == "application/json"
+        return response.status, json.loads(raw) if is_json else raw.decode()
+
+    yield request
+    connection.close()
+    asyncio.run_coroutine_threadsafe(server.stop(), loop).result(5)
+    engine.close()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+
+
+def test_create_and_fetch_character(api):
+    status, created = api("POST", "/api/characters", {"class": "Knight", "name": "Bob", "level": 5, "user_id": "u1"})
+    assert status == 201
+    assert created["entity_id"] == "u1" and created["level"] == 5
+
+    status, fetched = api("GET", "/api/characters/u1")
+    assert status == 200 and fetched["name"] == "Bob"
+    assert api("GET", "/api/characters/nobody")[0] == 404
+
+
+def test_duel_and_team_battle(api):
+    api("POST", "/api/characters", {"class": "Knight", "user_id": "hero", "level": 3})
+    status, result = api("POST", "/api/fights/duel", {"attacker": {"user_id": "hero"}, "defender": {"class": "Mage"}})
+    assert status == 200
+    assert result["status"] in ("won", "draw") and result["rounds"] >= 1
+
+    status, result = api("POST", "/api/fights/team", {
+        "attackers": [{"class": "Knight", "level": 2}, {"class": "Archer", "level": 2}],
+        "defenders": [{"class": "Mage", "level": 2}, {"class": "Knight", "level": 2}],
+        "max_rounds": 30,
+    })
+    assert status == 200 and result["rounds"] <= 30
+
+
+def test_tower_run(api):
+    status, result = api("POST", "/api/tower/run", {"party": [{"class": "Knight", "level": 4}], "floors": 1})
+    assert status == 200
+    assert result["reached_floor"] in (0, 1)
+    assert len(result["party"]) == 1
+
+
+def test_save_and_load(api):
+    api("POST", "/api/characters", {"class": "Archer", "user_id": "saver", "name": "Robin", "level": 4})
+    assert api("POST", "/api/saves/saver") == (200, {"saved": "saver"})
+
+    status, data = api("GET", "/api/saves/saver")
+    assert status == 200 and data["level"] == 4 and data["char_class"]
+
+    status, loaded = api("POST", "/api/saves/saver/load")
+    assert status == 200
+    assert (loaded["name"], loaded["level"], loaded["exp"]) == ("Robin", 4, data["exp"])
+    assert api("GET", "/api/saves/ghost")[0] == 404
+
+
+def test_errors(api):
+    assert api("GET", "/api/nothing")[0] == 404
+    assert api("GET", "/api/fights/duel")[0] == 405
+    assert api("POST", "/api/characters", {"class": "Dragon"})[0] == 400
+    assert api("POST", "/api/fights/duel", {"attacker": {"class": "Knight"}})[0] == 400
+    assert api("POST", "/api/tower/run", {"party": [{"class": "Knight"}], "floors": 0})[0] == 400
+
+
+def test_health_and_metrics(api):
+    status, health = api("GET", "/api/health")
+    assert status == 200 and health["status"] == "ok"
+    api("POST", "/api/fights/duel", {"attacker": {"class": "Knight"}, "defender": {"class": "Knight"}})
+    status, text = api("GET", "/metrics")
+    assert status == 200 and "game_engine_fights_started_total 1" in text
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from jeuxRPG.game_engine import GameEngine
+from jeuxRPG.game_engine.loadgen import WorkloadFactory, find_saturation, parse_mix, run_load
+
+
+def test_parse_mix():
+    assert parse_mix("duel=5,team=3,tower") == {"duel": 5.0, "team": 3.0, "tower": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("raid=1")
+    with pytest.raises(ValueError):
+        parse_mix("duel=0")
+
+
+def test_factory_builds_every_workload():
+    factory = WorkloadFactory(GameEngine(), seed=1, max_rounds=50)
+    duel, team, tower = (factory.build(kind) for kind in ("duel", "team", "tower"))
+    assert len(duel.get_all_individuals()) == 2
+    assert 4 <= len(team.get_all_individuals()) <= 6
+    assert tower.priority == "tower"
+    assert any(c.__class__.__name__ == "Mob" for c in tower.defenders.fighters)
+    assert duel.max_rounds == team.max_rounds == tower.max_rounds == 50
+
+
+def test_run_load_reports_throughput_and_percentiles():
+    intervals = []
+    with GameEngine(max_concurrent=4) as engine:
+        report = asyncio.run(run_load(
+            engine, rates=[20, 40], step=0.5, interval=0.25, seed=3, max_rounds=60, report=intervals.append,
+        ))
+
+    assert len(report.stages) == 2
+    assert report.intervals == intervals and len(intervals) >= 4
+    completed = sum(s["completed"] for s in report.stages)
+    assert completed > 0
+    assert set(report.stages[0]["latency_ms"]) == {"p50", "p95", "p99", "p999", "max"}
+    assert report.engine["counters"]["fights_started_total"] >= completed
+
+
+def test_find_saturation():
+    stages = [
+        {"rate": 10, "offered_per_s": 10, "throughput_per_s": 10, "latency_ms": {"p99": 20}},
+        {"rate": 20, "offered_per_s": 20, "throughput_per_s": 19, "latency_ms": {"p99": 80}},
+        {"rate": 40, "offered_per_s": 40, "throughput_per_s": 25, "latency_ms": {"p99": 900}},
+    ]
+    assert find_saturation(stages) == 40
+    assert find_saturation(stages, slo_ms=50) == 20
+    assert find_saturation(stages[:2]) is None
@@ -188,7 +188,7 @@ class TestLevelUp:
         assert not hasattr(char, "tmp")
 
     def test_level_up_recursive_multiple_levels(self):
-        """level_up handles multiple levels recursively."""
+        """level_up handles multiple levels at once."""
         char = Character.create("Knight", "user1", "TestKnight")
         char.exp = 500  # Enough for several levels
         char.level_up()
@@ -394,3 +394,50 @@ class TestLevelUpEdgeCases:
         # They are independent
         assert char1.exp == 0
         assert char2.exp == 0
+
+
+class TestSetLevel:
+    """Tests for set_level and the cumulative level tables."""
+
+    @staticmethod
+    def _state(char):
+        stats = (char.hp, char.force, char.endurance, char.intelligence, char.sagesse, *char.energie)
+        return (
+            char.level,
+            char.exp,
+            [(type(stat).__name__, stat.value, stat.current_value) for stat in stats],
+            [(name, skill.skill, skill.current_cooldown) for name, skill in char.skills.items()],
+            char.class_table.claimed_upgrades,
+        )
+
+    @pytest.mark.parametrize("class_name", ["Knight", "Mage", "Archer", "Priest", "Necromancien"])
+    def test_set_level_matches_stepwise(self, class_name):
+        """set_level ends in the same state as levelling one level at a time."""
+        stepwise = Character.create(class_name, "user1", "Step")
+        jumped = Character.create(class_name, "user2", "Jump")
+        for char in (stepwise, jumped):
+            char.gain_exp(30)
+        for target in (3, 20, 21, 35):
+            while stepwise.level < target:
+                stepwise.gain_exp(stepwise._required_exp_for_next_level())
+            jumped.set_level(target)
+            assert self._state(jumped) == self._state(stepwise)
+
+    def test_set_level_lower_does_nothing(self):
+        """set_level never lowers a character."""
+        char = Character.create("Knight", "user1", "TestKnight")
+        char.set_level(10)
+        char.set_level(4)
+        assert char.level == 10
+        with pytest.raises(ValueError):
+            char.set_level(0)
+
+    def test_deep_levels(self):
+        """Deep levels no longer recurse once per level."""
+        char = Character.create("Knight", "user1", "TestKnight")
+        char.set_level(5000)
+        assert char.level == 5000
+        other = Character.create("Knight", "user2", "OtherKnight")
+        other.gain_exp(50 * 5000 * 4999)
+        assert (other.level, other.exp) == (5000, 0)
+        assert other.hp.value == char.hp.value
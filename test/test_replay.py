@@ -0,0 +1,175 @@
+"""
+Tests for fight recording and deterministic replay.
+"""
+
+import json
+import random
+
+import pytest
+
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class._event.confrontation.encounter.replay import (
+    FightRecorder,
+    FightReplay,
+    capture_character,
+    replay_file,
+    restore_character,
+)
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.res.team.team import Team
+from jeuxRPG.game_engine import GameEngine
+from jeuxRPG.game_engine.tower import TowerRun
+
+
+@pytest.fixture(autouse=True)
+def clear_teams():
+    Team.all_teams.clear()
+    yield
+    Team.all_teams.clear()
+
+
+def make_party(prefix: str, level_xp: int = 0):
+    party = [
+        Character.create(cls, user_id=f"{prefix}{i}", name=f"{cls} {prefix}{i}")
+        for i, cls in enumerate(["Knight", "Priest", "Necromancien"])
+    ]
+    if level_xp:
+        for member in party:
+            member.gain_exp(level_xp)
+    return party
+
+
+def make_mobs(count: int = 3):
+    tower = TowerRun(GameEngine())
+    return [tower._make_mob(floor=4 + i, idx=i, is_boss=(i == 0)) for i in range(count)]
+
+
+def run_recorded(seed: int, level_xp: int = 0, max_rounds: int = 200):
+    random.seed(seed)
+    fight = Fight(make_party("p", level_xp), make_mobs(), name="Replay", seed=seed)
+    recorder = FightRecorder(fight)
+    rounds = 0
+    while not fight.is_over() and rounds < max_rounds:
+        fight.start_round()
+        rounds += 1
+    recorder.finish()
+    return fight, recorder
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_replay_reproduces_recorded_fight(seed):
+    _, recorder = run_recorded(seed)
+    result = FightReplay.from_recorder(recorder).run()
+
+    assert result.ok, result.mismatches
+    assert result.actions == len(recorder.actions)
+
+
+def test_greedy_attacks_record_the_skill_used():
+    _, recorder = run_recorded(1)
+    attacks = [action for action in recorder.actions if action[0] == "A" and action[3]]
+    necro = recorder.fighters.index(next(c for c in recorder.fighters if c.__class__.__name__ == "Necromancien"))
+
+    assert attacks
+    # the invocations of the Necromancien attack for it: no single skill to record
+    for action in attacks:
+        if action[1] != necro:
+            assert action[4] in recorder.fighters[action[1]].skills
+
+
+def test_perform_attack_returns_the_skill_used():
+    knight = Character.create("Knight", user_id="pa1", name="A")
+    mage = Character.create("Mage", user_id="pa2", name="B")
+
+    success, _, used = knight.perform_attack(mage)
+    assert success
+    assert knight.get_skill(used).current_cooldown == knight.get_skill(used).cooldown
+
+
+def test_replay_with_levelled_fighters_and_buffs(tmp_path):
+    _, recorder = run_recorded(3, level_xp=6000)
+    path = recorder.save(tmp_path / "fight.jsonl")
+
+    result = replay_file(path)
+    assert result.ok, result.mismatches
+
+
+def test_record_file_layout(tmp_path):
+    _, recorder = run_recorded(1)
+    path = recorder.save(tmp_path / "fight.jsonl")
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    assert lines[0]["type"] == "header"
+    assert lines[0]["seed"] == 1
+    assert len(lines[0]["fighters"]) == 6
+    assert lines[-1]["type"] == "final"
+    assert all(isinstance(action, list) for action in lines[1:-1])
+
+
+def test_replay_detects_tampered_final_state():
+    _, recorder = run_recorded(2)
+    lines = json.loads(json.dumps(recorder.lines()))
+    lines[-1]["fighters"][0]["stats"]["HP"][1] += 1
+
+    result = FightReplay.from_lines(lines).run()
+    assert not result.ok
+
+
+def test_recorder_detaches_on_finish():
+    fight, recorder = run_recorded(4)
+    assert fight.recorder is None
+
+    FightRecorder(fight)
+    with pytest.raises(ValueError):
+        FightRecorder(fight)
+
+
+def test_same_seed_gives_same_action_stream():
+    _, first = run_recorded(11)
+    _, second = run_recorded(11)
+    assert first.actions == second.actions
+
+
+def test_seeded_fight_does_not_consume_global_random():
+    a = Character.create("Knight", user_id="g1", name="A")
+    b = Character.create("Mage", user_id="g2", name="B")
+    random.seed(5)
+    expected = random.random()
+
+    random.seed(5)
+    fight = Fight(a, b, seed=99)
+    fight.start_round()
+    assert random.random() == expected
+
+
+def test_restore_character_round_trip():
+    original = Character.create("Knight", user_id="rt", name="Round Trip")
+    original.gain_exp(3000)
+    original.hp.current_value = 7
+    state = capture_character(original)
+
+    restored = restore_character(json.loads(json.dumps(state)))
+    assert capture_character(restored) == state
+
+
+def test_replay_starts_with_an_active_dot():
+    from jeuxRPG._class.res.character.alteration.alteration import Dot
+
+    knight = Character.create("Knight", user_id="dot_k", name="Burnt")
+    mage = Character.create("Mage", user_id="dot_m", name="Burner")
+    knight.status["alteration"]["Damage"]["Incoming"].append(Dot("Burn", mage, value=7, time=3, target=knight))
+    fight = Fight(knight, mage, name="Dot", seed=21)
+    recorder = FightRecorder(fight)
+    while not fight.is_over():
+        fight.start_round()
+    recorder.finish()
+
+    (dot,) = [a for a in recorder.header["fighters"][0]["alterations"] if a[0] == "dot"]
+    assert dot[:6] == ["dot", "Burn", "AlterationType.DOT", 7, 3, 1]
+
+    replay = FightReplay.from_lines(json.loads(json.dumps(recorder.lines())))
+    _, fighters = replay.build_fight()
+    (restored,) = fighters[0].status.dots
+    assert isinstance(restored, Dot) and restored.caster is fighters[1] and restored.duration == 3
+    result = replay.run()
+    assert result.ok, result.mismatches
@@ -5,7 +5,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pytest
-from jeuxRPG._class.skills.skill import Skill
+from jeuxRPG._class.skills.skill import CharacterSkill, Skill
 from jeuxRPG._class.skills.skillEffect import SkillEffect
 from jeuxRPG._class.res.classType import SkillType, DamageType
 from jeuxRPG._class.res.character.stats.basic_stat import Mana, Force, Intelligence, Aura
@@ -166,3 +166,74 @@ class TestSkillRegistration:
         """Test get_skill_by_name raises ValueError if not found."""
         with pytest.raises(ValueError, match="not found"):
             Skill.get_skill_by_name("NonExistentSkill")
+
+    def test_duplicate_name_keeps_first_registered(self, test_skill):
+        """Test a second skill with the same name (any case) is not registered."""
+        twin = Skill(name="testattack", skill_type=SkillType.DAMAGE, effects={}, energie_target=Aura)
+        assert twin not in Skill.all_Skills
+        assert Skill.get_skill_by_name("TESTATTACK") is test_skill
+
+
+class TestCharacterSkill:
+    """Tests for the per-character skill state over a shared definition."""
+
+    def test_bind_shares_definition(self, test_skill):
+        """Test bound skills read the definition and keep their own cooldown."""
+        first, second = test_skill.bind(), test_skill.bind()
+        assert first.skill is second.skill is test_skill
+        assert first.name == "TestAttack" and first.energie_cost == 10
+        first.current_cooldown = 2
+        assert second.current_cooldown == 0 and test_skill.current_cooldown == 0
+        with pytest.raises(AttributeError):
+            first.cooldown = 5
+
+    def test_execute_sets_state_cooldown(self, test_skill):
+        """Test executing a bound skill only puts that state on cooldown."""
+        test_skill.cooldown = 2
+        knight = Character.create("Knight", "user_cs", "CsKnight")
+        target = Character.create("Mage", "user_cs_target", "CsMage")
+        bound = test_skill.bind()
+        assert bound.execute(knight, target)["success"] is True
+        assert bound.current_cooldown == 2 and test_skill.current_cooldown == 0
+        with pytest.raises(RuntimeError):
+            bound.execute(knight, target)
+
+    def test_characters_share_class_definitions(self):
+        """Test characters of a class hold states over the same definitions."""
+        a = Character.create("Knight", "user_cs_a", "A")
+        b = Character.create("Knight", "user_cs_b", "B")
+        assert all(isinstance(skill, CharacterSkill) for skill in a.skills.values())
+        assert a.skills["Sword Slash"] is not b.skills["Sword Slash"]
+        assert a.skills["Sword Slash"].skill is b.skills["Sword Slash"].skill
+
+    def test_copy_keeps_definition(self, test_skill):
+        """Test deep copies of a bound skill keep the shared definition."""
+        import copy
+        bound = test_skill.bind()
+        bound.current_cooldown = 1
+        clone = copy.deepcopy(bound)
+        assert clone.skill is test_skill and clone.current_cooldown == 1
+
+    def test_cooldown_counts_rests(self):
+        """Test a character's cooldowns go down with its rests only."""
+        knight = Character.create("Knight", "user_cs_rest", "RestKnight")
+        other = Character.create("Knight", "user_cs_rest_2", "OtherKnight")
+        skill = knight.skills["Sword Slash"]
+        skill.current_cooldown = 2
+        other.rest()
+        assert skill.current_cooldown == 2 and not skill.is_ready()
+        knight.rest()
+        assert skill.current_cooldown == 1
+        knight.rest()
+        knight.rest()
+        assert skill.current_cooldown == 0 and skill.is_ready()
+
+    def test_deepcopy_character_keeps_cooldowns_apart(self):
+        """Test a copied character rests its own copied skills only."""
+        import copy
+        knight = Character.create("Knight", "user_cs_copy", "CopyKnight")
+        knight.skills["Sword Slash"].current_cooldown = 2
+        clone = copy.deepcopy(knight)
+        clone.rest()
+        assert clone.skills["Sword Slash"].current_cooldown == 1
+        assert knight.skills["Sword Slash"].current_cooldown == 2
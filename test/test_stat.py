@@ -515,3 +515,145 @@ class TestAttributeStat:
         
         with pytest.raises(TypeError):
             attr.change_type(VitalStat)
+
+
+class TestStatSlots:
+    """Tests de l'empreinte mémoire des stats (__slots__, altérations paresseuses)."""
+
+    def test_stats_have_no_instance_dict(self):
+        """Test aucune stat ne porte de __dict__."""
+        for stat in (DefaultStat(1), HP(1), Mana(1), AttributeStat(1)):
+            assert not hasattr(stat, "__dict__")
+        with pytest.raises(AttributeError):
+            HP(1).anything = 1
+
+    def test_alteration_lists_allocated_on_first_use(self):
+        """Test les listes de buffs/debuffs ne sont créées qu'au premier ajout."""
+        from jeuxRPG._class.sub_character.knight import Knight
+
+        stat = DefaultStat(100)
+        assert stat.buffs == () and stat.debuffs == ()
+        assert stat._mods is None
+        stat.end_round()
+        assert stat.remove_buff(object()) is False
+
+        caster = Knight("slot", "Caster")
+        stat.add_buff(Buff("Force", caster, 5, 1, caster, DefaultStat))
+        assert stat.current_value == 105 and stat.debuffs == []
+        stat.end_round()
+        # the storage goes away with the last alteration
+        assert stat._mods is None and stat.buffs == ()
+
+    def test_change_type_between_energies_keeps_state(self):
+        """Test change_type d'une énergie vers une autre conserve ses valeurs."""
+        from jeuxRPG._class.res.character.stats.basic_stat import Ki
+
+        mana = Mana(80, 0.05)
+        mana.current_value = 30
+        mana.change_type(Ki)
+
+        assert isinstance(mana, Ki) and mana.name == "Ki"
+        assert (mana.value, mana.current_value, mana.regen_rate) == (80, 30, 0.05)
+
+    def test_copy_and_pickle(self):
+        """Test deepcopy et pickle (backend process) des stats à slots."""
+        import copy
+        import pickle
+
+        mana = Mana(50, 0.1)
+        mana.current_value = 20
+        for clone in (copy.deepcopy(mana), pickle.loads(pickle.dumps(mana))):
+            assert isinstance(clone, Mana)
+            assert (clone.value, clone.current_value, clone.regen_rate, clone.name) == (50, 20, 0.1, "Mana")
+            assert clone.buffs == ()
+
+
+class TestIncrementalModifiers:
+    """Tests des totaux incrémentaux et de l'expiration par tas."""
+
+    @staticmethod
+    def expected(stat):
+        """Recalcul naïf (ancienne implémentation)."""
+        total = stat.value
+        for buff in stat.buffs:
+            total += buff.get_value()
+        for debuff in stat.debuffs:
+            total = max(1, total - debuff.get_value())
+        return max(0, total)
+
+    def test_expired_alterations_leave_the_value(self):
+        """Test un buff expiré ne compte plus dans la valeur."""
+        from jeuxRPG._class.sub_character.knight import Knight
+
+        caster = Knight("inc", "Caster")
+        stat = DefaultStat(20)
+        buff = Buff("Rage", caster, 5, 2, caster, DefaultStat)
+        debuff = DeBuff("Poison", caster, 3, 3, caster, DefaultStat)
+        stat.add_buff(buff)
+        stat.add_debuff(debuff)
+        assert stat.current_value == 22
+
+        stat.end_round()
+        assert (buff.duration, debuff.duration, stat.current_value) == (1, 2, 22)
+        stat.end_round()
+        assert buff not in stat.buffs and buff.duration == 0 and buff.is_over()
+        assert stat.current_value == 17
+        stat.end_round()
+        assert stat.debuffs == () and stat.current_value == 20
+
+    def test_decrease_and_duration_setter_reschedule(self):
+        """Test decrease() et l'affectation de duration avancent ou repoussent l'expiration."""
+        from jeuxRPG._class.sub_character.knight import Knight
+
+        caster = Knight("inc2", "Caster")
+        stat = DefaultStat(10)
+        buff = Buff("Focus", caster, 4, 5, caster, DefaultStat)
+        stat.add_buff(buff)
+        buff.decrease()
+        buff.decrease()
+        assert buff.duration == 3
+        buff.duration = 1
+        stat.end_round()
+        assert stat.buffs == () and stat.current_value == 10
+
+    def test_random_sequence_matches_naive_recalculation(self):
+        """Test totaux incrémentaux == recalcul complet sur une séquence aléatoire."""
+        import random
+        from jeuxRPG._class.sub_character.knight import Knight
+
+        rng = random.Random(7)
+        caster = Knight("inc3", "Caster")
+        stat = DefaultStat(15)
+        for _ in range(400):
+            roll = rng.random()
+            if roll < 0.35:
+                stat.add_buff(Buff("b", caster, rng.randint(1, 9), rng.randint(1, 4), caster, DefaultStat))
+            elif roll < 0.7:
+                stat.add_debuff(DeBuff("d", caster, rng.randint(1, 9), rng.randint(1, 4), caster, DefaultStat))
+            elif roll < 0.8 and (stat.buffs or stat.debuffs):
+                alteration = rng.choice([*stat.buffs, *stat.debuffs])
+                (stat.remove_buff if alteration in stat.buffs else stat.remove_debuff)(alteration)
+            else:
+                stat.end_round()
+            assert stat.current_value == self.expected(stat)
+            assert all(a.duration > 0 for a in (*stat.buffs, *stat.debuffs))
+
+    def test_snapshot_restore_rewinds_expiry(self):
+        """Test restore() remet les altérations et leur expiration."""
+        from jeuxRPG._class.sub_character.knight import Knight
+
+        caster = Knight("inc4", "Caster")
+        stat = DefaultStat(30)
+        buff = Buff("Shield", caster, 6, 2, caster, DefaultStat)
+        stat.add_buff(buff)
+        state = stat.snapshot()
+
+        for _ in range(3):
+            stat.end_round()
+        assert stat.buffs == () and stat.current_value == 30
+
+        stat.restore(state)
+        assert list(stat.buffs) == [buff] and buff.duration == 2 and stat.current_value == 36
+        stat.end_round()
+        stat.end_round()
+        assert stat.buffs == () and stat.current_value == 30
@@ -0,0 +1,78 @@
+"""
+Tests pour le status typé des personnages (CharacterStatus).
+"""
+
+import pytest
+
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.res.character.alteration.alteration import Stun
+from jeuxRPG._class.res.character.stats.basic_stat import Force
+from jeuxRPG._class.stats.status import NO_REDUCTION, CharacterStatus
+
+
+@pytest.fixture
+def knight():
+    return Character.create("Knight", user_id="status_knight", name="Status Knight")
+
+
+class TestCharacterStatus:
+    """Tests du status compact et de sa vue dictionnaire."""
+
+    def test_fresh_character_has_no_alterations(self, knight):
+        """Aucune liste d'altération n'est allouée à la création."""
+        assert knight.status.get_alteration() is None
+        assert not knight.is_stun() and not knight.will_be_hit()
+        assert not knight.is_invulnerable() and not knight.have_reduction()
+        assert knight._get_reduction() is NO_REDUCTION
+        assert knight.clear_stuns() == 0
+        assert knight._update_status() == [("", None)]
+        assert knight.status.get_alteration() is None
+
+    def test_mapping_view(self, knight):
+        """Les accès dictionnaire existants restent valides."""
+        status = knight.status
+        assert status["stats"]["Force"] is knight.force
+        assert status["stats"]["energie"] == {e.name: e for e in knight.energie}
+        assert status.get("Death_in", 0) == -1
+        assert set(status) == {"stats", "alteration", "advantage", "Death_in"}
+
+        alterations = status["alteration"]
+        assert status.get_alteration() is alterations
+        assert set(alterations["Damage"]["Reduction"]) == {"%", "+", "-"}
+        assert alterations["Damage"].get("Incoming") is alterations.incoming
+        assert status["advantage"]["weakness"] == []
+        with pytest.raises(KeyError):
+            status["unknown"]
+
+    def test_writes_go_through_typed_fields(self, knight):
+        """Ajouts et affectations via la vue alimentent les champs typés."""
+        ok, _, stun = knight.add_stun(knight, "Bonk", 2)
+        assert ok and knight.status.stuns == [stun]
+        assert knight.status["alteration"]["stun"] == [stun]
+
+        knight.status["alteration"]["stun"] = []
+        assert not knight.is_stun()
+
+        ok, _, buff = knight.buff_stat(knight, "Rage", Force, 5, 2)
+        assert ok and knight.status.alteration.buff == [buff]
+
+    def test_status_is_not_shared(self, knight):
+        """Deux status n'ont aucune liste en commun."""
+        first, second = CharacterStatus(), CharacterStatus()
+        first.alteration.stun.append(Stun("Bonk", knight, 1, knight))
+        assert second.stuns == ()
+        assert second.alteration.stun == []
+
+    def test_copy_and_pickle_keep_timing(self, knight):
+        """Les copies gardent les stuns liés à leur propre tas."""
+        import copy
+        import pickle
+
+        knight.add_stun(knight, "Bonk", 2)
+        for clone in (copy.deepcopy(knight.status), pickle.loads(pickle.dumps(knight.status))):
+            stun = clone.stuns[0]
+            assert stun._holder is clone.get_alteration() and stun.duration == 2
+            clone.get_alteration().advance()
+            clone.get_alteration().advance()
+            assert clone.stuns == []
+        assert knight.status.stuns[0].duration == 2
@@ -210,6 +210,52 @@ class TestStunExpiration:
         assert knight.is_stun() is False
 
 
+class TestStunStacking:
+    """Tests des stuns empilés, expirés par le tas du status."""
+
+    def test_stacked_stuns_all_expire_same_round(self):
+        """Test que des stuns finissant au même tour partent tous (aucun sauté)."""
+        knight = Knight("user1", "Sir Knight")
+        mage = Mage("user2", "Gandalf")
+        stuns = [knight.add_stun(mage, f"Stun {i}", 1)[2] for i in range(5)]
+
+        messages = knight._update_status()
+
+        assert [alteration for _, alteration in messages] == stuns
+        assert knight.is_stun() is False and knight.get_stuns() == []
+
+    def test_mixed_durations(self):
+        """Test que chaque stun part au tour de sa propre fin."""
+        knight = Knight("user1", "Sir Knight")
+        mage = Mage("user2", "Gandalf")
+        long_stun = knight.add_stun(mage, "Long", 3)[2]
+        knight.add_stun(mage, "Short", 1)
+
+        knight._update_status()
+        assert knight.get_stuns() == [long_stun] and long_stun.duration == 2
+        knight._update_status()
+        assert knight.is_stun() is True
+        knight._update_status()
+        assert knight.is_stun() is False and long_stun.duration == 0
+
+    def test_snapshot_restore_brings_expired_stun_back(self):
+        """Test qu'un état restauré remet le stun avec sa durée d'alors."""
+        knight = Knight("user1", "Sir Knight")
+        mage = Mage("user2", "Gandalf")
+        stun = knight.add_stun(mage, "Stun", 2)[2]
+        state = knight.snapshot_state()
+
+        knight._update_status()
+        knight._update_status()
+        assert knight.is_stun() is False
+
+        knight.restore_state(state)
+        assert knight.get_stuns() == [stun] and stun.duration == 2
+        knight._update_status()
+        knight._update_status()
+        assert knight.is_stun() is False
+
+
 class TestStunInCombat:
     """Tests pour le stun en combat."""
     
@@ -0,0 +1,127 @@
+"""
+Tests for the tabular mob policy and its self-play trainer.
+"""
+
+import numpy as np
+import pytest
+
+from jeuxRPG._balance.selfplay import play_episodes, table_from_counts, train_policy
+from jeuxRPG._class._event.confrontation.encounter.fight import Fight
+from jeuxRPG._class._event.confrontation.encounter.replay import FightRecorder
+from jeuxRPG._class._event.confrontation.encounter.table_policy import (
+    ACTION_CLASSES,
+    STRONG_TOUGHEST,
+    SUPPORT_WEAKEST,
+    TABLE_SHAPE,
+    TablePolicy,
+    encode_state,
+    resolve_action,
+)
+from jeuxRPG._class.character import Character
+from jeuxRPG._class.res.classType import SkillType
+from jeuxRPG._class.res.team.team import Team
+from jeuxRPG.game_engine import GameEngine
+from jeuxRPG.game_engine.tower import TowerRun
+
+
+@pytest.fixture(autouse=True)
+def clear_teams():
+    Team.all_teams.clear()
+    yield
+    Team.all_teams.clear()
+
+
+def make_fight(seed: int = 1) -> Fight:
+    heroes = [Character.create(cls, user_id=f"tp{i}", name=f"{cls} {i}") for i, cls in enumerate(["Knight", "Mage"])]
+    for hero in heroes:
+        hero.gain_exp(6000)
+    tower = TowerRun(GameEngine())
+    mobs = [tower._make_mob(floor=12, idx=i) for i in range(2)]
+    return Fight(heroes, mobs, seed=seed)
+
+
+def play(fight: Fight, max_rounds: int = 80) -> FightRecorder:
+    recorder = FightRecorder(fight)
+    rounds = 0
+    while not fight.is_over() and rounds < max_rounds:
+        fight.start_round()
+        rounds += 1
+    recorder.finish()
+    return recorder
+
+
+def test_encode_state_indexes_the_table():
+    fight = make_fight()
+    table = np.zeros(TABLE_SHAPE)
+    for actor in fight.get_all_individuals():
+        state = encode_state(fight, actor)
+        assert len(state) == len(TABLE_SHAPE)
+        table[state]  # must be a valid index
+
+
+def test_resolve_action_classes():
+    fight = make_fight()
+    mob = fight.defenders.fighters[0]
+    heroes = fight.attackers.get_fighters()
+
+    action = resolve_action(fight, mob, STRONG_TOUGHEST)
+    assert mob.skills[action.skill_name].skill_type == SkillType.DAMAGE
+    assert action.target is max(heroes, key=lambda c: c.hp.current_value)
+
+    mob.hp.current_value = 1
+    action = resolve_action(fight, mob, SUPPORT_WEAKEST)
+    assert mob.skills[action.skill_name].skill_type == SkillType.HEAL
+    assert action.target is mob
+
+
+def test_greedy_table_keeps_the_greedy_fight():
+    reference = play(make_fight(4))
+    fight = make_fight(4)
+    fight.set_policy(fight.defenders, TablePolicy.greedy())
+    assert play(fight).actions == reference.actions
+
+
+def test_table_round_trip(tmp_path):
+    table = np.random.default_rng(0).integers(0, len(ACTION_CLASSES), TABLE_SHAPE)
+    path = TablePolicy(table).save(tmp_path / "policy.npy")
+
+    assert np.array_equal(TablePolicy.load(path).table, table)
+
+
+def test_table_validation():
+    with pytest.raises(ValueError):
+        TablePolicy(np.zeros((2, 2), dtype=np.int8))
+    with pytest.raises(ValueError):
+        TablePolicy(np.full(TABLE_SHAPE, len(ACTION_CLASSES), dtype=np.int8))
+
+
+def test_table_from_counts_keeps_greedy_for_rare_states():
+    sums = np.zeros(TABLE_SHAPE + (len(ACTION_CLASSES),))
+    counts = np.zeros_like(sums, dtype=np.int64)
+    sums[0, 0, 0, 0, 0, 0, 3] = 9.0
+    counts[0, 0, 0, 0, 0, 0, 3] = 10
+    sums[1, 0, 0, 0, 0, 0, 2] = 1.0
+    counts[1, 0, 0, 0, 0, 0, 2] = 1
+
+    table = table_from_counts(sums, counts, min_visits=5)
+    assert table[0, 0, 0, 0, 0, 0] == 3
+    assert table[1, 0, 0, 0, 0, 0] == 0
+
+
+def test_self_play_is_reproducible():
+    table = np.zeros(TABLE_SHAPE, dtype=np.int8)
+    first = play_episodes(table, range(5), epsilon=0.5)
+    second = play_episodes(table, range(5), epsilon=0.5)
+
+    assert first[1].sum() > 0
+    assert np.array_equal(first[0], second[0])
+    assert np.array_equal(first[1], second[1])
+
+
+def test_train_policy_and_tower_mobs():
+    policy = train_policy(episodes=10, generations=1, seed=3, min_visits=1)
+    assert policy.table.shape == TABLE_SHAPE
+
+    tower = TowerRun(GameEngine(), mob_policy=policy)
+    assert tower._make_mob(floor=3, idx=1).ai_policy is policy
+    assert not hasattr(tower._make_mob(floor=5, idx=0, is_boss=True), "ai_policy")